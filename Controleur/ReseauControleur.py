@@ -17,6 +17,7 @@ from PyQt5.QtWidgets import QMessageBox, QFileDialog
 from PyQt5 import QtCore
 
 from Moteur.Simulateur import Simulateur
+from Utilitaires.ConnecteurLimite import ConnecteurLimite
 from Utilitaires.FileManager import FileManager
 from Modele.Reseau import Reseau
 from Moteur.Generateur import Generateur
@@ -105,12 +106,17 @@ class ThreadSimulation(QtCore.QObject):
         de la simulation
         :var self.TS_finished, QtCore.pyqtSignal : Permet de notifier le contrôleur de la fin de la simulation
 
+        :cvar self.TS_FREQUENCE_RAFRAICHISSEMENT : float, nombre maximum de rafraîchissements par seconde de l'affichage
+        du réseau et de la barre de progression pendant la simulation (cf ConnecteurLimite)
+
     """
 
     # Les connecteurs
     TS_connecteur = QtCore.pyqtSignal(Signaux, dict)
     TS_finished = QtCore.pyqtSignal()
 
+    TS_FREQUENCE_RAFRAICHISSEMENT = 5
+
     def __init__(self, _reseau, _show_html):
         """
             Constructeur de la classe
@@ -121,7 +127,8 @@ class ThreadSimulation(QtCore.QObject):
         super().__init__()
         _log.Linfo("Init -- ThreadSimulation")
 
-        self.TS_simulateur = Simulateur(self.TS_connecteur)
+        # Les signaux d'avancement sont limités pour ne pas saturer le thread de l'interface
+        self.TS_simulateur = Simulateur(ConnecteurLimite(self.TS_connecteur, self.TS_FREQUENCE_RAFRAICHISSEMENT))
         self.TS_reseau = _reseau
         self.TS_show_html = _show_html
 
@@ -185,6 +192,7 @@ class ReseauControleur (QFileDialog):
         self.RC_resultat = None
 
         self.RC_file_manager = FileManager()
+        self.RC_file_manager.FMdefinirNotificateur(ReseauControleur.RCmessage)
         from Controleur.Statistiques import Statistiques
         self.RC_statistiques = Statistiques()
         self.RC_file_manager.FMchargerStatistiques()
@@ -446,7 +454,13 @@ class ReseauControleur (QFileDialog):
                 Signaux.INITIALISATION_SIMULATION => Aucun
                 Signaux.PROGRESSION_SIMULATION => avancee (int) la position de 0 à 100 où placer la barre de
                     progression ; text (String) le texte à afficher au dessus de la barre de progression
-                Signaux.FIN_SIMULATION => duree (float) le temps qu'a duré la simulation
+                Signaux.FIN_SIMULATION => duree (float) le temps qu'a duré la simulation ; verifications_evitees (int)
+                    le nombre de vérifications de fin de vie qui n'ont pas eu besoin d'être refaites
+                    ; tours_reutilises (int) le nombre de récoltes reprises d'un préfixe commun à un cycle précédent
+                    ; configurations_en_cache (int) le nombre de configurations topologiques reprises du cache
+                    ; configurations_calculees (int) le nombre de configurations topologiques absentes du cache
+                    ; signaux_abandonnes (int) le nombre de NOUVEL_ETAT et PROGRESSION_SIMULATION non transmis car
+                    remplacés par un plus récent (cf ConnecteurLimite)
 
         """
         _log.Linfo("Début ## ReseauControleur.RCactionSignalSimulateur")
@@ -487,7 +501,16 @@ class ReseauControleur (QFileDialog):
             if self.RC_barre_progression_simulation is not None:
                 # on met à 100% et on ferme la fenêtre
                 self.RC_barre_progression_simulation.BPfin()
-            self.RCmessageInformation("Simulation terminée, temps d'exécution : " + str(_datas["duree"]) + " secondes")
+            # Compteurs des optimisations de la simulation (signaux_abandonnes n'est ajouté que par ConnecteurLimite)
+            _compteurs = "Vérifications de fin de vie évitées : " + str(_datas.get("verifications_evitees", 0)) \
+                         + "\nRécoltes reprises d'un préfixe commun : " + str(_datas.get("tours_reutilises", 0)) \
+                         + "\nConfigurations reprises du cache : " + str(_datas.get("configurations_en_cache", 0)) \
+                         + "\nConfigurations absentes du cache : " + str(_datas.get("configurations_calculees", 0)) \
+                         + "\nRafraîchissements de l'affichage abandonnés : " \
+                         + str(_datas.get("signaux_abandonnes", 0))
+            _log.Linfo("Info ## " + _compteurs.replace("\n", ", "))
+            self.RCmessageInformation("Simulation terminée, temps d'exécution : " + str(_datas["duree"]) + " secondes"
+                                      + "\n\n" + _compteurs)
 
     def RCactionSignalFenetreCreation(self, _signal, _params=None):
         """
@@ -496,8 +519,8 @@ class ReseauControleur (QFileDialog):
             :param _signal : Enum Signaux, Le signal de type Signals à analyser. Liste des signaux concernés :
                 - ANNULER_PARAMETRES : L'utilisateur annule la création du réseau
                 - VALIDER_PARAMETRES : L'utilisateur demande la création du réseau
-            :param _params: ParametresCreation, l'objet contenant les paramètres saisis par l'utilisateur dans la fenêtre de
-                création
+            :param _params: ParametresCreation, l'objet contenant les paramètres saisis par l'utilisateur dans la
+                fenêtre de création
 
         """
         _log.Linfo("Début ## ReseauControleur.RCactionSignalFenetreCreation")
@@ -631,6 +654,8 @@ class ReseauControleur (QFileDialog):
             _text_erreur += "La marge doit être inférieure à la moitiée de la taille maximale\n"
         if _param.PC_nbr_capteurs < 2:
             _text_erreur += "Le nombre de capteurs doit être supérieur à 1\n"
+        if not 1 <= _param.PC_nbr_puits < _param.PC_nbr_capteurs:
+            _text_erreur += "Le nombre de passerelles doit être compris entre 1 et le nombre de capteurs - 1\n"
 
         if _text_erreur != "":
             _log.Linfo("Warning ## " + _text_erreur)
@@ -638,6 +663,20 @@ class ReseauControleur (QFileDialog):
             return False
         return True
 
+    @staticmethod
+    def RCmessage(_message, _erreur):
+        """
+            Permet d'afficher un message dans une boite de dialogue, utilisé comme notificateur par FileManager
+
+            :param _message : Le message à afficher
+            :param _erreur : bool, vrai pour une boite de dialogue type erreur, faux pour une type information
+
+        """
+        if _erreur:
+            ReseauControleur.RCmessageErreur(_message)
+        else:
+            ReseauControleur.RCmessageInformation(_message)
+
     @staticmethod
     def RCmessageErreur(_message_erreur):
         """
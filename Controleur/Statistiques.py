@@ -12,8 +12,7 @@
     - Singleton : Permet de n'avoir qu'une même implémentation possible de la classe Statistique
 """
 
-from Modele.Roles import Roles
-from Moteur.Simulateur import Simulateur
+from Moteur.AnalyseEtat import AnalyseEtat
 from Utilitaires.FileManager import FileManager
 from Utilitaires.Log import Log
 
@@ -35,6 +34,8 @@ class Singleton:
         :var self.S_cycles : int[S_nombre_etats], le numéro du cycle correspondant à l'état associé
         :var self.S_moment_insertion : int[S_nombre_etats], le moment (tps de simulation) de l'insertion des données
             pour chaque état
+        :var self.S_charge_puits : dict{int : int}[S_nombre_etats], pour chaque état, le nombre de capteurs qui
+            envoient leurs données à chaque puit (vide si l'état a été enregistré sans)
         :var self.S_resultats : dict{"duree": int, "intervalle": double}, le résultat de la simulation
 
     """
@@ -66,6 +67,7 @@ class Singleton:
             self.S_nbr_actifs = []
             self.S_cycles = []
             self.S_moment_insertion = []
+            self.S_charge_puits = []
             self.S_resultats = []
 
             self.__S_initialized = True
@@ -77,6 +79,7 @@ class Singleton:
                 - numéro de l'etat concerné avec son cycle
                 - niveau de batterie moyen
                 - ratio nombre de capteurs reliés à la passerelle
+                - nombre de capteurs reliés à chaque passerelle, si il y en a plusieurs
 
             :param _etat : Entier, le numéro de l'état à afficher
 
@@ -100,16 +103,22 @@ class Singleton:
         _text += "Informations sur l'état " + str(_etat + 1) + \
                  " (cycle " + str(self.S_cycles[_etat]) + ") de la topologie du réseau\n"
         _text += "Niveau moyen des batteries : " + str(self.S_niveau_de_batterie_moyen[_etat]) + "\n"
+        from Moteur.Simulateur import Simulateur
+        _nbr_puits = len(Simulateur.Spuits(_reseau))
+        _nbr_capteurs = _reseau.R_nbr_noeuds - _nbr_puits
         _text += "Nombre de capteurs actifs / Nombre de capteurs total : " + \
-                 str(self.S_nbr_actifs[_etat]) + " / " + str(_reseau.R_nbr_noeuds - 1) + \
-                 " (soit " + str(int(self.S_nbr_actifs[_etat] / (_reseau.R_nbr_noeuds - 1) * 100)) + \
-                 "% de capteurs reliés à la passerelle)\n"
+                 str(self.S_nbr_actifs[_etat]) + " / " + str(_nbr_capteurs) + \
+                 " (soit " + str(int(self.S_nbr_actifs[_etat] / max(1, _nbr_capteurs) * 100)) + \
+                 "% de capteurs reliés " + ("à une passerelle" if _nbr_puits > 1 else "à la passerelle") + ")\n"
+        if _nbr_puits > 1:
+            for _puit, _charge in self.S_charge_puits[_etat].items():
+                _text += "Capteurs reliés à la passerelle n°" + str(_puit) + " : " + str(_charge) + "\n"
 
         _log.Linfo("Info ## Texte généré : \n" + _text)
 
         return _text
 
-    def SajouterDonnees(self, _reseau, _cycle, _moment=0):
+    def SajouterDonnees(self, _reseau, _cycle, _moment=0, _accessibilite=None, _analyse=None):
         """
             Extrait les données suivantes du réseau :
                 - nombre de noeuds connectés à la passerelle
@@ -118,28 +127,20 @@ class Singleton:
         :param _reseau: Réseau, le réseau depuis lequel extraire les données
         :param _cycle : int, le numéro du cycle associé à l'état du réseau
         :param _moment : int, le moment (tps de simulation) associé à l'état du réseau
+        :param _accessibilite : Accessibilite, les noeuds reliés au puit si elle a déjà été calculée pour cet état,
+            None sinon
+        :param _analyse : AnalyseEtat, les mesures de cet état si elles ont déjà été calculées, None sinon
         """
         _log.Linfo("Début ## Statistiques.Singleton.SajouterDonnees")
 
-        # Récupération du nombre de capteurs connectés à la passerelle
-        if len(self.S_cycles) == 0 or max(self.S_cycles) == 0:
-            _intervalle = 0
-        else:
-            _intervalle = 1
-        _, _noeuds_deconnectes = Simulateur.SfinDeVieAtteinte(_reseau, _intervalle)
-        _nbr_noeuds_deconnectes = len(_noeuds_deconnectes)
-        _nbr_actifs = _reseau.R_nbr_noeuds - _nbr_noeuds_deconnectes - 1  # Moins le puit
-
-        # Récupération du niveau de batterie moyen
-        _somme_batterie = 0
-        for _noeud in _reseau.R_graphe.nodes():
-            if _reseau.R_graphe.nodes()[_noeud]["role"] != Roles.PUIT:
-                _somme_batterie += _reseau.R_graphe.nodes()[_noeud]["batterie"]
-        _niveau_batterie_moyen = int(_somme_batterie / (_reseau.R_nbr_noeuds - 1))
+        # Récupération du nombre de capteurs connectés à la passerelle et du niveau de batterie moyen
+        if _analyse is None:
+            _analyse = AnalyseEtat(_reseau, _accessibilite)
 
-        self.SajouterDonneesBrutes(_niveau_batterie_moyen, _nbr_actifs, _cycle, _moment)
+        self.SajouterDonneesBrutes(_analyse.AE_niveau_batterie_moyen, _analyse.AE_nbr_actifs, _cycle, _moment,
+                                   _analyse.AE_charge_puits)
 
-    def SajouterDonneesBrutes(self, _niveau_de_batterie_moyen, _nbr_actifs, _cycle, _moment=0):
+    def SajouterDonneesBrutes(self, _niveau_de_batterie_moyen, _nbr_actifs, _cycle, _moment=0, _charge_puits=None):
         """
             Stocke les données passées en paramètre en tant que nouvel état
 
@@ -147,6 +148,8 @@ class Singleton:
         :param _nbr_actifs : int, nombre de noeuds connectés à la passerelle
         :param _cycle : int, le numéro du cycle associé à l'état du réseau
         :param _moment : int, le moment (tps de simulation) associé à l'état du réseau
+        :param _charge_puits : dict{int : int}, le nombre de capteurs qui envoient leurs données à chaque puit, None si
+            inconnu
         """
         _log.Linfo("Début ## Statistiques.Singleton.SajouterDonneesBrutes")
 
@@ -154,6 +157,7 @@ class Singleton:
         self.S_nbr_actifs.append(_nbr_actifs)
         self.S_cycles.append(_cycle)
         self.S_moment_insertion.append(_moment)
+        self.S_charge_puits.append(dict(_charge_puits) if _charge_puits is not None else dict())
         self.S_nombre_etats += 1
 
     def SviderEtats(self, _garder_etat_initial):
@@ -171,6 +175,7 @@ class Singleton:
             self.S_nbr_actifs = [self.S_nbr_actifs[0]]
             self.S_cycles = [self.S_cycles[0]]
             self.S_moment_insertion = [self.S_moment_insertion[0]]
+            self.S_charge_puits = [self.S_charge_puits[0]]
         # Cas où on efface tout
         else:
             self.S_nombre_etats = 0
@@ -178,6 +183,7 @@ class Singleton:
             self.S_nbr_actifs = []
             self.S_cycles = []
             self.S_moment_insertion = []
+            self.S_charge_puits = []
 
         # Dans tout les cas on supprime les résultats de la simulation
         self.S_resultats = []
@@ -193,6 +199,40 @@ class Singleton:
 
         self.S_resultats.append(dict({"intervalle": _intervalle, "duree": _duree_de_vie}))
 
+    def SextraireDonnees(self, _debut_etats=0, _debut_resultats=0):
+        """
+            Copie les données stockées à partir d'un état et d'un résultat, utilisé par le journal de la simulation pour
+            n'enregistrer que les données ajoutées depuis le point de contrôle précédent
+
+        :param _debut_etats: int, le numéro du premier état à copier
+        :param _debut_resultats: int, le numéro du premier résultat à copier
+        :return: dict{String : list}, les données copiées, à passer à SajouterExtrait
+        """
+        return dict({"niveau_de_batterie_moyen": self.S_niveau_de_batterie_moyen[_debut_etats:],
+                     "nbr_actifs": self.S_nbr_actifs[_debut_etats:],
+                     "cycles": self.S_cycles[_debut_etats:],
+                     "moment_insertion": self.S_moment_insertion[_debut_etats:],
+                     "charge_puits": [dict(_charge) for _charge in self.S_charge_puits[_debut_etats:]],
+                     "resultats": [dict(_resultat) for _resultat in self.S_resultats[_debut_resultats:]]})
+
+    def SajouterExtrait(self, _extrait):
+        """
+            Ajoute à la suite des données stockées des données copiées par SextraireDonnees
+
+        :param _extrait: dict{String : list}, les données à ajouter
+        """
+        _log.Linfo("Début ## Statistiques.Singleton.SajouterExtrait")
+
+        self.S_niveau_de_batterie_moyen.extend(_extrait["niveau_de_batterie_moyen"])
+        self.S_nbr_actifs.extend(_extrait["nbr_actifs"])
+        self.S_cycles.extend(_extrait["cycles"])
+        self.S_moment_insertion.extend(_extrait["moment_insertion"])
+        # Les journaux écrits avant l'ajout de la charge des puits ne la contiennent pas
+        self.S_charge_puits.extend(dict(_charge) for _charge in
+                                   _extrait.get("charge_puits", [dict()] * len(_extrait["cycles"])))
+        self.S_nombre_etats += len(_extrait["cycles"])
+        self.S_resultats.extend(dict(_resultat) for _resultat in _extrait["resultats"])
+
     def SgenererDonneesGraphiques(self):
         """
             Permet d'exporter les données dans un format exploitable par un affichage matplotlib
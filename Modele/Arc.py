@@ -17,7 +17,8 @@ class Arc:
 
         :var self.A_noeud1 : int, le premier noeud du graphe
         :var self.A_noeud2 : int, le second noeud du graphe
-        :var self.A_dominant : Enum Roles, _ARC_DOMINANT si l'arc appartient à l'ensemble dominant _ARC_NON_DOMINANT sinon
+        :var self.A_dominant : Enum Roles, _ARC_DOMINANT si l'arc appartient à l'ensemble dominant _ARC_NON_DOMINANT
+            sinon
     """
 
     def __init__(self, _noeud1, _noeud2, _dominant):
@@ -26,7 +27,8 @@ class Arc:
 
             :param _noeud1 : int, le premier noeud du graphe
             :param _noeud2 : int, le second noeud du graphe
-            :param _dominant : Enum Roles, _ARC_DOMINANT si l'arc appartient à l'ensemble dominant _ARC_NON_DOMINANT sinon
+            :param _dominant : Enum Roles, _ARC_DOMINANT si l'arc appartient à l'ensemble dominant _ARC_NON_DOMINANT
+                sinon
 
         """
         self.A_noeud1 = _noeud1
@@ -23,8 +23,14 @@ class Reseau:
         :var self.R_graphe : Graphe NetworkX, le graphe modélisant le réseau
         :var self.R_ensemble_dominant : Graphe Networkx, l'ensemble dominant du graphe R_graphe
         :var self.R_capacite_batterie_max : int, la capacité maximale des batteries des capteurs.
+
+        :cvar self.R_ATTRIBUTS_NOEUDS : (String), les attributs des noeuds modifiés au cours d'une simulation
+        :cvar self.R_ATTRIBUTS_ARCS : (String), les attributs des arcs modifiés au cours d'une simulation
     """
 
+    R_ATTRIBUTS_NOEUDS = ("batterie", "role", "route")
+    R_ATTRIBUTS_ARCS = ("dominant",)
+
     def __init__(self, _nbr_noeuds=0, _graphe=None):
         """
             Constructeur de la classe
@@ -53,3 +59,58 @@ class Reseau:
             if _noeud not in self.R_ensemble_dominant:
                 _feuilles.append(_noeud)
         return _feuilles
+
+    def RcaptureEtat(self):
+        """
+        Capture les parties du réseau modifiées au cours d'une simulation : niveaux de batterie, rôles et routage des
+        noeuds, appartenance des arcs à l'ensemble dominant et ensemble dominant. La topologie (noeuds, arcs,
+        positions) n'est pas copiée.
+
+        :return dict{String : Objet} : l'état du réseau, à passer à RrestaurerEtat
+        """
+        _log.Linfo("Début ## Reseau.RcaptureEtat")
+
+        _noeuds = [(_noeud, {_cle: _donnees[_cle] for _cle in Reseau.R_ATTRIBUTS_NOEUDS if _cle in _donnees})
+                   for _noeud, _donnees in self.R_graphe.nodes(data=True)]
+        _arcs = [(_n1, _n2, {_cle: _donnees[_cle] for _cle in Reseau.R_ATTRIBUTS_ARCS if _cle in _donnees})
+                 for _n1, _n2, _donnees in self.R_graphe.edges(data=True)]
+
+        return dict({"noeuds": _noeuds, "arcs": _arcs, "ensemble_dominant": self.R_ensemble_dominant})
+
+    def RrestaurerEtat(self, _etat):
+        """
+        Restaure, sur place, un état capturé par RcaptureEtat. Les attributs absents lors de la capture sont
+        supprimés.
+
+        :param _etat : dict{String : Objet}, l'état retourné par RcaptureEtat sur ce même réseau
+        """
+        _log.Linfo("Début ## Reseau.RrestaurerEtat")
+
+        if type(_etat) is not dict or "noeuds" not in _etat or "arcs" not in _etat:
+            _log.Lerror("Valeur Argument errone _etat")
+            raise Exception("Valeur Argument errone _etat")
+
+        _graphe_noeuds = self.R_graphe.nodes
+        for _noeud, _valeurs in _etat["noeuds"]:
+            Reseau.__RrestaurerAttributs(_graphe_noeuds[_noeud], _valeurs, Reseau.R_ATTRIBUTS_NOEUDS)
+
+        _graphe_adjacence = self.R_graphe.adj
+        for _n1, _n2, _valeurs in _etat["arcs"]:
+            Reseau.__RrestaurerAttributs(_graphe_adjacence[_n1][_n2], _valeurs, Reseau.R_ATTRIBUTS_ARCS)
+
+        self.R_ensemble_dominant = _etat["ensemble_dominant"]
+
+    @staticmethod
+    def __RrestaurerAttributs(_donnees, _valeurs, _cles):
+        """
+        Remplace les attributs _cles d'un noeud ou d'un arc par les valeurs sauvegardées
+
+        :param _donnees : dict, le dictionnaire d'attributs du noeud ou de l'arc
+        :param _valeurs : dict, les valeurs sauvegardées
+        :param _cles : (String), les attributs concernés
+        """
+        for _cle in _cles:
+            if _cle in _valeurs:
+                _donnees[_cle] = _valeurs[_cle]
+            else:
+                _donnees.pop(_cle, None)
@@ -0,0 +1,76 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module Accessibilite
+
+    Module contenant la classe qui détermine les noeuds d'un graphe reliés à un puit : Accessibilite
+
+"""
+
+from collections import deque
+
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class Accessibilite:
+    """
+        class Accessibilite
+
+        Détermine, par un unique parcours en largeur depuis le ou les puits, l'ensemble des noeuds d'un graphe qui
+        possèdent un chemin vers un puit. Le parcours est en O(n + m), l'objet peut ensuite être interrogé autant de
+        fois que nécessaire en temps constant.
+
+        :var self.A_puits : int[], les puits depuis lesquels le parcours est effectué
+        :var self.A_noeuds_vides : set(int), les capteurs qui n'ont plus d'énergie (exclus du parcours)
+        :var self.A_atteignables : set(int), les noeuds reliés à un puit
+    """
+
+    def __init__(self, _graphe, _puits, _noeuds_vides=()):
+        """
+            Constructeur de la classe, effectue le parcours en largeur
+
+            :param _graphe: Graphe NetworkX, le graphe à parcourir
+            :param _puits: int[], les puits depuis lesquels effectuer le parcours
+            :param _noeuds_vides: int[], les capteurs sans énergie, qui ne peuvent pas relayer de données
+        """
+        _log.Linfo("Init -- Accessibilite")
+
+        self.A_puits = list(_puits)
+        self.A_noeuds_vides = set(_noeuds_vides)
+        self.A_atteignables = set()
+
+        _adjacence = _graphe.adj
+        _file = deque()
+        for _puit in self.A_puits:
+            if _puit in _adjacence and _puit not in self.A_atteignables:
+                self.A_atteignables.add(_puit)
+                _file.append(_puit)
+
+        while _file:
+            _noeud = _file.popleft()
+            for _voisin in _adjacence[_noeud]:
+                if _voisin not in self.A_atteignables and _voisin not in self.A_noeuds_vides:
+                    self.A_atteignables.add(_voisin)
+                    _file.append(_voisin)
+
+    def Aaccessible(self, _noeud):
+        """
+            Permet de savoir si un noeud est relié à un puit
+
+            :param _noeud: int, le numéro du noeud
+            :return: bool, vrai si le noeud possède un chemin vers un puit
+        """
+        return _noeud in self.A_atteignables
+
+    def AnoeudsInaccessibles(self, _noeuds):
+        """
+            Permet de filtrer les noeuds qui ne sont pas reliés à un puit
+
+            :param _noeuds: int[], les noeuds à tester
+            :return: int[], les noeuds sans chemin vers un puit, dans l'ordre donné
+        """
+        return [_noeud for _noeud in _noeuds if _noeud not in self.A_atteignables]
@@ -0,0 +1,75 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module AnalyseEtat
+
+    Module contenant la classe qui regroupe les mesures d'un état du réseau, partagées par tous ceux qui enregistrent
+    cet état : AnalyseEtat
+
+"""
+
+from Modele.Roles import Roles
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class AnalyseEtat:
+    """
+        class AnalyseEtat
+
+        Lorsqu'un état du réseau est enregistré, Statistiques.SajouterDonnees et Generateur.GgenerationHTML ont
+        besoin des mêmes informations : les noeuds déconnectés des puits (Simulateur.SfinDeVieAtteinte), le nombre de
+        capteurs actifs, le niveau de batterie moyen, la charge de chaque puit et les arcs de l'ensemble dominant.
+        Elles sont calculées une seule fois, à la création de l'analyse, puis transmises à chacun.
+
+        Comme dans les Statistiques, les chaînes de routage ne sont vérifiées que si aucun état d'un cycle autre que le
+        cycle 0 n'a encore été enregistré.
+
+        :var self.AE_deconnectes : int[], les noeuds déconnectés du puit, cf Simulateur.SfinDeVieAtteinte
+        :var self.AE_ensemble_deconnectes : set(int), les mêmes noeuds, pour des tests d'appartenance
+        :var self.AE_nbr_actifs : int, le nombre de capteurs reliés à un puit (puits non compris)
+        :var self.AE_niveau_batterie_moyen : int, le niveau de batterie moyen des capteurs (puits non compris)
+        :var self.AE_charge_puits : dict{int : int}, pour chaque puit, le nombre de capteurs qui lui envoient leurs
+            données, cf Simulateur.SchargePuits
+        :var self.AE_arcs_dominants : (int, int)[], les arcs du graphe qui appartiennent à l'ensemble dominant, dans
+            l'ordre du graphe
+    """
+
+    def __init__(self, _reseau, _accessibilite=None):
+        """
+            Constructeur de la classe, analyse l'état courant du réseau
+
+            :param _reseau: Reseau, le réseau à analyser
+            :param _accessibilite: Accessibilite, les noeuds reliés au puit si elle a déjà été calculée pour cet état,
+                None sinon
+        """
+        _log.Linfo("Init -- AnalyseEtat")
+
+        from Controleur.Statistiques import Statistiques
+        from Moteur.Simulateur import Simulateur
+
+        _cycles = Statistiques().S_cycles
+        if len(_cycles) == 0 or max(_cycles) == 0:
+            _intervalle = 0
+        else:
+            _intervalle = 1
+        _, self.AE_deconnectes = Simulateur.SfinDeVieAtteinte(_reseau, _intervalle, _accessibilite)
+        self.AE_ensemble_deconnectes = set(self.AE_deconnectes)
+        self.AE_charge_puits = Simulateur.SchargePuits(_reseau)
+        _nbr_capteurs = _reseau.R_nbr_noeuds - len(self.AE_charge_puits)  # Moins les puits
+        self.AE_nbr_actifs = _nbr_capteurs - len(self.AE_deconnectes)
+
+        _somme_batterie = 0
+        for _, _donnees in _reseau.R_graphe.nodes(data=True):
+            if _donnees["role"] != Roles.PUIT:
+                _somme_batterie += _donnees["batterie"]
+        # Un réseau qui ne contient que des puits n'a pas de niveau de batterie moyen
+        self.AE_niveau_batterie_moyen = int(_somme_batterie / _nbr_capteurs) if _nbr_capteurs > 0 else 0
+
+        self.AE_arcs_dominants = []
+        if _reseau.R_ensemble_dominant is not None:
+            _arcs_ensemble_dominant = _reseau.R_ensemble_dominant.edges
+            self.AE_arcs_dominants = [_arc for _arc in _reseau.R_graphe.edges() if _arc in _arcs_ensemble_dominant]
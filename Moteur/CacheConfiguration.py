@@ -0,0 +1,127 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module CacheConfiguration
+
+    Module contenant la classe utilisée pour conserver les résultats de la configuration topologique d'un réseau :
+    CacheConfiguration
+
+"""
+
+from collections import OrderedDict
+
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class CacheConfiguration:
+    """
+        class CacheConfiguration
+
+        La configuration topologique (Simulateur.SconfigurationTopologique) ne dépend que de la topologie du graphe et
+        du niveau de batterie des capteurs. Elle est pourtant recalculée pour des entrées identiques, par exemple au
+        début de chaque cycle, sur le même réseau initial, puis au changement de rôle de l'instant 0.
+        Le cache associe à une clé (empreinte de la topologie, niveaux de batterie quantifiés) le résultat de la
+        configuration : rôle et routage de chaque noeud, appartenance de chaque arc à l'arbre dominant et arbre
+        dominant. Il est borné : au-delà de CC_capacite entrées, la moins récemment utilisée est retirée.
+
+        Avec un pas de quantification nul, les niveaux de batterie sont comparés exactement et une configuration
+        reprise du cache est identique à celle qui aurait été calculée. Avec un pas non nul, deux réseaux dont les
+        batteries tombent dans les mêmes tranches partagent la même configuration (les capteurs vides restent
+        toujours distingués des autres) : les compteurs CC_succes et CC_echecs permettent de régler ce pas.
+
+        :var self.CC_capacite : int, le nombre maximum d'entrées
+        :var self.CC_pas_batterie : float, la largeur des tranches de niveau de batterie, 0 pour des niveaux exacts
+        :var self.CC_entrees : OrderedDict{tuple : dict{String : Objet}}, les configurations, de la moins à la plus
+            récemment utilisée
+        :var self.CC_succes : int, le nombre de configurations reprises du cache
+        :var self.CC_echecs : int, le nombre de configurations absentes du cache
+    """
+
+    def __init__(self, _capacite, _pas_batterie=0):
+        """
+            Constructeur de la classe
+
+            :param _capacite: int, le nombre maximum d'entrées
+            :param _pas_batterie: float, la largeur des tranches de niveau de batterie, 0 pour des niveaux exacts
+        """
+        _log.Linfo("Init -- CacheConfiguration")
+
+        if type(_capacite) is not int or _capacite < 1:
+            _log.Lerror("Valeur Argument errone _capacite")
+            raise Exception("Valeur Argument errone _capacite")
+        if type(_pas_batterie) not in (int, float) or _pas_batterie < 0:
+            _log.Lerror("Valeur Argument errone _pas_batterie")
+            raise Exception("Valeur Argument errone _pas_batterie")
+
+        self.CC_capacite = _capacite
+        self.CC_pas_batterie = _pas_batterie
+        self.CC_entrees = OrderedDict()
+        self.CC_succes = 0
+        self.CC_echecs = 0
+        # Empreinte de la topologie du dernier graphe rencontré, la topologie ne change pas pendant une simulation
+        self.__CC_graphe = None
+        self.__CC_empreinte = None
+
+    def CCcle(self, _reseau):
+        """
+            :param _reseau: Reseau, le réseau à configurer
+            :return: tuple, la clé de la configuration du réseau : empreinte de la topologie et niveaux de batterie
+                quantifiés, dans l'ordre des noeuds du graphe
+        """
+        _graphe = _reseau.R_graphe
+        if self.__CC_graphe is not _graphe:
+            self.__CC_graphe = _graphe
+            self.__CC_empreinte = hash((tuple(_graphe.nodes()), tuple(_graphe.edges())))
+
+        if self.CC_pas_batterie == 0:
+            _batteries = tuple(_donnees['batterie'] for _, _donnees in _graphe.nodes(data=True))
+        else:
+            _batteries = tuple(0 if _donnees['batterie'] <= 0 else int(_donnees['batterie'] // self.CC_pas_batterie) + 1
+                               for _, _donnees in _graphe.nodes(data=True))
+        return self.__CC_empreinte, _batteries
+
+    def CCappliquer(self, _cle, _reseau):
+        """
+            Applique au réseau la configuration associée à une clé, si elle est dans le cache
+
+            :param _cle: tuple, la clé de la configuration (cf CCcle)
+            :param _reseau: Reseau, le réseau à configurer, modifié sur place
+            :return: bool, vrai si la configuration était dans le cache
+        """
+        _entree = self.CC_entrees.get(_cle)
+        if _entree is None:
+            self.CC_echecs += 1
+            return False
+
+        self.CC_succes += 1
+        self.CC_entrees.move_to_end(_cle)
+
+        for (_, _donnees), _role, _route in zip(_reseau.R_graphe.nodes(data=True), _entree["roles"],
+                                                _entree["routes"]):
+            _donnees['role'] = _role
+            _donnees['route'] = _route
+        for (_, _, _donnees), _dominant in zip(_reseau.R_graphe.edges(data=True), _entree["arcs"]):
+            _donnees['dominant'] = _dominant
+        # L'arbre est copié : les états capturés pendant la simulation en gardent une référence
+        _reseau.R_ensemble_dominant = _entree["ensemble_dominant"].copy()
+        return True
+
+    def CCajouter(self, _cle, _reseau):
+        """
+            Ajoute au cache la configuration d'un réseau qui vient d'être configuré
+
+            :param _cle: tuple, la clé de la configuration, calculée avant la configuration (cf CCcle)
+            :param _reseau: Reseau, le réseau configuré
+        """
+        _graphe = _reseau.R_graphe
+        self.CC_entrees[_cle] = dict({"roles": [_donnees['role'] for _, _donnees in _graphe.nodes(data=True)],
+                                      "routes": [_donnees['route'] for _, _donnees in _graphe.nodes(data=True)],
+                                      "arcs": [_donnees['dominant'] for _, _, _donnees in _graphe.edges(data=True)],
+                                      "ensemble_dominant": _reseau.R_ensemble_dominant.copy()})
+        self.CC_entrees.move_to_end(_cle)
+        while len(self.CC_entrees) > self.CC_capacite:
+            self.CC_entrees.popitem(last=False)
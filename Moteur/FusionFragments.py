@@ -0,0 +1,354 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module FusionFragments
+
+    Module contenant la classe utilisée pour rendre connexe l'ensemble dominant d'un graphe : FusionFragments
+
+"""
+
+import math
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.generic import shortest_path
+
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class FusionFragments:
+    """
+        class FusionFragments
+
+        Relie entre eux les fragments (composantes connexes) d'un ensemble dominant en suivant le même algorithme que
+        Simulateur.SdeterminationEnsembleDominant : on prend le premier fragment, on cherche le fragment dont le centre
+        de gravité est le plus proche, puis on ajoute à l'ensemble dominant le plus court chemin entre les deux noeuds
+        les plus proches de ces fragments.
+
+        Plutôt que de reconstruire le multigraphe et ses sous-graphes après chaque fusion, les fragments sont suivis
+        dans une structure union-find qui conserve pour chaque fragment la somme des positions de ses noeuds (centre de
+        gravité incrémental). La paire de noeuds la plus proche est trouvée grâce à une grille spatiale plutôt qu'en
+        comparant tous les couples. Le multigraphe n'est construit qu'une fois, à la fin, à partir des mêmes listes de
+        noeuds et d'arcs que l'algorithme d'origine : l'arbre couvrant obtenu est donc le même, aux égalités de
+        distances flottantes près.
+
+        :var self.FF_graphe : Graphe NetworkX, le graphe du réseau (sans les capteurs vides)
+        :var self.FF_noeuds_dominants : dict{int : dict}, les noeuds de l'ensemble dominant dans leur ordre d'ajout,
+            associés à leurs attributs
+        :var self.FF_arcs_dominants : (int, int)[], les arcs de l'ensemble dominant dans leur ordre d'ajout
+        :var self.FF_rang : dict{int : int}, la position de chaque noeud dominant dans l'ordre d'ajout
+        :var self.FF_parent : dict{int : int}, le parent de chaque noeud dominant dans la structure union-find
+        :var self.FF_fragments : dict{int : dict}, les informations de chaque fragment, indexées par sa racine :
+            membres, somme des abscisses et des ordonnées, plus petit rang
+
+        :cvar self.FF_SEUIL_FORCE_BRUTE : int, nombre de couples en dessous duquel la paire la plus proche est cherchée
+            en comparant tous les couples
+    """
+
+    FF_SEUIL_FORCE_BRUTE = 256
+
+    def __init__(self, _graphe, _ensemble_dominant):
+        """
+            Constructeur de la classe, regroupe les noeuds dominants en fragments
+
+            :param _graphe: Graphe NetworkX, le graphe du réseau (sans les capteurs vides)
+            :param _ensemble_dominant: int[], les noeuds de l'ensemble dominant
+        """
+        _log.Linfo("Init -- FusionFragments")
+
+        self.FF_graphe = _graphe
+        self.FF_noeuds_dominants = {}
+        self.FF_arcs_dominants = []
+        self.FF_rang = {}
+        self.FF_parent = {}
+        self.FF_fragments = {}
+        self.__FF_ordre_arcs = None
+
+        for _noeud in _ensemble_dominant:
+            self.__FFajouterNoeud(_noeud)
+
+        for _arc in _graphe.edges():
+            if _arc[0] in self.FF_noeuds_dominants and _arc[1] in self.FF_noeuds_dominants:
+                self.FF_arcs_dominants.append(_arc)
+                self.__FFunion(_arc[0], _arc[1])
+
+    def FFrelierFragments(self):
+        """
+            Relie les fragments de l'ensemble dominant tant qu'il en reste plusieurs. Si deux fragments ne peuvent pas
+            être reliés, ils sont ignorés jusqu'à la prochaine fusion réussie.
+
+            :return: Graphe NetworkX, le multigraphe de l'ensemble dominant, avec la position de chaque noeud
+        """
+        _log.Linfo("Début ## FusionFragments.FFrelierFragments")
+
+        _fragments = self.FFfragments()
+
+        while len(_fragments) > 1:
+            # On prend le premier fragment et le fragment dont le centre de gravité est le plus proche du sien
+            _fragment1 = _fragments.pop(0)
+            _g_x, _g_y = self.FFcentreGravite(_fragment1)
+
+            _distance_min = 0
+            _fragment_plus_proche = _fragments[0]
+            for _fragment in _fragments:
+                _x, _y = self.FFcentreGravite(_fragment)
+                _distance = math.sqrt(math.pow(_g_x - _x, 2) + math.pow(_g_y - _y, 2))
+                if _distance_min == 0 or _distance < _distance_min:
+                    _distance_min = _distance
+                    _fragment_plus_proche = _fragment
+
+            _paire_la_plus_proche = self.FFpairePlusProche(_fragment1, _fragment_plus_proche)
+
+            try:
+                _plus_court_chemin = shortest_path(self.FF_graphe,
+                                                   _paire_la_plus_proche[0], _paire_la_plus_proche[1],
+                                                   weight='poids_dominant')
+            except:
+                # Il n'est plus possible de relier les deux noeuds : on abandonne le fragment qu'on essayait
+                # d'incorporer et on passe au tour de boucle suivant
+                _fragments.remove(_fragment_plus_proche)
+                continue
+
+            self.__FFajouterChemin(_plus_court_chemin)
+            _fragments = self.FFfragments()
+
+        return self.FFmultigraphe()
+
+    def FFfragments(self):
+        """
+            Liste les fragments dans l'ordre où NetworkX énumère les composantes connexes du multigraphe, cad selon le
+            premier de leurs noeuds dans l'ordre d'ajout
+
+            :return: int[], les racines des fragments
+        """
+        return sorted(self.FF_fragments, key=lambda _racine: self.FF_fragments[_racine]["rang"])
+
+    def FFcentreGravite(self, _racine):
+        """
+            Calcule le centre de gravité d'un fragment
+
+            :param _racine: int, la racine du fragment
+            :return: (double, double), les coordonnées du centre de gravité
+        """
+        _fragment = self.FF_fragments[_racine]
+        return _fragment["x"] / len(_fragment["membres"]), _fragment["y"] / len(_fragment["membres"])
+
+    def FFpairePlusProche(self, _racine1, _racine2):
+        """
+            Cherche les deux noeuds les plus proches entre deux fragments. Les noeuds du second fragment sont rangés
+            dans une grille dont les cases contiennent en moyenne un noeud, puis pour chaque noeud du premier fragment
+            on parcourt les cases par anneaux de plus en plus éloignés, tant qu'elles peuvent contenir un noeud plus
+            proche que la meilleure paire déjà trouvée.
+
+            :param _racine1: int, la racine du premier fragment
+            :param _racine2: int, la racine du second fragment
+            :return: (int, int), le noeud du premier fragment et le noeud du second fragment les plus proches
+        """
+        _membres1 = self.FF_fragments[_racine1]["membres"]
+        _membres2 = self.FF_fragments[_racine2]["membres"]
+        _noeuds = self.FF_graphe.nodes
+
+        if len(_membres1) * len(_membres2) <= self.FF_SEUIL_FORCE_BRUTE:
+            _paire_la_plus_proche = None
+            _distance_min = 0
+            for _noeud1 in _membres1:
+                for _noeud2 in _membres2:
+                    _distance = FusionFragments.FFdistance(_noeuds[_noeud1]['pos'], _noeuds[_noeud2]['pos'])
+                    if _paire_la_plus_proche is None or _distance < _distance_min:
+                        _distance_min = _distance
+                        _paire_la_plus_proche = (_noeud1, _noeud2)
+            return _paire_la_plus_proche
+
+        # Construction de la grille sur le second fragment
+        _positions = [_noeuds[_noeud]['pos'] for _noeud in _membres2]
+        _min_x = min(_pos[0] for _pos in _positions)
+        _min_y = min(_pos[1] for _pos in _positions)
+        _etendue = max(max(_pos[0] for _pos in _positions) - _min_x, max(_pos[1] for _pos in _positions) - _min_y)
+        _cote = _etendue / math.sqrt(len(_positions)) if _etendue > 0 else 1.0
+
+        _grille = {}
+        for _index, _pos in enumerate(_positions):
+            _case = (math.floor((_pos[0] - _min_x) / _cote), math.floor((_pos[1] - _min_y) / _cote))
+            _grille.setdefault(_case, []).append(_index)
+        _cases_max = math.ceil(_etendue / _cote) + 1
+
+        _paire_la_plus_proche = None
+        _distance_min = 0
+        for _noeud1 in _membres1:
+            _pos1 = _noeuds[_noeud1]['pos']
+            _c_x = math.floor((_pos1[0] - _min_x) / _cote)
+            _c_y = math.floor((_pos1[1] - _min_y) / _cote)
+            # Distance (en nombre de cases) entre le noeud et la grille, pour savoir à partir de quel anneau chercher
+            _decalage = max(0, -_c_x, _c_x - _cases_max, -_c_y, _c_y - _cases_max)
+
+            _anneau = _decalage
+            while _anneau <= _decalage + _cases_max:
+                # Tous les noeuds des anneaux suivants sont au moins à cette distance
+                if _paire_la_plus_proche is not None and (_anneau - 1) * _cote >= _distance_min:
+                    break
+                for _case in FusionFragments.__FFanneau(_c_x, _c_y, _anneau):
+                    for _index in _grille.get(_case, ()):
+                        _distance = FusionFragments.FFdistance(_pos1, _positions[_index])
+                        if _paire_la_plus_proche is None or _distance < _distance_min \
+                                or (_distance == _distance_min and _paire_la_plus_proche[0] == _noeud1
+                                    and _index < _paire_la_plus_proche[2]):
+                            _distance_min = _distance
+                            _paire_la_plus_proche = (_noeud1, _membres2[_index], _index)
+                _anneau += 1
+
+        return _paire_la_plus_proche[0], _paire_la_plus_proche[1]
+
+    def FFmultigraphe(self):
+        """
+            Construit le multigraphe de l'ensemble dominant à partir des noeuds et arcs ajoutés
+
+            :return: Graphe NetworkX, le multigraphe, avec la position de chaque noeud
+        """
+        _multigraphe = nx.Graph()
+        _multigraphe.add_nodes_from(self.FF_noeuds_dominants)
+        # Les arcs gardent leur poids (cf Simulateur.SactualisationPoids) pour le calcul de l'arbre couvrant
+        _arcs_graphe = self.FF_graphe.edges
+        _multigraphe.add_edges_from((_n1, _n2, {'poids_dominant': _arcs_graphe[_n1, _n2]['poids_dominant']})
+                                    if 'poids_dominant' in _arcs_graphe[_n1, _n2] else (_n1, _n2)
+                                    for _n1, _n2 in self.FF_arcs_dominants)
+
+        _pos = {}
+        for _n in _multigraphe.nodes():
+            _pos[_n] = self.FF_graphe.node[_n]['pos']
+        nx.set_node_attributes(_multigraphe, _pos, "pos")
+
+        return _multigraphe
+
+    @staticmethod
+    def FFdistance(_pos1, _pos2):
+        """
+            Calcule la distance euclidienne entre deux positions
+
+            :param _pos1: (double, double), la première position
+            :param _pos2: (double, double), la seconde position
+            :return: double, la distance
+        """
+        return math.sqrt(math.pow(_pos1[0] - _pos2[0], 2) + math.pow(_pos1[1] - _pos2[1], 2))
+
+    @staticmethod
+    def __FFanneau(_c_x, _c_y, _anneau):
+        """
+            Liste les cases de la grille situées exactement à _anneau cases de la case (_c_x, _c_y)
+
+            :param _c_x: int, abscisse de la case centrale
+            :param _c_y: int, ordonnée de la case centrale
+            :param _anneau: int, la distance en nombre de cases
+            :return: (int, int)[], les cases de l'anneau
+        """
+        if _anneau == 0:
+            return [(_c_x, _c_y)]
+        _cases = []
+        for _d in range(-_anneau, _anneau + 1):
+            _cases.append((_c_x + _d, _c_y - _anneau))
+            _cases.append((_c_x + _d, _c_y + _anneau))
+        for _d in range(-_anneau + 1, _anneau):
+            _cases.append((_c_x - _anneau, _c_y + _d))
+            _cases.append((_c_x + _anneau, _c_y + _d))
+        return _cases
+
+    def __FFajouterNoeud(self, _noeud):
+        """
+            Ajoute un noeud à l'ensemble dominant, dans un fragment qui ne contient que lui
+
+            :param _noeud: int, le numéro du noeud
+        """
+        _pos = self.FF_graphe.node[_noeud]['pos']
+        self.FF_noeuds_dominants[_noeud] = self.FF_graphe.node[_noeud]
+        self.FF_rang[_noeud] = len(self.FF_rang)
+        self.FF_parent[_noeud] = _noeud
+        self.FF_fragments[_noeud] = dict({"membres": [_noeud], "x": _pos[0], "y": _pos[1],
+                                          "rang": self.FF_rang[_noeud]})
+
+    def __FFajouterChemin(self, _chemin):
+        """
+            Ajoute à l'ensemble dominant les noeuds d'un chemin et les arcs qui les relient entre eux ou à l'ensemble
+            dominant, dans l'ordre où Graph.edges() les énumère
+
+            :param _chemin: int[], les noeuds du chemin
+        """
+        _noeuds_chemin = set(_chemin)
+        _arcs = set()
+        _adjacence = self.FF_graphe.adj
+        for _noeud in _noeuds_chemin:
+            for _voisin in _adjacence[_noeud]:
+                if _voisin in _noeuds_chemin or _voisin in self.FF_noeuds_dominants:
+                    _arcs.add(self.__FFarcOriente(_noeud, _voisin))
+
+        _ordre_arcs = self.__FFordreArcs()
+        _arcs = sorted(_arcs, key=_ordre_arcs.__getitem__)
+        self.FF_arcs_dominants.extend(_arcs)
+
+        for _noeud in _chemin:
+            if _noeud not in self.FF_noeuds_dominants:
+                self.__FFajouterNoeud(_noeud)
+        for _arc in _arcs:
+            self.__FFunion(_arc[0], _arc[1])
+
+    def __FFarcOriente(self, _noeud1, _noeud2):
+        """
+            Donne l'orientation dans laquelle Graph.edges() énumère un arc
+
+            :param _noeud1: int, une extrémité de l'arc
+            :param _noeud2: int, l'autre extrémité
+            :return: (int, int), l'arc orienté
+        """
+        _ordre_arcs = self.__FFordreArcs()
+        if (_noeud1, _noeud2) in _ordre_arcs:
+            return _noeud1, _noeud2
+        return _noeud2, _noeud1
+
+    def __FFordreArcs(self):
+        """
+            Associe à chaque arc du graphe sa position dans l'énumération Graph.edges(). Calculé une seule fois, à la
+            première fusion.
+
+            :return: dict{(int, int) : int}, la position de chaque arc
+        """
+        if self.__FF_ordre_arcs is None:
+            self.__FF_ordre_arcs = {_arc: _i for _i, _arc in enumerate(self.FF_graphe.edges())}
+        return self.__FF_ordre_arcs
+
+    def __FFracine(self, _noeud):
+        """
+            Trouve la racine du fragment d'un noeud, en compressant le chemin parcouru
+
+            :param _noeud: int, le numéro du noeud
+            :return: int, la racine
+        """
+        _racine = _noeud
+        while self.FF_parent[_racine] != _racine:
+            _racine = self.FF_parent[_racine]
+        while self.FF_parent[_noeud] != _racine:
+            self.FF_parent[_noeud], _noeud = _racine, self.FF_parent[_noeud]
+        return _racine
+
+    def __FFunion(self, _noeud1, _noeud2):
+        """
+            Fusionne les fragments de deux noeuds : le plus petit fragment est rattaché au plus grand
+
+            :param _noeud1: int, le premier noeud
+            :param _noeud2: int, le second noeud
+        """
+        _racine1 = self.__FFracine(_noeud1)
+        _racine2 = self.__FFracine(_noeud2)
+        if _racine1 == _racine2:
+            return
+
+        if len(self.FF_fragments[_racine1]["membres"]) < len(self.FF_fragments[_racine2]["membres"]):
+            _racine1, _racine2 = _racine2, _racine1
+
+        _fragment1 = self.FF_fragments[_racine1]
+        _fragment2 = self.FF_fragments.pop(_racine2)
+        _fragment1["membres"].extend(_fragment2["membres"])
+        _fragment1["x"] += _fragment2["x"]
+        _fragment1["y"] += _fragment2["y"]
+        _fragment1["rang"] = min(_fragment1["rang"], _fragment2["rang"])
+        self.FF_parent[_racine2] = _racine1
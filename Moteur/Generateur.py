@@ -12,16 +12,15 @@
 import datetime
 import math
 import random
-import plotly.graph_objs as go
-import plotly
+from collections import deque
 import networkx as nx
-from plotly.utils import numpy
+import numpy
 
 from Modele.Roles import Roles
 from Modele.Signaux import Signaux
 from Modele.Reseau import Reseau
+from Utilitaires.Connecteur import Connecteur
 from Utilitaires.Log import Log
-from Vue.FenetreCreation import FenetreCreation
 
 
 _log = Log()
@@ -34,21 +33,28 @@ class Generateur:
         Classe qui regroupe les outils utiles pour la génération d'un réseau
         La plupart des méthodes sont déclarées statiques
 
-        :var self.G_connecteur : QtCore.pyqtSignal, Utilisé par Generateur pour notifier le controleur de l'avancement
-        de la création
+        :var self.G_connecteur : QtCore.pyqtSignal ou Connecteur, Utilisé par Generateur pour notifier le controleur de
+        l'avancement de la création
+
+        :cvar self.G_CAPACITE_BATTERIE_MAX : int, la capacité maximale des batteries pouvant être choisie, utilisée
+        comme borne de l'échelle de couleur de l'affichage
     """
 
+    G_CAPACITE_BATTERIE_MAX = 1000
+
     def __init__(self, _connecteur):
         """
             Initialisateur de la classe
 
-        :param _connecteur: pyqtSignal, connecteur qui permet d'informer le controleur de l'avancement de la génération
+        :param _connecteur: pyqtSignal ou Connecteur, connecteur qui permet d'informer le controleur de l'avancement de
+            la génération
         """
         super(Generateur, self).__init__()
 
         _log.Linfo("Init -- Generateur")
 
-        self.G_connecteur = _connecteur
+        # Sans connecteur (exécution sans interface), les notifications ne sont transmises à personne
+        self.G_connecteur = _connecteur if _connecteur is not None else Connecteur()
 
     def GobtenirConnecteur(self):
         """
@@ -107,7 +113,7 @@ class Generateur:
     def GparametrageReseau(_graphe, _params):
         """
         Permet de placer les paramètres de rôle et niveau de batterie dans les noeuds.
-        Le premier noeud correspond au puit
+        Le premier noeud correspond au premier puit, les suivants sont placés par GplacementPuits
 
         :param _graphe : Graphe Networkx, le graphe à paramétrer
         :param _params : ParametresCreation, l'ensemble des paramètres saisis par l'utilisateur
@@ -117,12 +123,18 @@ class Generateur:
         """
         _log.Linfo("Début ## Generateur.GparametrageReseau")
 
+        # Il doit rester au moins un capteur qui ne soit pas un puit
+        if type(_params.PC_nbr_puits) is not int or not 1 <= _params.PC_nbr_puits < _params.PC_nbr_capteurs:
+            _log.Lerror("Valeur Argument errone _params.PC_nbr_puits")
+            raise Exception("Valeur Argument errone _params.PC_nbr_puits")
+
         # Paramètre rôle : Passerelle, Emetteur/Recepteur, Emetteur
         _roles = {i: Roles.EMETTEUR_RECEPTEUR for i in range(0, _params.PC_nbr_capteurs)}
-        _roles[0] = Roles.PUIT
         # Niveau initiale de batterie
         _batterie = {i: _params.PC_capacitees_batteries for i in range(0, _params.PC_nbr_capteurs)}
-        _batterie[0] = -1
+        for _puit in Generateur.GplacementPuits(_graphe, _params.PC_nbr_puits):
+            _roles[_puit] = Roles.PUIT
+            _batterie[_puit] = -1
         # Si les arcs appartiennent à l'ensemble dominant
         _dominant = {e: {"dominant": Roles.ARC_NON_DOMINANT} for e in _graphe.edges()}
 
@@ -132,6 +144,40 @@ class Generateur:
 
         return _graphe
 
+    @staticmethod
+    def GplacementPuits(_graphe, _nbr_puits):
+        """
+        Choisit les noeuds qui seront des puits. Le premier est le noeud 0, chacun des suivants est le noeud le plus
+        éloigné, en nombre de sauts, des puits déjà placés (le premier dans l'ordre des noeuds en cas d'égalité) : le
+        nombre de sauts qui sépare un capteur du puit le plus proche reste ainsi faible.
+        Les distances au puit le plus proche sont conservées, chaque nouveau puit ne les met à jour que pour les noeuds
+        dont il est plus proche : au pire O(K (n + m)) pour K puits.
+
+        :param _graphe : Graphe Networkx, le graphe du réseau
+        :param _nbr_puits : int, le nombre de puits à placer
+
+        :return int[], les puits, dans l'ordre de leur placement
+        """
+        _log.Linfo("Début ## Generateur.GplacementPuits")
+
+        _adjacence = _graphe.adj
+        _distances = dict.fromkeys(_graphe, math.inf)
+        _puits = []
+        _puit = 0
+        while len(_puits) < _nbr_puits:
+            _puits.append(_puit)
+            _distances[_puit] = 0
+            _file = deque([_puit])
+            while _file:
+                _noeud = _file.popleft()
+                for _voisin in _adjacence[_noeud]:
+                    if _distances[_noeud] + 1 < _distances[_voisin]:
+                        _distances[_voisin] = _distances[_noeud] + 1
+                        _file.append(_voisin)
+            _puit = max(_distances, key=_distances.__getitem__)
+
+        return _puits
+
     @staticmethod
     def GgenererPositions(_nbr_noeuds, _max_size, _marge, _min_distance):
         """
@@ -487,7 +533,7 @@ class Generateur:
         return Reseau(_nbr_noeuds_graphe, _graphe)
 
     @staticmethod
-    def GgenerationHTML(_reseau):
+    def GgenerationHTML(_reseau, _analyse=None):
         """
         Génère l'html de l'affichage à partir d'un réseau
 
@@ -497,25 +543,23 @@ class Generateur:
         les non dominants, ainsi que les déconnectés
 
         :param _reseau : Reseau, le réseau à traiter
+        :param _analyse : AnalyseEtat, les mesures de l'état du réseau si elles ont déjà été calculées, None sinon
 
         :return String, le code HTML
         """
         _log.Linfo("Début ## Generateur.GgenerationHTML")
 
-        # Récupération, pour commencer, l'ensemble des noeuds déconnectés
-        from Moteur.Simulateur import Simulateur
-        _simulateur = Simulateur(None)
-
-        # On test si on est dans le cas du cycle 0, si c'est le cas on cherche si la fin de vie est atteinte avec la
-        # méthode adéquate
-        from Controleur.Statistiques import Statistiques
-        _statistiques = Statistiques()
-        if len(_statistiques.S_cycles) == 0 or max(_statistiques.S_cycles) == 0:
-            _intervalle = 0
-        else:
-            _intervalle = -1
+        # Importation en local : plotly n'est chargé que si un affichage est demandé
+        import plotly
+        import plotly.graph_objs as go
 
-        _, _ensemble_deconnecte = _simulateur.SfinDeVieAtteinte(_reseau, _intervalle)
+        # Récupération, pour commencer, l'ensemble des noeuds déconnectés et des arcs dominants. Dans le cas du cycle
+        # 0, l'analyse vérifie aussi les chaînes de routage
+        if _analyse is None:
+            from Moteur.AnalyseEtat import AnalyseEtat
+            _analyse = AnalyseEtat(_reseau)
+        _ensemble_deconnecte = _analyse.AE_ensemble_deconnectes
+        _arcs_ensemble_dominant = set(_analyse.AE_arcs_dominants)
 
         # ==============================================================================================================
         # Paramétrage des arcs
@@ -530,7 +574,7 @@ class Generateur:
         # Les arcs déconnectés de l'ensemble dominant sont noirs, les autres gris
         # Auss idécomposition des arcs en deux partis, ceux de l'ensemble dominant et les autres
         for _arc in _reseau.R_graphe.edges():
-            if _arc in _reseau.R_ensemble_dominant.edges():
+            if _arc in _arcs_ensemble_dominant:
                 _arcs_dominants.append(_arc)
                 if _arc[0] in _ensemble_deconnecte or _arc[1] in _ensemble_deconnecte:
                     colors_dominant.append("black")
@@ -578,7 +622,8 @@ class Generateur:
                     _nodes_pos_dominant.append([_reseau.R_graphe.node[_noeud]['pos'][0],
                                                 _reseau.R_graphe.node[_noeud]['pos'][1]])
                 else:
-                    _nodes_pos.append([_reseau.R_graphe.node[_noeud]['pos'][0], _reseau.R_graphe.node[_noeud]['pos'][1]])
+                    _nodes_pos.append([_reseau.R_graphe.node[_noeud]['pos'][0],
+                                       _reseau.R_graphe.node[_noeud]['pos'][1]])
         _nodes_pos = numpy.array(_nodes_pos)
         _nodes_pos_dominant = numpy.array(_nodes_pos_dominant)
         _nodes_pos_deconnectes = numpy.array(_nodes_pos_deconnectes)
@@ -596,7 +641,7 @@ class Generateur:
                           mode='markers',
                           marker=dict(
                               showscale=True,
-                              cmax=FenetreCreation.FCobtenirCapaciteMaxBatterie(),
+                              cmax=Generateur.G_CAPACITE_BATTERIE_MAX,
                               cmin=0,
                               # colorscale options
                               # 'Greys' | 'YlGnBu' | 'Greens' | 'YlOrRd' | 'Bluered' | 'RdBu' |
@@ -626,7 +671,7 @@ class Generateur:
                                    mode='markers',
                                    marker=dict(
                                        showscale=False,
-                                       cmax=FenetreCreation.FCobtenirCapaciteMaxBatterie(),
+                                       cmax=Generateur.G_CAPACITE_BATTERIE_MAX,
                                        cmin=0,
                                        # colorscale options
                                        # 'Greys' | 'YlGnBu' | 'Greens' | 'YlOrRd' | 'Bluered' | 'RdBu' |
@@ -675,7 +720,7 @@ class Generateur:
         if len(_nodes_pos) == 0:
             node_trace_dominant["marker"]["showscale"] = True
 
-        _texte_puit = ""
+        _textes_puits = dict()
 
         # Ajout des informations pour l'affichage d'informations supplémentaires
         # - Le texte qui s'affiche au survole d'un noeud avec la souris
@@ -686,10 +731,13 @@ class Generateur:
             #   - Le prochain noeud vers lequel envoyer les données
             #   - l'énergie restante (si ce n'est pas un puit, si c'est le cas sa couleur est mise en violet). Si il
             #       n'a plus d'énergie, sa couleur est mise en noir
-            #   - le nombre de capteurs adjacent (si c'est le puit)
+            #   - le nombre de capteurs adjacent (si c'est le puit) et, si il y a plusieurs puits, le nombre de
+            #       capteurs qui lui envoient leurs données
 
             if _reseau.R_graphe.node[node]['role'] == Roles.PUIT:
-                _texte_puit = "Passerelle | " + str(len(adjacencies[1])) + " capteurs adjacents"
+                _textes_puits[node] = "Passerelle | " + str(len(adjacencies[1])) + " capteurs adjacents"
+                if len(_analyse.AE_charge_puits) > 1:
+                    _textes_puits[node] += " | " + str(_analyse.AE_charge_puits[node]) + " capteurs reliés"
             else:
                 node_info = "Capteur n°" + str(node) + " | " + \
                             "Nv batterie : " + str(int(_reseau.R_graphe.node[node]['batterie'])) + " | " + \
@@ -716,7 +764,7 @@ class Generateur:
                                          x=[_reseau.R_graphe.node[_noeud]['pos'][0]],
                                          y=[_reseau.R_graphe.node[_noeud]['pos'][1]],
                                          hoverinfo='text',
-                                         text=_texte_puit,
+                                         text=_textes_puits[_noeud],
                                          mode='markers',
                                          marker=dict(
                                              showscale=False,
@@ -729,7 +777,8 @@ class Generateur:
 
         # On concatène l'ensemble des données, arcs et noeuds, à afficher. L'affiche est supperposé de gauche à droite
         if len(_nodes_pos_deconnectes) > 0:
-            _datas = edge_trace + [node_trace] + edge_trace_dominant + [node_trace_deconnecte] + [node_trace_dominant] + _puits_trace
+            _datas = (edge_trace + [node_trace] + edge_trace_dominant + [node_trace_deconnecte] + [node_trace_dominant]
+                      + _puits_trace)
         else:
             _datas = edge_trace + [node_trace] + edge_trace_dominant + [node_trace_dominant] + _puits_trace
 
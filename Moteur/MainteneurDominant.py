@@ -0,0 +1,233 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module MainteneurDominant
+
+    Module contenant la classe utilisée pour maintenir l'ensemble dominant connexe d'un réseau d'un changement de rôle
+    à l'autre : MainteneurDominant
+
+"""
+
+import math
+
+import networkx as nx
+
+from Modele.Roles import Roles
+from Moteur.FusionFragments import FusionFragments
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class MainteneurDominant:
+    """
+        class MainteneurDominant
+
+        Conserve le dernier arbre dominant calculé par Simulateur.SdeterminationEnsembleDominant et l'ensemble des
+        capteurs vides pour lequel il a été calculé. Sans pondération (Simulateur.S_ponderation_batterie), l'arbre ne
+        dépend que du graphe et des capteurs encore en vie. Avec, il dépend aussi du niveau de batterie de chaque
+        capteur, qui est alors conservé lui aussi.
+
+        À chaque configuration topologique :
+            - si aucun capteur n'est mort depuis le calcul précédent (et, avec pondération, si aucun niveau de batterie
+              n'a changé), l'arbre est réutilisé tel quel (le résultat est le même que celui d'un recalcul) ;
+            - si au plus MD_seuil_changements capteurs sont morts ou épuisés depuis, l'arbre est réparé localement :
+              les dominants morts et épuisés sont retirés, chaque noeud qui n'est plus dominé est couvert par celui de
+              ses voisins qui couvre le plus de noeuds non dominés, puis les fragments ainsi créés sont reliés par
+              FusionFragments ;
+            - sinon (ou si des capteurs ont été rechargés, par exemple au début d'un nouveau cycle), l'arbre est
+              recalculé entièrement.
+        L'arbre réparé n'est pas forcément celui qu'aurait donné un recalcul complet. Avec un seuil nul, seul l'arbre
+        identique est réutilisé et les résultats de la simulation ne changent pas.
+        Un dominant est épuisé si son niveau de batterie est passé sous MD_seuil_epuisement fois le niveau moyen des
+        capteurs en vie : sans cela, un arbre réparé garderait ses dominants jusqu'à leur mort, alors qu'un recalcul
+        (pondéré) les aurait écartés. Un dominant épuisé reste toutefois dominant s'il est le seul à pouvoir couvrir
+        un de ses voisins.
+
+        :var self.MD_seuil_changements : int, le nombre maximum de capteurs morts depuis le calcul précédent pour
+            lequel l'arbre est réparé plutôt que recalculé
+        :var self.MD_seuil_epuisement : float, la fraction du niveau de batterie moyen des capteurs en vie sous
+            laquelle un dominant est retiré de l'arbre, 0 pour ne retirer que les dominants morts
+        :var self.MD_graphe : Graphe NetworkX, le graphe pour lequel l'arbre a été calculé, None si aucun
+        :var self.MD_vides : frozenset(int), les capteurs vides lors du calcul de l'arbre
+        :var self.MD_energie : float, la somme des niveaux de batterie lors du calcul de l'arbre, qui ne peut
+            qu'augmenter si des capteurs ont été rechargés
+        :var self.MD_batteries : tuple(float), les niveaux de batterie lors du calcul de l'arbre, None sans
+            pondération
+        :var self.MD_arbre : Graphe NetworkX, le dernier arbre dominant calculé
+        :var self.MD_compteurs : dict{String : int}, le nombre de recalculs (recalcul), de réutilisations
+            (reutilisation) et de réparations (reparation)
+    """
+
+    def __init__(self, _seuil_changements=0, _seuil_epuisement=0):
+        """
+            Constructeur de la classe
+
+            :param _seuil_changements: int, le nombre maximum de capteurs morts depuis le calcul précédent pour
+                lequel l'arbre est réparé plutôt que recalculé
+            :param _seuil_epuisement: float, la fraction du niveau de batterie moyen des capteurs en vie sous laquelle
+                un dominant est retiré de l'arbre
+        """
+        _log.Linfo("Init -- MainteneurDominant")
+
+        if type(_seuil_changements) is not int or _seuil_changements < 0:
+            _log.Lerror("Valeur Argument errone _seuil_changements")
+            raise Exception("Valeur Argument errone _seuil_changements")
+        if not 0 <= _seuil_epuisement < 1:
+            _log.Lerror("Valeur Argument errone _seuil_epuisement")
+            raise Exception("Valeur Argument errone _seuil_epuisement")
+
+        self.MD_seuil_changements = _seuil_changements
+        self.MD_seuil_epuisement = _seuil_epuisement
+        self.MD_graphe = None
+        self.MD_vides = frozenset()
+        self.MD_energie = 0
+        self.MD_batteries = None
+        self.MD_arbre = None
+        self.MD_compteurs = dict({"recalcul": 0, "reutilisation": 0, "reparation": 0})
+
+    def MDensembleDominant(self, _reseau):
+        """
+            Détermine l'arbre dominant du réseau à partir du précédent, cf description de la classe
+
+            :param _reseau: Reseau, le réseau à configurer
+            :return: Graph Networkx, l'arbre dominant
+        """
+        _log.Linfo("Début ## MainteneurDominant.MDensembleDominant")
+
+        from Moteur.Simulateur import Simulateur
+
+        _vides = frozenset(Simulateur.ScapteursVides(_reseau))
+        _batteries = None
+        if Simulateur.S_ponderation_batterie:
+            _batteries = tuple(_donnees['batterie'] for _, _donnees in _reseau.R_graphe.nodes(data=True))
+
+        _energie = sum(_donnees['batterie'] for _, _donnees in _reseau.R_graphe.nodes(data=True))
+
+        if self.MD_graphe is _reseau.R_graphe and self.MD_vides <= _vides and _energie <= self.MD_energie:
+            _morts = _vides - self.MD_vides
+            _epuises = self.__MDdominantsEpuises(_reseau, _vides)
+            # L'arbre est copié : les états capturés pendant la simulation en gardent une référence
+            if len(_morts) == 0 and len(_epuises) == 0 and _batteries == self.MD_batteries:
+                self.MD_compteurs["reutilisation"] += 1
+                return self.MD_arbre.copy()
+            if 0 < self.MD_seuil_changements and len(_morts) + len(_epuises) <= self.MD_seuil_changements:
+                self.MD_compteurs["reparation"] += 1
+                self.MD_arbre = self.__MDreparer(_reseau, _morts, _epuises)
+                self.MD_vides = _vides
+                self.MD_energie = _energie
+                self.MD_batteries = _batteries
+                return self.MD_arbre.copy()
+
+        self.MD_compteurs["recalcul"] += 1
+        self.MD_arbre = Simulateur.SdeterminationEnsembleDominant(_reseau)
+        self.MD_graphe = _reseau.R_graphe
+        self.MD_vides = _vides
+        self.MD_energie = _energie
+        self.MD_batteries = _batteries
+        return self.MD_arbre.copy()
+
+    def MDcaptureEtat(self):
+        """
+            Capture l'arbre conservé et les informations avec lesquelles il a été calculé, pour qu'un cycle repris
+            depuis un point de reprise (cf Simulateur.SpointDeReprise) répare le même arbre que le cycle d'origine
+
+            :return: dict{String : Objet}, l'état du mainteneur, à passer à MDrestaurerEtat
+        """
+        return dict({"vides": self.MD_vides, "energie": self.MD_energie, "batteries": self.MD_batteries,
+                     "arbre": self.MD_arbre})
+
+    def MDrestaurerEtat(self, _etat, _reseau):
+        """
+            Restaure un état capturé par MDcaptureEtat. Le graphe n'est pas conservé dans l'état (il peut être transmis
+            à un autre processus) : l'arbre est associé au graphe du réseau repris.
+
+            :param _etat: dict{String : Objet}, l'état retourné par MDcaptureEtat
+            :param _reseau: Reseau, le réseau repris, dans l'état du point de reprise
+        """
+        self.MD_graphe = _reseau.R_graphe if _etat["arbre"] is not None else None
+        self.MD_vides = _etat["vides"]
+        self.MD_energie = _etat["energie"]
+        self.MD_batteries = _etat["batteries"]
+        self.MD_arbre = _etat["arbre"]
+
+    def __MDdominantsEpuises(self, _reseau, _vides):
+        """
+            Détermine les dominants de l'arbre précédent encore en vie dont le niveau de batterie est passé sous
+            MD_seuil_epuisement fois le niveau moyen des capteurs en vie
+
+            :param _reseau: Reseau, le réseau à configurer
+            :param _vides: frozenset(int), les capteurs vides
+            :return: frozenset(int), les dominants épuisés, vide si MD_seuil_epuisement est nul
+        """
+        if self.MD_seuil_epuisement == 0:
+            return frozenset()
+
+        _noeuds = _reseau.R_graphe.nodes
+        _batteries = [_donnees['batterie'] for _noeud, _donnees in _noeuds(data=True)
+                      if _donnees['role'] != Roles.PUIT and _noeud not in _vides]
+        if len(_batteries) == 0:
+            return frozenset()
+        _limite = self.MD_seuil_epuisement * sum(_batteries) / len(_batteries)
+
+        return frozenset(_noeud for _noeud in self.MD_arbre.nodes
+                         if _noeud not in _vides and _noeuds[_noeud]['role'] != Roles.PUIT
+                         and _noeuds[_noeud]['batterie'] < _limite)
+
+    def __MDreparer(self, _reseau, _morts, _epuises=frozenset()):
+        """
+            Répare l'arbre dominant autour des capteurs morts et des dominants épuisés depuis le calcul précédent
+
+            :param _reseau: Reseau, le réseau à configurer
+            :param _morts: frozenset(int), les capteurs morts depuis le calcul précédent
+            :param _epuises: frozenset(int), les dominants épuisés, retirés de l'arbre
+            :return: Graph Networkx, l'arbre dominant réparé
+        """
+        _log.Linfo("Début ## MainteneurDominant.__MDreparer")
+
+        from Moteur.Simulateur import Simulateur
+
+        if Simulateur.S_ponderation_batterie:
+            Simulateur.SactualisationPoids(_reseau)
+        _reseau_vivant, _ = Simulateur.SreseauSansCapteursVides(_reseau)
+        _graphe = _reseau_vivant.R_graphe
+        _adjacence = _graphe.adj
+
+        _retires = _morts | _epuises
+        _dominants = set(_noeud for _noeud in self.MD_arbre.nodes if _noeud not in _retires)
+
+        # Seuls les dominants épuisés et les voisins des dominants retirés ont pu perdre leur dominant
+        _non_domines = set()
+        for _retire in _retires:
+            if _retire in self.MD_arbre:
+                for _voisin in list(_reseau.R_graphe.adj[_retire]) + [_retire]:
+                    if _voisin in _graphe and _voisin not in _dominants \
+                            and not any(_v in _dominants for _v in _adjacence[_voisin]):
+                        _non_domines.add(_voisin)
+
+        # Chaque noeud non dominé est couvert par le candidat (lui-même ou un voisin) qui couvre le plus de noeuds non
+        # dominés par unité de poids, lui-même puis le premier voisin en cas d'égalité. Un dominant épuisé n'est pas
+        # candidat : il ne se couvre lui-même que si aucun de ses voisins ne peut le faire
+        _noeuds = _graphe.nodes
+        for _noeud in [_n for _n in _graphe if _n in _non_domines]:
+            if _noeud not in _non_domines:
+                continue
+            _meilleur = _noeud
+            _meilleure_couverture = 0
+            _voisins = [_v for _v in _adjacence[_noeud] if _v not in _epuises]
+            for _candidat in (_voisins if _noeud in _epuises else [_noeud] + _voisins):
+                _couverts = sum(1 for _v in list(_adjacence[_candidat]) + [_candidat] if _v in _non_domines)
+                _poids = _noeuds[_candidat].get('poids_dominant', 1)
+                # Les puits ont un poids nul : ils sont toujours choisis lorsqu'ils sont candidats
+                _couverture = _couverts / _poids if _poids > 0 else math.inf
+                if _couverture > _meilleure_couverture:
+                    _meilleur = _candidat
+                    _meilleure_couverture = _couverture
+            _dominants.add(_meilleur)
+            _non_domines.difference_update(list(_adjacence[_meilleur]) + [_meilleur])
+
+        # Les fragments formés par les dominants restants et ajoutés sont reliés entre eux
+        _multigraphe = FusionFragments(_graphe, [_n for _n in _graphe if _n in _dominants]).FFrelierFragments()
+        return nx.minimum_spanning_tree(_multigraphe, "poids_dominant", algorithm="prim")
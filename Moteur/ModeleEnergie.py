@@ -0,0 +1,141 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module ModeleEnergie
+
+    Module contenant les modèles de consommation énergétique des capteurs : ModeleEnergie (classe de base),
+    ModeleFixe et ModeleRadioPremierOrdre
+
+"""
+
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class ModeleEnergie:
+    """
+        class ModeleEnergie
+
+        Classe de base des modèles de consommation énergétique. Un modèle détermine l'énergie consommée par un capteur
+        pour récolter, recevoir et émettre un paquet de données. Seul le coût d'une émission peut dépendre de la
+        longueur du lien entre l'émetteur et le noeud vers lequel il route ses données : les longueurs sont calculées
+        une fois par configuration topologique (cf MoteurEnergie), puis le coût de chaque noeud est obtenu en une
+        opération vectorielle. Une récolte coûte donc autant à simuler quel que soit le modèle.
+        Les modèles disponibles sont enregistrés par nom dans MEN_MODELES.
+
+        :var self.MEN_recolte : double, consommation d'une récolte de données
+        :var self.MEN_emission : double, consommation d'une émission de données, hors amplification
+        :var self.MEN_reception : double, consommation d'une réception de données
+        :var self.MEN_amplification : double, consommation de l'amplificateur par unité de distance à la puissance
+            MEN_exposant (utilisé par ModeleRadioPremierOrdre)
+        :var self.MEN_exposant : double, exposant d'atténuation du signal avec la distance (utilisé par
+            ModeleRadioPremierOrdre)
+
+        :cvar self.MEN_DISTANCES : bool, vrai si le coût d'une émission dépend de la longueur du lien
+        :cvar self.MEN_MODELES : dict{String : class}, les modèles disponibles, par nom
+    """
+
+    MEN_DISTANCES = False
+    MEN_MODELES = {}
+
+    def __init__(self, _recolte, _emission, _reception, _amplification=0, _exposant=2):
+        """
+            Constructeur de la classe
+
+            :param _recolte: double, consommation énergétique d'une récolte de données
+            :param _emission: double, consommation énergétique d'une émission de données, hors amplification
+            :param _reception: double, consommation énergétique d'une réception de données
+            :param _amplification: double, consommation de l'amplificateur par unité de distance à la puissance
+                _exposant
+            :param _exposant: double, exposant d'atténuation du signal avec la distance
+        """
+        _log.Linfo("Init -- " + type(self).__name__)
+
+        if _amplification < 0:
+            _log.Lerror("Valeur Argument errone _amplification")
+            raise Exception("Valeur Argument errone _amplification")
+        if _exposant < 0:
+            _log.Lerror("Valeur Argument errone _exposant")
+            raise Exception("Valeur Argument errone _exposant")
+
+        self.MEN_recolte = _recolte
+        self.MEN_emission = _emission
+        self.MEN_reception = _reception
+        self.MEN_amplification = _amplification
+        self.MEN_exposant = _exposant
+
+    @staticmethod
+    def MENcreer(_modele, _recolte, _emission, _reception, _amplification=0, _exposant=2):
+        """
+            Crée le modèle de consommation correspondant à un nom
+
+            :param _modele: String, le nom du modèle (cf MEN_MODELES)
+            :param _recolte: double, consommation énergétique d'une récolte de données
+            :param _emission: double, consommation énergétique d'une émission de données, hors amplification
+            :param _reception: double, consommation énergétique d'une réception de données
+            :param _amplification: double, consommation de l'amplificateur par unité de distance à la puissance
+                _exposant
+            :param _exposant: double, exposant d'atténuation du signal avec la distance
+            :return: ModeleEnergie, le modèle
+        """
+        if _modele not in ModeleEnergie.MEN_MODELES:
+            _log.Lerror("Valeur Argument errone _modele")
+            raise Exception("Valeur Argument errone _modele : " + str(_modele))
+
+        return ModeleEnergie.MEN_MODELES[_modele](_recolte, _emission, _reception, _amplification, _exposant)
+
+    def MENemission(self, _longueurs):
+        """
+            Détermine la consommation d'une émission de données
+
+            :param _longueurs: numpy.ndarray(float) ou float, la longueur du lien de chaque émetteur vers le noeud
+                auquel il envoie ses données. Ignoré si MEN_DISTANCES est faux
+            :return: numpy.ndarray(float) ou double, la consommation d'une émission pour chaque émetteur, ou une
+                consommation commune à tous
+        """
+        raise NotImplementedError
+
+
+class ModeleFixe(ModeleEnergie):
+    """
+        class ModeleFixe
+
+        Modèle d'origine : chaque émission coûte MEN_emission, quelle que soit la distance parcourue.
+    """
+
+    def MENemission(self, _longueurs):
+        """
+            Cf ModeleEnergie.MENemission
+
+            :param _longueurs: ignoré
+            :return: double, la consommation commune à toutes les émissions
+        """
+        return self.MEN_emission
+
+
+class ModeleRadioPremierOrdre(ModeleEnergie):
+    """
+        class ModeleRadioPremierOrdre
+
+        Modèle radio du premier ordre : l'émission d'un paquet sur une distance d coûte l'énergie de l'électronique
+        d'émission (MEN_emission) plus celle de l'amplificateur, MEN_amplification x d^MEN_exposant (2 en espace libre,
+        jusqu'à 4 avec des trajets multiples). La réception et la récolte ont un coût fixe.
+    """
+
+    MEN_DISTANCES = True
+
+    def MENemission(self, _longueurs):
+        """
+            Cf ModeleEnergie.MENemission
+
+            :param _longueurs: numpy.ndarray(float) ou float, la longueur du lien de chaque émetteur
+            :return: numpy.ndarray(float) ou double, la consommation d'une émission pour chaque émetteur
+        """
+        return self.MEN_emission + self.MEN_amplification * _longueurs ** self.MEN_exposant
+
+
+ModeleEnergie.MEN_MODELES = dict({"fixe": ModeleFixe,
+                                  "premier_ordre": ModeleRadioPremierOrdre})
@@ -0,0 +1,214 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module MonteCarlo
+
+    Module contenant la classe utilisée pour les simulations en lot : MonteCarlo
+    Un même jeu de paramètres de création est utilisé pour générer et simuler de nombreux réseaux aléatoires afin
+    d'obtenir la distribution de leur durée de vie plutôt qu'une valeur unique.
+
+"""
+
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy
+
+from Modele.Parametres import ParametresCreation
+from Modele.Signaux import Signaux
+from Moteur.Generateur import Generateur
+from Moteur.Simulateur import Simulateur
+from Utilitaires.Connecteur import Connecteur
+from Utilitaires.Log import Log
+
+
+_log = Log()
+
+
+class MonteCarlo:
+    """
+        class MonteCarlo
+
+        Génère N réseaux à partir des mêmes paramètres, chacun avec sa propre graine (MC_graine + numéro du réseau), et
+        les simule dans un groupe de processus réutilisé d'un réseau à l'autre. Chaque résultat est intégré aux
+        statistiques dès sa réception : moyenne et variance par l'algorithme de Welford, centiles à partir des valeurs
+        conservées.
+
+        :var self.MC_params : ParametresCreation, les paramètres de création des réseaux
+        :var self.MC_nbr_reseaux : int, le nombre de réseaux à générer et simuler
+        :var self.MC_graine : int, la graine du premier réseau
+        :var self.MC_nbr_processus : int, le nombre maximum de processus, None pour utiliser tous les processeurs
+        :var self.MC_connecteur : pyqtSignal ou Connecteur, notifié de l'avancement (PROGRESSION_SIMULATION)
+        :var self.MC_resultats : [dict{String : Objet}], le résultat de chaque réseau, par numéro de réseau (None tant
+            qu'il n'a pas été reçu)
+        :var self.MC_agregats : dict{String : dict{String : double}}, pour chaque mesure (cf MC_MESURES) le nombre de
+            valeurs, la moyenne et la somme des carrés des écarts à la moyenne (Welford)
+
+        :cvar self.MC_MESURES : (String), les mesures agrégées pour chaque réseau
+        :cvar self.MC_CENTILES : (int), les centiles calculés par défaut
+    """
+
+    MC_MESURES = ("duree_de_vie", "intervalle", "duree_sans_roulement", "evaluations")
+    MC_CENTILES = (5, 25, 50, 75, 95)
+
+    def __init__(self, _params, _nbr_reseaux, _graine=0, _nbr_processus=None, _connecteur=None):
+        """
+            Constructeur de la classe
+
+            :param _params: ParametresCreation, les paramètres de création des réseaux
+            :param _nbr_reseaux: int, le nombre de réseaux à générer et simuler
+            :param _graine: int, la graine du premier réseau
+            :param _nbr_processus: int, le nombre maximum de processus, None pour utiliser tous les processeurs
+            :param _connecteur: pyqtSignal ou Connecteur, notifié de l'avancement, None pour ne notifier personne
+        """
+        _log.Linfo("Init -- MonteCarlo")
+
+        if type(_params) is not ParametresCreation:
+            _log.Lerror("Valeur Argument errone _params")
+            raise Exception("Valeur Argument errone _params")
+        if type(_nbr_reseaux) is not int or _nbr_reseaux < 1:
+            _log.Lerror("Valeur Argument errone _nbr_reseaux")
+            raise Exception("Valeur Argument errone _nbr_reseaux")
+
+        self.MC_params = _params
+        self.MC_nbr_reseaux = _nbr_reseaux
+        self.MC_graine = _graine
+        self.MC_nbr_processus = _nbr_processus
+        self.MC_connecteur = _connecteur if _connecteur is not None else Connecteur()
+        self.MC_resultats = [None] * _nbr_reseaux
+        self.MC_agregats = {_mesure: dict({"nombre": 0, "moyenne": 0.0, "m2": 0.0}) for _mesure in self.MC_MESURES}
+
+    def MClancer(self):
+        """
+            Génère et simule tous les réseaux. Si le groupe de processus ne peut pas être utilisé, les réseaux sont
+            simulés l'un après l'autre dans le processus courant.
+
+            :return: [dict{String : Objet}], le résultat de chaque réseau, cf MCsimulerReseau
+        """
+        _log.Linfo("Début ## MonteCarlo.MClancer")
+
+        # Les processus lisent les paramètres de simulation sur la classe Simulateur, ils leur sont transmis
+        _parametres = {_nom: getattr(Simulateur, _nom)
+                       for _nom in Simulateur.S_PARAMETRES + ("S_performance", "S_strategie_optimisation")}
+        _numeros = [_numero for _numero in range(self.MC_nbr_reseaux) if self.MC_resultats[_numero] is None]
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.MC_nbr_processus) as _executeur:
+                _futurs = {_executeur.submit(MonteCarlo.MCsimulerReseau, self.MC_params, self.MC_graine + _numero,
+                                             _parametres): _numero for _numero in _numeros}
+                for _futur in as_completed(_futurs):
+                    self.__MCajouterResultat(_futurs[_futur], _futur.result())
+        except (OSError, BrokenProcessPool, pickle.PicklingError) as _erreur:
+            _log.Lerror("Groupe de processus inutilisable, les réseaux sont simulés l'un après l'autre : "
+                        + str(_erreur))
+            for _numero in range(self.MC_nbr_reseaux):
+                if self.MC_resultats[_numero] is None:
+                    self.__MCajouterResultat(_numero, MonteCarlo.MCsimulerReseau(self.MC_params,
+                                                                                 self.MC_graine + _numero,
+                                                                                 _parametres))
+
+        return self.MC_resultats
+
+    @staticmethod
+    def MCsimulerReseau(_params, _graine, _parametres):
+        """
+            Génère un réseau avec une graine donnée puis recherche son meilleur intervalle de changement de rôle.
+            Exécutée dans un processus du groupe, sans enregistrement sur disque.
+
+            :param _params: ParametresCreation, les paramètres de création du réseau
+            :param _graine: int, la graine des générateurs aléatoires
+            :param _parametres: dict{String : Objet}, les paramètres de simulation à reporter sur la classe Simulateur
+            :return: dict{String : Objet}, graine (int), duree_de_vie (int) la meilleure durée de vie, intervalle
+                (double) l'intervalle correspondant, duree_sans_roulement (int) la durée de vie sans changement de
+                rôle, evaluations (int) le nombre d'intervalles simulés
+        """
+        _log.Linfo("Début ## MonteCarlo.MCsimulerReseau")
+
+        random.seed(_graine)
+        numpy.random.seed(_graine % 2 ** 32)
+
+        for _nom, _valeur in _parametres.items():
+            setattr(Simulateur, _nom, _valeur)
+
+        _reseau = Generateur(None).GcreerReseau(_params)
+
+        _simulateur = Simulateur(None)
+        _resultats = _simulateur.SrechercherIntervalle(_reseau)
+        _meilleur = max(_resultats, key=lambda _resultat: _resultat["resultat"])
+
+        return dict({"graine": _graine,
+                     "duree_de_vie": _meilleur["resultat"],
+                     "intervalle": _meilleur["intervalle"],
+                     "duree_sans_roulement": _resultats[0]["resultat"],
+                     "evaluations": len(set(_resultat["intervalle"] for _resultat in _resultats))})
+
+    def MCmoyenne(self, _mesure):
+        """
+            :param _mesure: String, la mesure (cf MC_MESURES)
+            :return: double, la moyenne des valeurs reçues
+        """
+        return self.MC_agregats[_mesure]["moyenne"]
+
+    def MCvariance(self, _mesure):
+        """
+            :param _mesure: String, la mesure (cf MC_MESURES)
+            :return: double, la variance (estimateur non biaisé) des valeurs reçues, 0 si moins de deux valeurs
+        """
+        _agregat = self.MC_agregats[_mesure]
+        if _agregat["nombre"] < 2:
+            return 0.0
+        return _agregat["m2"] / (_agregat["nombre"] - 1)
+
+    def MCcentiles(self, _mesure, _centiles=None):
+        """
+            :param _mesure: String, la mesure (cf MC_MESURES)
+            :param _centiles: (int), les centiles à calculer, None pour MC_CENTILES
+            :return: dict{int : double}, la valeur de chaque centile, vide si aucune valeur n'a été reçue
+        """
+        if _centiles is None:
+            _centiles = self.MC_CENTILES
+        _valeurs = [_resultat[_mesure] for _resultat in self.MC_resultats if _resultat is not None]
+        if len(_valeurs) == 0:
+            return dict()
+        return dict(zip(_centiles, numpy.percentile(_valeurs, _centiles).tolist()))
+
+    def MCresume(self):
+        """
+            :return: dict{String : dict{String : Objet}}, pour chaque mesure : nombre, moyenne, variance, ecart_type
+                et centiles
+        """
+        _resume = dict()
+        for _mesure in self.MC_MESURES:
+            _variance = self.MCvariance(_mesure)
+            _resume[_mesure] = dict({"nombre": self.MC_agregats[_mesure]["nombre"],
+                                     "moyenne": self.MCmoyenne(_mesure),
+                                     "variance": _variance,
+                                     "ecart_type": _variance ** 0.5,
+                                     "centiles": self.MCcentiles(_mesure)})
+        return _resume
+
+    def __MCajouterResultat(self, _numero, _resultat):
+        """
+            Intègre le résultat d'un réseau aux statistiques (algorithme de Welford) et notifie l'avancement
+
+            :param _numero: int, le numéro du réseau
+            :param _resultat: dict{String : Objet}, son résultat, cf MCsimulerReseau
+        """
+        self.MC_resultats[_numero] = _resultat
+
+        for _mesure in self.MC_MESURES:
+            _agregat = self.MC_agregats[_mesure]
+            _agregat["nombre"] += 1
+            _ecart = _resultat[_mesure] - _agregat["moyenne"]
+            _agregat["moyenne"] += _ecart / _agregat["nombre"]
+            _agregat["m2"] += _ecart * (_resultat[_mesure] - _agregat["moyenne"])
+
+        _recus = self.MC_agregats[self.MC_MESURES[0]]["nombre"]
+        self.MC_connecteur.emit(Signaux.PROGRESSION_SIMULATION,
+                                dict({"avancee": int(_recus * 100 / self.MC_nbr_reseaux),
+                                      "text": "Réseau " + str(_numero) + " (graine " + str(_resultat["graine"]) +
+                                              ") : durée de vie " + str(_resultat["duree_de_vie"])}))
@@ -0,0 +1,408 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module MoteurEnergie
+
+    Module contenant la classe utilisée pour simuler la consommation énergétique d'un réseau à partir de tableaux
+    NumPy : MoteurEnergie
+
+"""
+
+from collections import deque
+from itertools import chain
+
+import numpy as np
+
+from Modele.Roles import Roles
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class MoteurEnergie:
+    """
+        class MoteurEnergie
+
+        Moteur de consommation énergétique alternatif à Simulateur.__Sconsommation. Les niveaux de batterie, les rôles
+        et le routage des noeuds sont stockés dans des tableaux NumPy indexés de 0 à n-1 (dans l'ordre d'itération des
+        noeuds du graphe).
+
+        Plutôt que de faire transiter chaque paquet de noeud en noeud, l'ordre de passage des paquets est calculé une
+        fois par routage, vague par vague (MEsequenceCharges) : chaque noeud reçoit la suite des charges (réceptions et
+        émissions) qu'il subit lors d'une récolte, dans l'ordre de Simulateur.__Sconsommation. Ces suites sont ensuite
+        soustraites des niveaux de batterie de tout le réseau en une seule opération vectorielle, avec exactement les
+        mêmes soustractions flottantes, dans le même ordre, que la simulation paquet par paquet.
+        Ce calcul n'est possible que si aucun capteur ne tombe à court d'énergie pendant la récolte (un paquet peut
+        alors être perdu) et si toutes les chaînes de routage aboutissent à un puit. Dans le cas contraire la récolte
+        est simulée paquet par paquet, comme dans Simulateur.__Sconsommation, avec une file à double entrée.
+        Les résultats sont donc identiques à ceux du moteur d'origine.
+
+        Les coûts sont donnés par un ModeleEnergie. Si le coût d'une émission dépend de la distance, la longueur du lien
+        de chaque noeud vers sa route est calculée à la construction, en une opération vectorielle sur le tableau des
+        routes : le coût de chaque récolte reste celui d'une opération sur des tableaux, comme avec des coûts fixes.
+
+        :var self.ME_noeuds : int[], les numéros des noeuds du graphe, la position dans la liste correspond à l'index
+            utilisé dans les tableaux
+        :var self.ME_index : dict{int : int}, associe à chaque numéro de noeud son index dans les tableaux
+        :var self.ME_batterie : numpy.ndarray(float), le niveau de batterie de chaque noeud
+        :var self.ME_role : numpy.ndarray(int), la valeur de l'énumération Roles de chaque noeud
+        :var self.ME_puits : numpy.ndarray(bool), vrai si le noeud est un puit
+        :var self.ME_route : numpy.ndarray(int), l'index du noeud vers lequel chaque noeud envoie ses données, -1 si
+            le noeud n'a pas de routage
+        :var self.ME_consommation_recolte : double, consommation d'une récolte de données
+        :var self.ME_consommation_emission : numpy.ndarray(float) ou double, consommation d'une émission de données par
+            chaque noeud, ou commune à tous les noeuds si elle ne dépend pas de la distance
+        :var self.ME_consommation_reception : double, consommation d'une réception de données
+
+        :cvar self.ME_TOLERANCE : double, marge en dessous de laquelle un niveau de batterie est considéré comme trop
+            proche de zéro pour appliquer le calcul vectoriel
+    """
+
+    ME_TOLERANCE = 1e-9
+
+    def __init__(self, _reseau, _modele):
+        """
+            Constructeur de la classe, extrait les informations du réseau dans les tableaux
+
+            :param _reseau: Reseau, le réseau dont on veut simuler la consommation
+            :param _modele: ModeleEnergie, le modèle qui donne la consommation d'une récolte, d'une réception et d'une
+                émission de données
+        """
+        _log.Linfo("Init -- MoteurEnergie")
+
+        self.ME_consommation_recolte = _modele.MEN_recolte
+        self.ME_consommation_reception = _modele.MEN_reception
+
+        _noeuds = _reseau.R_graphe.nodes
+        self.ME_noeuds = list(_noeuds)
+        self.ME_index = {_noeud: _i for _i, _noeud in enumerate(self.ME_noeuds)}
+
+        _nbr_noeuds = len(self.ME_noeuds)
+        self.ME_batterie = np.empty(_nbr_noeuds, dtype=float)
+        self.ME_role = np.empty(_nbr_noeuds, dtype=int)
+        self.ME_route = np.empty(_nbr_noeuds, dtype=int)
+        for _i, _noeud in enumerate(self.ME_noeuds):
+            self.ME_batterie[_i] = _noeuds[_noeud]["batterie"]
+            self.ME_role[_i] = _noeuds[_noeud]["role"].value
+            self.ME_route[_i] = self.ME_index.get(_noeuds[_noeud]["route"], -1)
+        self.ME_puits = self.ME_role == Roles.PUIT.value
+
+        _longueurs = None
+        if _modele.MEN_DISTANCES:
+            _positions = np.fromiter(chain.from_iterable(_noeuds[_noeud]["pos"] for _noeud in self.ME_noeuds),
+                                     dtype=float, count=2 * _nbr_noeuds).reshape(-1, 2)
+            _longueurs = self.MElongueursLiens(_positions)
+        self.ME_consommation_emission = _modele.MENemission(_longueurs)
+
+        self.__ME_batterie_initiale = self.ME_batterie.copy()
+        self.__ME_batterie_depart = self.ME_batterie.copy()
+        # Dernière suite de charges calculée (cf MEsequenceCharges) et les capteurs actifs pour lesquels elle l'a été
+        self.__ME_sequence = None
+
+    def MEnouvelleEtape(self):
+        """
+            Prépare le moteur à une nouvelle étape de simulation sur la même configuration topologique : les capteurs
+            vides (MEnouveauxCapteursVides) sont désormais comptés à partir des niveaux de batterie courants
+        """
+        self.__ME_batterie_depart = self.ME_batterie.copy()
+
+    def MElongueursLiens(self, _positions):
+        """
+            Calcule la longueur du lien entre chaque noeud et le noeud vers lequel il envoie ses données, par une
+            lecture indexée des positions selon le tableau des routes
+
+            :param _positions: numpy.ndarray(float)[n, 2], la position de chaque noeud
+            :return: numpy.ndarray(float), la longueur du lien de chaque noeud, 0 si il n'a pas de routage
+        """
+        _destinations = np.where(self.ME_route < 0, np.arange(len(self.ME_route)), self.ME_route)
+        _ecarts = _positions - _positions[_destinations]
+        return np.hypot(_ecarts[:, 0], _ecarts[:, 1])
+
+    def MEactifs(self, _capteurs_deconnectes):
+        """
+            Permet d'obtenir le masque des capteurs qui récoltent de l'information : tous sauf les puits et les capteurs
+            déconnectés
+
+            :param _capteurs_deconnectes: int[], la liste des capteurs déconnectés de la passerelle
+            :return: numpy.ndarray(bool), vrai si le capteur récolte de l'information
+        """
+        _actifs = ~self.ME_puits
+        for _noeud in _capteurs_deconnectes:
+            _index = self.ME_index.get(_noeud)
+            if _index is not None:
+                _actifs[_index] = False
+        return _actifs
+
+    def MEprofondeurs(self):
+        """
+            Calcule par saut de pointeurs la profondeur de chaque noeud dans l'arbre de routage, cad le nombre de sauts
+            pour atteindre un puit. Aucun appel récursif, O(n log n).
+
+            :return:    numpy.ndarray(int), la profondeur de chaque noeud (0 pour les puits)
+                        numpy.ndarray(bool), vrai si la chaîne de routage du noeud aboutit à un puit
+        """
+        _nbr_noeuds = len(self.ME_noeuds)
+        _indices = np.arange(_nbr_noeuds)
+
+        # Les puits et les noeuds sans routage pointent sur eux-même
+        _suivant = np.where((self.ME_route < 0) | self.ME_puits, _indices, self.ME_route)
+        _profondeur = (~self.ME_puits).astype(int)
+
+        for _ in range(max(1, int(_nbr_noeuds).bit_length())):
+            _profondeur = _profondeur + _profondeur[_suivant]
+            _suivant = _suivant[_suivant]
+
+        return _profondeur, self.ME_puits[_suivant]
+
+    def MEpaquetsParNoeud(self, _generateurs):
+        """
+            Calcule le nombre de paquets qui transitent par chaque noeud pendant une récolte : ce nombre est la taille
+            du sous-arbre de routage du noeud, restreint aux capteurs qui génèrent des données.
+
+            :param _generateurs: numpy.ndarray(bool), vrai si le capteur génère un paquet
+            :return: numpy.ndarray(int) le nombre de paquets émis par chaque noeud, None si une chaîne de routage d'un
+                capteur générateur n'aboutit pas à un puit
+        """
+        _profondeur, _relie = self.MEprofondeurs()
+        if np.any(_generateurs & ~_relie):
+            return None
+
+        _paquets = _generateurs.astype(int)
+        _relais = np.flatnonzero(_relie & ~self.ME_puits)
+        if len(_relais) == 0:
+            return _paquets
+
+        # On remonte l'arbre niveau par niveau, des feuilles vers les puits, en cumulant les paquets sur le parent
+        _relais = _relais[np.argsort(-_profondeur[_relais], kind="stable")]
+        _niveaux = np.flatnonzero(np.diff(_profondeur[_relais])) + 1
+        for _niveau in np.split(_relais, _niveaux):
+            np.add.at(_paquets, self.ME_route[_niveau], _paquets[_niveau])
+
+        _paquets[self.ME_puits] = 0
+        return _paquets
+
+    def MEconsommation(self, _capteurs_deconnectes):
+        """
+            Simule la consommation énergétique d'une récolte de données : chaque capteur actif récolte de l'information
+            puis l'envoie vers le puit en suivant le routage.
+
+            :param _capteurs_deconnectes: int[], la liste des capteurs déconnectés de la passerelle
+            :return: bool, vrai si le calcul vectoriel a pu être appliqué, faux si la récolte a été simulée paquet par
+                paquet
+        """
+        _log.Linfo("Début ## MoteurEnergie.MEconsommation")
+
+        _actifs = self.MEactifs(_capteurs_deconnectes)
+        _apres_recolte = self.ME_batterie - self.ME_consommation_recolte * _actifs
+
+        _paquets = None
+        if np.all(_apres_recolte[_actifs] > self.ME_TOLERANCE):
+            _paquets = self.MEpaquetsParNoeud(_actifs)
+
+        if _paquets is not None:
+            _apres_transmission = self.__MEbatterieApresTour(_actifs)
+            if np.all(_apres_transmission[_paquets > 0] >= self.ME_TOLERANCE):
+                self.ME_batterie = _apres_transmission
+                return True
+
+        self.MEconsommationPaquetParPaquet(_actifs)
+        return False
+
+    def MEsequenceCharges(self, _actifs):
+        """
+            Calcule, pour un routage dont toutes les chaînes aboutissent à un puit (cf MEpaquetsParNoeud), la suite des
+            charges que subit chaque noeud lors d'une récolte, dans l'ordre de la simulation paquet par paquet.
+            La file de Simulateur.__Sconsommation contient d'abord les capteurs actifs, dans l'ordre des noeuds, puis,
+            vague par vague, le destinataire de chaque paquet de la vague précédente qui n'est pas un puit. Chaque
+            paquet traité fait consommer une réception à son destinataire (sauf puit) puis une émission à son émetteur.
+            Les suites sont rangées noeud par noeud dans un seul tableau, chacune précédée d'une case où placer le
+            niveau de batterie du noeud : np.subtract.reduceat applique alors les soustractions dans l'ordre.
+            Le résultat est conservé tant que les capteurs actifs ne changent pas.
+
+            :param _actifs: numpy.ndarray(bool), vrai si le capteur récolte de l'information
+            :return:    numpy.ndarray(float), les suites de charges de tous les noeuds (à ne pas modifier)
+                        numpy.ndarray(int), l'index de la case de chaque noeud dans ce tableau
+        """
+        if self.__ME_sequence is not None and np.array_equal(self.__ME_sequence[0], _actifs):
+            return self.__ME_sequence[1], self.__ME_sequence[2]
+
+        _vagues = []
+        _vague = np.flatnonzero(_actifs)
+        while len(_vague) > 0:
+            _vagues.append(_vague)
+            _destinataires = self.ME_route[_vague]
+            _vague = _destinataires[~self.ME_puits[_destinataires]]
+        _file = np.concatenate(_vagues) if _vagues else np.empty(0, dtype=int)
+
+        # Pour chaque paquet de la file : réception par le destinataire (sauf puit) puis émission par l'émetteur
+        _destinataires = self.ME_route[_file]
+        _emissions = np.broadcast_to(self.ME_consommation_emission, self.ME_batterie.shape)[_file]
+        _noeuds = np.column_stack((_destinataires, _file)).ravel()
+        _charges = np.column_stack((np.full(len(_file), self.ME_consommation_reception), _emissions)).ravel()
+        _subies = np.column_stack((~self.ME_puits[_destinataires], np.ones(len(_file), dtype=bool))).ravel()
+        _noeuds = _noeuds[_subies]
+        _charges = _charges[_subies]
+
+        # Le tri stable regroupe les charges par noeud en conservant leur ordre dans la récolte
+        _ordre = np.argsort(_noeuds, kind="stable")
+        _noeuds = _noeuds[_ordre]
+        _nbr_noeuds = len(self.ME_noeuds)
+        _nbr_charges = np.bincount(_noeuds, minlength=_nbr_noeuds)
+        _debuts = np.arange(_nbr_noeuds) + np.concatenate(([0], np.cumsum(_nbr_charges)[:-1]))
+        _sequence = np.zeros(_nbr_noeuds + len(_noeuds), dtype=float)
+        _sequence[np.arange(len(_noeuds)) + _noeuds + 1] = _charges[_ordre]
+
+        self.__ME_sequence = (_actifs.copy(), _sequence, _debuts)
+        return _sequence, _debuts
+
+    @staticmethod
+    def MEappliquerSequence(_apres_recolte, _sequence, _debuts):
+        """
+            Soustrait de chaque niveau de batterie la suite de charges de son noeud, dans l'ordre (cf
+            MEsequenceCharges). Les suites de plusieurs réseaux peuvent être mises bout à bout.
+
+            :param _apres_recolte: numpy.ndarray(float), les niveaux de batterie après la récolte d'information
+            :param _sequence: numpy.ndarray(float), les suites de charges des noeuds
+            :param _debuts: numpy.ndarray(int), l'index de la case de chaque noeud dans _sequence
+            :return: numpy.ndarray(float), les niveaux de batterie après la transmission des paquets
+        """
+        _sequence = _sequence.copy()
+        _sequence[_debuts] = _apres_recolte
+        return np.subtract.reduceat(_sequence, _debuts)
+
+    def __MEbatterieApresTour(self, _actifs):
+        """
+            Calcule les niveaux de batterie après une récolte sans mort de capteur, avec les mêmes soustractions, dans
+            le même ordre, que la simulation paquet par paquet
+
+            :param _actifs: numpy.ndarray(bool), vrai si le capteur récolte de l'information
+            :return: numpy.ndarray(float), les niveaux de batterie après la récolte
+        """
+        _sequence, _debuts = self.MEsequenceCharges(_actifs)
+        return self.MEappliquerSequence(self.ME_batterie - self.ME_consommation_recolte * _actifs, _sequence, _debuts)
+
+    def MEchargesParTour(self, _actifs, _paquets):
+        """
+            Calcule l'énergie consommée par chaque noeud lors d'une récolte, à partir du nombre de paquets émis par
+            chaque noeud
+
+            :param _actifs: numpy.ndarray(bool), vrai si le capteur récolte de l'information
+            :param _paquets: numpy.ndarray(int), le nombre de paquets émis par chaque noeud
+            :return: numpy.ndarray(float), la consommation de chaque noeud
+        """
+        return self.ME_consommation_recolte * _actifs \
+            + self.ME_consommation_reception * (_paquets - _actifs) \
+            + self.ME_consommation_emission * _paquets
+
+    def MEtoursSansMort(self, _charges):
+        """
+            Calcule le nombre de récoltes qui peuvent être enchaînées avant qu'un capteur ne risque de tomber à court
+            d'énergie. Une récolte de marge est gardée pour absorber les arrondis flottants.
+
+            :param _charges: numpy.ndarray(float), la consommation de chaque noeud par récolte
+            :return: int, le nombre de récoltes, None si aucun noeud ne consomme d'énergie
+        """
+        _charges_positives = _charges > 0
+        if not np.any(_charges_positives):
+            return None
+
+        _marge = self.ME_batterie[_charges_positives] - self.ME_TOLERANCE
+        return int(max(0, np.min(np.floor(_marge / _charges[_charges_positives])) - 1))
+
+    def MEconsommationSansEvenement(self, _capteurs_deconnectes, _tours_max):
+        """
+            Enchaîne directement plusieurs récoltes, tant qu'aucun capteur ne tombe à court d'énergie : le routage
+            étant fixe, chaque récolte consomme la même énergie. Le nombre de récoltes avant la prochaine mort d'un
+            capteur est calculé analytiquement, puis les récoltes sont appliquées sans repasser par la boucle de
+            simulation. Si la prochaine récolte risque de provoquer la mort d'un capteur, elle est simulée seule avec
+            MEconsommation.
+
+            :param _capteurs_deconnectes: int[], la liste des capteurs déconnectés de la passerelle
+            :param _tours_max: int, le nombre maximum de récoltes à enchaîner
+            :return: int, le nombre de récoltes effectivement simulées (au moins une)
+        """
+        _log.Linfo("Début ## MoteurEnergie.MEconsommationSansEvenement")
+
+        _actifs = self.MEactifs(_capteurs_deconnectes)
+        _paquets = self.MEpaquetsParNoeud(_actifs)
+        if _paquets is not None:
+            _tours = self.MEtoursSansMort(self.MEchargesParTour(_actifs, _paquets))
+            if _tours is not None and _tours > 0:
+                _tours = min(_tours, _tours_max)
+                # Les récoltes sont appliquées une à une (opération vectorielle) afin d'obtenir exactement les mêmes
+                # arrondis que la simulation récolte par récolte
+                for _ in range(_tours):
+                    self.ME_batterie = self.__MEbatterieApresTour(_actifs)
+                return _tours
+
+        self.MEconsommation(_capteurs_deconnectes)
+        return 1
+
+    def MEconsommationPaquetParPaquet(self, _actifs):
+        """
+            Simule la consommation énergétique d'une récolte en faisant passer chaque paquet de noeud en noeud, dans le
+            même ordre que Simulateur.__Sconsommation. Utilisé lorsque des capteurs tombent à court d'énergie pendant
+            la récolte.
+
+            :param _actifs: numpy.ndarray(bool), vrai si le capteur récolte de l'information
+        """
+        _log.Linfo("Début ## MoteurEnergie.MEconsommationPaquetParPaquet")
+
+        _batterie = self.ME_batterie.tolist()
+        _route = self.ME_route.tolist()
+        _puits = self.ME_puits.tolist()
+        _recolte = self.ME_consommation_recolte
+        _emissions = np.broadcast_to(self.ME_consommation_emission, self.ME_batterie.shape).tolist()
+        _reception = self.ME_consommation_reception
+
+        _contenants_donnees = deque()
+        for _noeud in np.flatnonzero(_actifs).tolist():
+            _batterie[_noeud] -= _recolte
+            if _batterie[_noeud] > 0:
+                _contenants_donnees.append(_noeud)
+            else:
+                _batterie[_noeud] = 0
+
+        while _contenants_donnees:
+            _noeud = _contenants_donnees.popleft()
+            _noeud_destinataire = _route[_noeud]
+
+            if _batterie[_noeud] - _emissions[_noeud] < 0:
+                _batterie[_noeud] = 0
+            elif not _puits[_noeud_destinataire] and _batterie[_noeud_destinataire] - _reception < 0:
+                _batterie[_noeud_destinataire] = 0
+            else:
+                if not _puits[_noeud_destinataire]:
+                    _contenants_donnees.append(_noeud_destinataire)
+                    _batterie[_noeud_destinataire] -= _reception
+                _batterie[_noeud] -= _emissions[_noeud]
+
+        self.ME_batterie = np.array(_batterie, dtype=float)
+
+    def MEnouveauxCapteursVides(self):
+        """
+            Permet de connaître les capteurs qui sont tombés à court d'énergie depuis la création du moteur ou le début
+            de l'étape (MEnouvelleEtape)
+
+            :return: int[], les numéros des capteurs (hors puits) dont la batterie est devenue vide
+        """
+        _vides = (self.ME_batterie == 0) & (self.__ME_batterie_depart != 0) & ~self.ME_puits
+        return [self.ME_noeuds[_index] for _index in np.flatnonzero(_vides).tolist()]
+
+    def MEappliquer(self, _reseau):
+        """
+            Reporte dans le graphe du réseau les niveaux de batterie qui ont changé depuis la création du moteur
+
+            :param _reseau: Reseau, le réseau à mettre à jour (celui qui a servi à construire le moteur)
+            :return: Reseau, le réseau mis à jour
+        """
+        _log.Linfo("Début ## MoteurEnergie.MEappliquer")
+
+        _noeuds = _reseau.R_graphe.nodes
+        for _index in np.flatnonzero(self.ME_batterie != self.__ME_batterie_initiale).tolist():
+            _noeuds[self.ME_noeuds[_index]]["batterie"] = float(self.ME_batterie[_index])
+        self.__ME_batterie_initiale = self.ME_batterie.copy()
+
+        return _reseau
@@ -0,0 +1,399 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module Optimiseur
+
+    Module contenant les stratégies de recherche de l'intervalle de changement de rôle qui maximise la durée de vie du
+    réseau : Optimiseur (interface commune), OptimiseurHeuristique, OptimiseurEncadrement, OptimiseurSectionDoree et
+    OptimiseurParabolique
+
+"""
+
+import abc
+import math
+
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class Optimiseur(abc.ABC):
+    """
+        class Optimiseur
+
+        Interface commune des stratégies de recherche de l'intervalle de changement de rôle. Le simulateur demande à
+        l'optimiseur les intervalles à évaluer (Ointervalles), simule ceux qui ne l'ont pas encore été puis lui transmet
+        les durées de vie obtenues (Omemoriser), jusqu'à ce que l'optimiseur ne propose plus d'intervalle.
+        Chaque couple (intervalle, durée de vie) évalué est conservé : un intervalle n'est jamais simulé deux fois.
+
+        Pour ajouter une stratégie, il suffit d'hériter de cette classe, de redéfinir Ointervalles (méthode abstraite)
+        et de l'ajouter à O_STRATEGIES.
+
+        :var self.O_performance : double, ratio d'amélioration de la durée de vie en dessous duquel la recherche est
+            arrêtée
+        :var self.O_pas : double, l'intervalle de temps entre deux récoltes. Deux intervalles de changement de rôle
+            compris entre les mêmes multiples de ce pas donnent la même simulation
+        :var self.O_memo : dict{double : int}, la durée de vie obtenue pour chaque intervalle déjà évalué
+
+        :cvar self.O_STRATEGIES : dict{String : class}, les stratégies disponibles, par nom
+    """
+
+    O_STRATEGIES = {}
+
+    def __init__(self, _performance, _pas):
+        """
+            Constructeur de la classe
+
+            :param _performance: double, ratio d'amélioration en dessous duquel la recherche est arrêtée
+            :param _pas: double, l'intervalle de temps entre deux récoltes
+        """
+        _log.Linfo("Init -- " + type(self).__name__)
+
+        self.O_performance = _performance
+        self.O_pas = _pas
+        self.O_memo = {}
+
+    @staticmethod
+    def Ocreer(_strategie, _performance, _pas):
+        """
+            Crée l'optimiseur correspondant à une stratégie
+
+            :param _strategie: String, le nom de la stratégie (cf O_STRATEGIES)
+            :param _performance: double, ratio d'amélioration en dessous duquel la recherche est arrêtée
+            :param _pas: double, l'intervalle de temps entre deux récoltes
+            :return: Optimiseur, l'optimiseur
+        """
+        if _strategie not in Optimiseur.O_STRATEGIES:
+            _log.Lerror("Valeur Argument errone _strategie")
+            raise Exception("Valeur Argument errone _strategie : " + str(_strategie))
+
+        return Optimiseur.O_STRATEGIES[_strategie](_performance, _pas)
+
+    @abc.abstractmethod
+    def Ointervalles(self, _resultats):
+        """
+            Détermine les prochains intervalles à évaluer
+
+            :param _resultats: [dict{String : double, String : int}], les résultats de la simulation (intervalle et
+                durée de vie) dans l'ordre de leur obtention
+            :return: double[], les intervalles à évaluer, dans l'ordre où leurs résultats doivent être ajoutés, une
+                liste vide si la recherche est terminée
+        """
+        raise NotImplementedError
+
+    def Omemoriser(self, _intervalle, _duree_de_vie):
+        """
+            Enregistre la durée de vie obtenue pour un intervalle
+
+            :param _intervalle: double, l'intervalle de changement de rôle
+            :param _duree_de_vie: int, la durée de vie obtenue
+        """
+        self.O_memo[_intervalle] = _duree_de_vie
+
+    def Oconnu(self, _intervalle):
+        """
+            Permet de savoir si un intervalle a déjà été évalué
+
+            :param _intervalle: double, l'intervalle de changement de rôle
+            :return: bool, vrai si la durée de vie de cet intervalle est connue
+        """
+        return _intervalle in self.O_memo
+
+    def Omeilleur(self):
+        """
+            Permet de récupérer le meilleur intervalle évalué
+
+            :return: (double, int), l'intervalle et sa durée de vie, None si aucun intervalle n'a été évalué
+        """
+        if len(self.O_memo) == 0:
+            return None
+        _intervalle = max(self.O_memo, key=self.O_memo.__getitem__)
+        return _intervalle, self.O_memo[_intervalle]
+
+
+class OptimiseurHeuristique(Optimiseur):
+    """
+        class OptimiseurHeuristique
+
+        Stratégie d'origine du simulateur.
+        Le premier tour l'intervalle est nul.
+        Le deuxième tour l'intervalle est positioné arbitrairement à la moitié du résultat du 1er tour
+        Les autres autres se font en deux phases :
+            On compare le résultat du tour précédent avec - la moitié de l'intervalle précédent
+                                                          - l'intervalle précédent plus sa moitié
+            Et on garde le meilleur des trois
+        La recherche s'arrête lorsque la durée de vie n'augmente plus, ou de moins de O_performance.
+    """
+
+    def Ointervalles(self, _resultats):
+        """
+            Détermine les prochains intervalles à évaluer. Les deux intervalles d'une même étape ne dépendent que du
+            meilleur résultat précédent : ils sont donc retournés ensemble, l'intervalle plus sa moitié en premier.
+            Le meilleur des deux derniers résultats est placé en fin de liste.
+
+            :param _resultats: [dict{String : double, String : int}], les résultats de la simulation
+            :return: double[], les intervalles à évaluer, une liste vide si la recherche est terminée
+        """
+        _log.Linfo("Début ## OptimiseurHeuristique.Ointervalles")
+
+        if self.__OmaximumAtteint(_resultats):
+            return []
+
+        # Premier tour
+        if len(_resultats) == 0:
+            return [0]
+        # Deuxième tours
+        elif len(_resultats) == 1:
+            return [_resultats[-1]["resultat"] / 2]
+        # Autres tours
+        else:
+            # Si le nombre de résultats est pair : les deux phases sont passées
+            if len(_resultats) % 2 == 0:
+                if _resultats[-1]["resultat"] < _resultats[-2]["resultat"] and len(_resultats) - 2 != 0:
+                    # On inverse les deux derniers résultats afin d'avoir le meilleur à la fin de la liste
+                    _temp = _resultats[-2]
+                    _resultats.remove(_resultats[-2])
+                    _resultats.append(_temp)
+                return [_resultats[-1]["intervalle"] * 1.5, _resultats[-1]["intervalle"] * 0.5]
+            else:
+                return [_resultats[-2]["intervalle"] * 0.5]
+
+    def __OmaximumAtteint(self, _resultats):
+        """
+            Permet de déterminer si la durée de vie maximale a été atteinte.
+            On estime que la durée maximale a été atteinte si la durée de vie est plus petite que la précédente ou si
+            l'augmentation de la durée de vie par rapport à la précédente ne dépasse pas un paramètre fixé O_performance
+
+            :param _resultats: [dict{String : double, String : int}], les résultats de la simulation
+            :return: bool, vrai si la recherche est terminée
+        """
+        _log.Linfo("Début ## OptimiseurHeuristique.__OmaximumAtteint")
+
+        # Comparaison des deux premières solutions
+        if len(_resultats) == 2:
+
+            _dernier_resultat = _resultats[-1]["resultat"]
+            _avant_dernier_resultat = _resultats[-2]["resultat"]
+
+            if _dernier_resultat <= _avant_dernier_resultat:
+                return True
+
+            _ratio = (_dernier_resultat - _avant_dernier_resultat) / _dernier_resultat
+            if _ratio < self.O_performance:
+                return True
+
+        # Sinon si 4 solutions ont déjà étées réalisées
+        elif len(_resultats) > 4 and len(_resultats) % 2 == 0:
+            _resultat_base = _resultats[-3]["resultat"]
+            _avant_dernier_resultat = _resultats[-2]["resultat"]
+            _dernier_resultat = _resultats[-1]["resultat"]
+
+            if _dernier_resultat <= _resultat_base and _avant_dernier_resultat <= _resultat_base:
+                return True
+
+            _ratio_dernier = (_dernier_resultat - _resultat_base) / _dernier_resultat
+            _ratio_avant_dernier = (_avant_dernier_resultat - _resultat_base) / _avant_dernier_resultat
+            if _ratio_dernier < self.O_performance and _ratio_avant_dernier < self.O_performance:
+                return True
+
+        return False
+
+
+class OptimiseurEncadrement(Optimiseur):
+    """
+        class OptimiseurEncadrement
+
+        Base des stratégies qui maximisent la durée de vie par réduction d'un encadrement (a, b, c), avec
+        f(b) >= f(a) et f(b) >= f(c). Les intervalles sont cherchés parmi les multiples du pas de récolte : un
+        intervalle compris entre deux multiples consécutifs donne la même simulation que le multiple supérieur.
+            - l'intervalle nul (aucun changement de rôle) est évalué en premier, comme référence
+            - on part de la moitié de sa durée de vie, puis on s'éloigne de 0 selon le nombre d'or tant que la durée de
+              vie augmente, pour obtenir un encadrement
+            - l'encadrement est ensuite réduit, un intervalle à la fois, jusqu'à ce qu'il ne contienne plus d'autre
+              multiple du pas que son point central. Le choix du prochain intervalle dépend de la stratégie
+              (OpointSuivant).
+        La borne 0 de l'encadrement représente les intervalles plus petits que le pas, elle n'est jamais évaluée.
+        Comme pour l'heuristique, une amélioration de la durée de vie est jugée significative si elle dépasse
+        O_performance (en ratio de la nouvelle durée de vie). La recherche s'arrête dès que l'éloignement de 0
+        n'apporte plus d'amélioration significative, ou après O_PLATEAU réductions de suite sans amélioration
+        significative du meilleur intervalle, et dans tous les cas après O_EVALUATIONS_MAX intervalles évalués.
+
+        :cvar self.O_NOMBRE_OR : double, le nombre d'or
+        :cvar self.O_EVALUATIONS_MAX : int, nombre maximum d'intervalles évalués par la recherche
+        :cvar self.O_PLATEAU : int, nombre de réductions de suite sans amélioration significative qui arrête la
+            recherche
+    """
+
+    O_NOMBRE_OR = (1 + math.sqrt(5)) / 2
+    # Sur dix réseaux aléatoires, ces deux limites font passer le nombre d'intervalles évalués de 97 à 61, pour une
+    # somme des meilleures durées de vie de 360 au lieu de 370
+    O_EVALUATIONS_MAX = 10
+    O_PLATEAU = 2
+
+    def __init__(self, _performance, _pas):
+        """
+            Constructeur de la classe
+
+            :param _performance: double, ratio d'amélioration en dessous duquel la recherche est arrêtée
+            :param _pas: double, l'intervalle de temps entre deux récoltes
+        """
+        super(OptimiseurEncadrement, self).__init__(_performance, _pas)
+        self.__O_recherche = None
+
+    def Ointervalles(self, _resultats):
+        """
+            Détermine le prochain intervalle à évaluer
+
+            :param _resultats: [dict{String : double, String : int}], les résultats de la simulation
+            :return: double[], l'intervalle à évaluer, une liste vide si la recherche est terminée
+        """
+        _log.Linfo("Début ## " + type(self).__name__ + ".Ointervalles")
+
+        if self.__O_recherche is None:
+            self.__O_recherche = self.__Orecherche()
+        if len(self.O_memo) >= self.O_EVALUATIONS_MAX:
+            return []
+        try:
+            return [next(self.__O_recherche) * self.O_pas]
+        except StopIteration:
+            return []
+
+    @abc.abstractmethod
+    def OpointSuivant(self, _a, _b, _c, _fa, _fb, _fc):
+        """
+            Choisit le prochain multiple du pas à évaluer dans l'encadrement (a, b, c), en nombre de pas.
+            c - a vaut au moins 3.
+
+            :param _a: int, borne inférieure de l'encadrement
+            :param _b: int, point central de l'encadrement
+            :param _c: int, borne supérieure de l'encadrement
+            :param _fa: int, durée de vie en a (None pour la borne 0)
+            :param _fb: int, durée de vie en b
+            :param _fc: int, durée de vie en c
+            :return: int, un entier strictement compris entre a et c, différent de b
+        """
+        raise NotImplementedError
+
+    def OpointSectionDoree(self, _a, _b, _c):
+        """
+            Place un point dans le plus grand des deux segments de l'encadrement, au nombre d'or
+
+            :param _a: int, borne inférieure de l'encadrement
+            :param _b: int, point central de l'encadrement
+            :param _c: int, borne supérieure de l'encadrement
+            :return: int, un entier strictement compris entre a et c, différent de b
+        """
+        _ratio = 2 - self.O_NOMBRE_OR
+        if _c - _b >= _b - _a:
+            return _b + min(_c - _b - 1, max(1, int(round(_ratio * (_c - _b)))))
+        return _b - min(_b - _a - 1, max(1, int(round(_ratio * (_b - _a)))))
+
+    def OameliorationSignificative(self, _nouvelle, _reference):
+        """
+            Permet de savoir si une durée de vie améliore significativement une durée de vie de référence
+
+            :param _nouvelle: int, la nouvelle durée de vie
+            :param _reference: int, la durée de vie de référence
+            :return: bool, vrai si l'augmentation dépasse O_performance
+        """
+        return _nouvelle > _reference and (_nouvelle - _reference) / _nouvelle >= self.O_performance
+
+    def __Oevaluer(self, _pas):
+        """
+            Générateur qui obtient la durée de vie d'un multiple du pas, en le proposant au simulateur si il n'a pas
+            encore été évalué
+
+            :param _pas: int, le nombre de pas
+            :return: int, la durée de vie
+        """
+        if not self.Oconnu(_pas * self.O_pas):
+            yield _pas
+        return self.O_memo[_pas * self.O_pas]
+
+    def __Orecherche(self):
+        """
+            Générateur qui produit, un à un, les intervalles à évaluer (en nombre de pas)
+        """
+        # Intervalle nul, qui sert de référence
+        _f0 = yield from self.__Oevaluer(0)
+
+        _a, _fa = 0, None
+        _b = int(math.ceil(_f0 / 2 / self.O_pas))
+        if _b < 1:
+            return
+        _fb = yield from self.__Oevaluer(_b)
+
+        # Recherche d'un encadrement en s'éloignant de 0
+        _c = _b + max(1, int(round(self.O_NOMBRE_OR * (_b - _a))))
+        _fc = yield from self.__Oevaluer(_c)
+        while _fc > _fb:
+            _a, _fa, _b, _fb = _b, _fb, _c, _fc
+            _c = _b + max(1, int(round(self.O_NOMBRE_OR * (_b - _a))))
+            _fc = yield from self.__Oevaluer(_c)
+
+        # Réduction de l'encadrement
+        _sans_amelioration = 0
+        while _c - _a > 2 and _sans_amelioration < self.O_PLATEAU:
+            _x = self.OpointSuivant(_a, _b, _c, _fa, _fb, _fc)
+            _fx = yield from self.__Oevaluer(_x)
+            if self.OameliorationSignificative(_fx, _fb):
+                _sans_amelioration = 0
+            else:
+                _sans_amelioration += 1
+            if _x > _b:
+                if _fx > _fb:
+                    _a, _fa, _b, _fb = _b, _fb, _x, _fx
+                else:
+                    _c, _fc = _x, _fx
+            else:
+                if _fx > _fb:
+                    _c, _fc, _b, _fb = _b, _fb, _x, _fx
+                else:
+                    _a, _fa = _x, _fx
+
+
+class OptimiseurSectionDoree(OptimiseurEncadrement):
+    """
+        class OptimiseurSectionDoree
+
+        Réduction de l'encadrement par la méthode de la section dorée : le prochain intervalle est placé au nombre d'or
+        dans le plus grand segment. L'encadrement est réduit d'un facteur 0.618 par évaluation.
+    """
+
+    def OpointSuivant(self, _a, _b, _c, _fa, _fb, _fc):
+        """
+            Cf OptimiseurEncadrement.OpointSuivant
+        """
+        return self.OpointSectionDoree(_a, _b, _c)
+
+
+class OptimiseurParabolique(OptimiseurEncadrement):
+    """
+        class OptimiseurParabolique
+
+        Réduction de l'encadrement par interpolation parabolique : le prochain intervalle est le sommet de la parabole
+        qui passe par les trois points de l'encadrement. Si la parabole ne peut pas être utilisée (borne 0 non évaluée,
+        points alignés, sommet hors de l'encadrement ou confondu avec un point déjà connu), un pas de section dorée est
+        effectué à la place.
+    """
+
+    def OpointSuivant(self, _a, _b, _c, _fa, _fb, _fc):
+        """
+            Cf OptimiseurEncadrement.OpointSuivant
+        """
+        if _fa is not None:
+            _numerateur = (_b - _a) ** 2 * (_fb - _fc) - (_b - _c) ** 2 * (_fb - _fa)
+            _denominateur = (_b - _a) * (_fb - _fc) - (_b - _c) * (_fb - _fa)
+            if _denominateur != 0:
+                _x = int(round(_b - 0.5 * _numerateur / _denominateur))
+                if _a < _x < _c and _x != _b:
+                    return _x
+
+        return self.OpointSectionDoree(_a, _b, _c)
+
+
+Optimiseur.O_STRATEGIES = dict({"heuristique": OptimiseurHeuristique,
+                                "section_doree": OptimiseurSectionDoree,
+                                "parabolique": OptimiseurParabolique})
@@ -0,0 +1,172 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module ReparateurRoutes
+
+    Module contenant la classe utilisée pour réparer le routage d'un réseau à la mort d'un capteur, sans refaire la
+    configuration topologique : ReparateurRoutes
+
+"""
+
+from collections import deque
+
+from Modele.Roles import Roles
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class ReparateurRoutes:
+    """
+        class ReparateurRoutes
+
+        Lorsqu'un capteur meurt entre deux changements de rôle, tous les noeuds dont la chaîne de routage passe par lui
+        (son sous-arbre de routage) sont coupés du puit jusqu'à la configuration topologique suivante. Plutôt que de
+        refaire toute la configuration, seul ce sous-arbre est rattaché : chacun de ses noeuds est routé vers le puit
+        si il en est voisin, sinon vers le voisin dominant vivant, hors du sous-arbre, qui a le plus de batterie (le
+        dernier en cas d'égalité, comme dans Simulateur.SdeterminationRoutage). Un noeud rattaché emmène avec lui son
+        propre sous-arbre, les autres noeuds sont réessayés tant que des rattachements ont lieu. Les noeuds qui n'ont
+        pu être rattachés sont routés vers eux-mêmes, ce qui les déconnecte (cf Simulateur.SfinDeVieAtteinte) : ils
+        n'envoient plus de données vers le sous-arbre mort et ne sont plus proposés comme parents.
+
+        Les enfants de chaque noeud dans l'arbre de routage (index inverse des routes) et les voisins dominants de
+        chaque noeud (parents candidats) sont conservés jusqu'au changement d'ensemble dominant : une réparation ne
+        parcourt que le sous-arbre orphelin et le voisinage de ses noeuds.
+
+        :var self.RP_ensemble_dominant : Graphe NetworkX, l'ensemble dominant pour lequel les index ont été construits
+        :var self.RP_adjacence : AdjacencyView NetworkX, l'adjacence du graphe du réseau
+        :var self.RP_enfants : dict{int : int[]}, les noeuds qui routent leurs données vers chaque noeud
+        :var self.RP_candidats : dict{int : int[]}, les voisins dominants de chaque noeud, calculés à la demande
+        :var self.RP_noeuds_rattaches : int, le nombre de noeuds rattachés depuis la création
+        :var self.RP_noeuds_isoles : int, le nombre de noeuds qui n'ont pu être rattachés depuis la création
+    """
+
+    def __init__(self):
+        """
+            Constructeur de la classe
+        """
+        _log.Linfo("Init -- ReparateurRoutes")
+
+        self.RP_ensemble_dominant = None
+        self.RP_adjacence = None
+        self.RP_enfants = dict()
+        self.RP_candidats = dict()
+        self.RP_noeuds_rattaches = 0
+        self.RP_noeuds_isoles = 0
+
+    def RPindexer(self, _reseau):
+        """
+            Construit l'index inverse des routes du réseau et vide le cache des parents candidats
+
+            :param _reseau: Reseau, le réseau configuré
+        """
+        _log.Linfo("Début ## ReparateurRoutes.RPindexer")
+
+        _noeuds = _reseau.R_graphe.nodes
+        self.RP_ensemble_dominant = _reseau.R_ensemble_dominant
+        self.RP_adjacence = _reseau.R_graphe.adj
+        self.RP_enfants = {_noeud: [] for _noeud in _noeuds}
+        self.RP_candidats = dict()
+        for _noeud in _noeuds:
+            _route = _noeuds[_noeud]['route']
+            if _route != _noeud and _route in self.RP_enfants:
+                self.RP_enfants[_route].append(_noeud)
+
+    def RPreparer(self, _reseau, _morts):
+        """
+            Rattache les sous-arbres de routage des capteurs morts
+
+            :param _reseau: Reseau, le réseau à réparer, modifié sur place
+            :param _morts: int[], les capteurs morts depuis la dernière réparation
+            :return:    int, le nombre de noeuds rattachés
+                        int, le nombre de noeuds qui n'ont pu être rattachés, désormais déconnectés
+        """
+        _log.Linfo("Début ## ReparateurRoutes.RPreparer")
+
+        if self.RP_ensemble_dominant is not _reseau.R_ensemble_dominant:
+            self.RPindexer(_reseau)
+
+        _noeuds = _reseau.R_graphe.nodes
+
+        # Sous-arbres orphelins, dans l'ordre d'un parcours en largeur depuis chaque capteur mort. Les capteurs morts
+        # qu'ils contiennent sont traversés mais pas rattachés
+        _orphelins = []
+        _en_attente = set()
+        _visites = set(_morts)
+        for _mort in _morts:
+            _file = deque(self.RP_enfants.get(_mort, []))
+            while _file:
+                _noeud = _file.popleft()
+                if _noeud in _visites:
+                    continue
+                _visites.add(_noeud)
+                _file.extend(self.RP_enfants[_noeud])
+                if _noeuds[_noeud]['batterie'] > 0:
+                    _orphelins.append(_noeud)
+                    _en_attente.add(_noeud)
+
+        _rattaches = 0
+        _progression = True
+        while _en_attente and _progression:
+            _progression = False
+            for _noeud in _orphelins:
+                if _noeud not in _en_attente:
+                    continue
+                _parent = self.__RPmeilleurParent(_noeuds, _noeud, _en_attente)
+                if _parent is None:
+                    continue
+
+                self.RP_enfants[_noeuds[_noeud]['route']].remove(_noeud)
+                self.RP_enfants[_parent].append(_noeud)
+                _noeuds[_noeud]['route'] = _parent
+                _rattaches += 1
+                _progression = True
+
+                # Le sous-arbre du noeud rattaché est de nouveau relié au puit
+                _file = [_noeud]
+                while _file:
+                    _rattache = _file.pop()
+                    if _rattache in _en_attente:
+                        _en_attente.discard(_rattache)
+                        _file.extend(self.RP_enfants[_rattache])
+
+        # Les noeuds restés orphelins sont déconnectés : leur route vers le sous-arbre mort est supprimée
+        for _noeud in _orphelins:
+            if _noeud in _en_attente:
+                self.RP_enfants[_noeuds[_noeud]['route']].remove(_noeud)
+                _noeuds[_noeud]['route'] = _noeud
+
+        self.RP_noeuds_rattaches += _rattaches
+        self.RP_noeuds_isoles += len(_en_attente)
+        return _rattaches, len(_en_attente)
+
+    def __RPmeilleurParent(self, _noeuds, _noeud, _en_attente):
+        """
+            Choisit le parent vers lequel rattacher un noeud orphelin
+
+            :param _noeuds: NodeView NetworkX, les noeuds du graphe
+            :param _noeud: int, le noeud orphelin
+            :param _en_attente: set(int), les noeuds orphelins pas encore rattachés
+            :return: int, le parent, None si aucun voisin ne convient (les noeuds déconnectés, routés vers
+                eux-mêmes, sont écartés)
+        """
+        if _noeud not in self.RP_candidats:
+            _dominants = self.RP_ensemble_dominant.nodes
+            self.RP_candidats[_noeud] = [_voisin for _voisin in self.RP_adjacence[_noeud]
+                                         if _voisin in _dominants]
+
+        _meilleur = None
+        _meilleure_energie = 0
+        for _voisin in self.RP_candidats[_noeud]:
+            if _voisin in _en_attente:
+                continue
+            if _noeuds[_voisin]['role'] == Roles.PUIT:
+                return _voisin
+            if _noeuds[_voisin]['route'] == _voisin:
+                continue
+            if _noeuds[_voisin]['batterie'] > 0 and _meilleure_energie <= _noeuds[_voisin]['batterie']:
+                _meilleure_energie = _noeuds[_voisin]['batterie']
+                _meilleur = _voisin
+        return _meilleur
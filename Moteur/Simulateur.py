@@ -9,18 +9,34 @@
 
 """
 
+import pickle
+import sys
 import time
-import copy
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import networkx as nx
 import math
+import numpy as np
 from networkx.algorithms.approximation import dominating_set
-from networkx.algorithms.shortest_paths.generic import shortest_path, has_path
 
 from Modele.Roles import Roles
 from Modele.Signaux import Signaux
-from Controleur.FileManager import FileManager
-from Controleur.Log import Log
+from Moteur.Accessibilite import Accessibilite
+from Moteur.AnalyseEtat import AnalyseEtat
+from Moteur.CacheConfiguration import CacheConfiguration
+from Moteur.FusionFragments import FusionFragments
+from Moteur.MainteneurDominant import MainteneurDominant
+from Moteur.ModeleEnergie import ModeleEnergie
+from Moteur.MoteurEnergie import MoteurEnergie
+from Moteur.Optimiseur import Optimiseur
+from Moteur.ReparateurRoutes import ReparateurRoutes
+from Moteur.SimulationLot import SimulationLot
+from Utilitaires.Connecteur import Connecteur
+from Utilitaires.FileManager import FileManager
+from Utilitaires.JournalSimulation import JournalSimulation
+from Utilitaires.Log import Log
 
 _log = Log()
 
@@ -33,27 +49,91 @@ class Simulateur:
         La plupart des méthodes sont déclarées statiques et la méthode principale est SlancerSimulation qui
         lie par cascade l'ensemble des méthodes. Cf diagramme de cas d'utilisation pour le cas général
 
-        :var self.S_connecteur : QtCore.pyqtSignal, Utilisé par Simulateur pour notifier le controleur de l'avancement
-        de la simulation
+        :var self.S_connecteur : QtCore.pyqtSignal ou Connecteur, Utilisé par Simulateur pour notifier le controleur de
+        l'avancement de la simulation
         :var self.S_resultats : [dict{String : double, String : int}], l'ensemble des résultats de la simulation, cad
             intervalle de temps utilisé associé à la durée de vie obtenue lors de la simulation
         :var self.S_duree_simulation : int, variable utilisée pour connaitre la durée de la simulation (en unité de
             temps) du début à la fin de celle-ci.
         :var self.S_duree_de_vie : int, utilisée pour stocker la durée de vie du réseau
+        :var self.S_nouveaux_capteurs_vides : int[], les capteurs tombés à court d'énergie lors de la dernière
+            simulation de consommation, None si le moteur utilisé ne permet pas de le savoir
+        :var self.S_verifications_evitees : int, le nombre de vérifications de fin de vie qui n'ont pas été refaites
+            car aucun capteur n'est mort et aucun changement de rôle n'a eu lieu depuis la précédente
+        :var self.S_points_de_reprise : dict{int : dict{String : Objet}}, les points de reprise de la simulation en
+            cours, par pas d'intervalle (cf SpointDeReprise)
+        :var self.S_tours_reutilises : int, le nombre de récoltes qui n'ont pas été simulées car reprises depuis un
+            point de reprise
+        :var self.S_mainteneur_dominant : MainteneurDominant, conserve l'arbre dominant d'une configuration
+            topologique à la suivante
+        :var self.S_cache_configuration : CacheConfiguration, les dernières configurations topologiques calculées,
+            None si S_taille_cache_configuration est nul
+        :var self.S_compteurs_cache : dict{String : int}, le nombre de configurations reprises du cache (succes) et
+            calculées (echecs) par les caches des processus séparés (cf SsimulerCycleIsole)
+        :var self.S_noeuds_rattaches : int, le nombre de noeuds dont la route a été réparée à la mort d'un capteur
+        :var self.S_moteur_energie : MoteurEnergie, le moteur de consommation construit pour la configuration
+            topologique courante (rôles, routes et longueurs des liens), None s'il doit être reconstruit
+        :var self.S_emissions : dict{int : double}, la consommation d'une émission de chaque noeud pour la
+            configuration topologique courante (consommation non vectorielle), None si elle doit être recalculée
 
         :cvar self.S_intervalle_recolte : int, Temps entre chaque récolte d'information
         :cvar self.S_intervalle_roulement : int, Temps entre chaque changement de rôle
         :cvar self.S_unite_consommation_emission : double, Consommation énergétique d'une émission de données par un
-            capteur
+            capteur (hors amplification pour le modèle radio du premier ordre)
         :cvar self.S_unite_consommation_reception : double, Consommation énergétique d'une réception de données par un
             capteur
         :cvar self.S_unite_consommation_recolte : double, Consommation énergétique d'une récolte de données par un
             capteur
+        :cvar self.S_modele_energie : String, nom du modèle de consommation énergétique (cf ModeleEnergie.MEN_MODELES)
+        :cvar self.S_radio_amplification : double, Consommation de l'amplificateur par unité de distance à la
+            puissance S_radio_exposant, pour le modèle radio du premier ordre
+        :cvar self.S_radio_exposant : double, Exposant d'atténuation du signal avec la distance, pour le modèle radio du
+            premier ordre
         :cvar self.S_fin_de_vie : double, Pourcentage de réseaux connectés au puit à partir duquel on considère que la
             fin de vie du réseau est atteinte (compris entre 0 et 1)
-        :cvar self.S_performance : double, Ratio qui détermine à partir de quand arrêter la simulation. Utilisé dans la méthode
-            __SmaximumAtteint, si l'augmentation de durée de vie par rapport à la valeur précédente ne dépasse pas
+        :cvar self.S_performance : double, Ratio qui détermine à partir de quand arrêter la simulation. Utilisé par
+            OptimiseurHeuristique, si l'augmentation de durée de vie par rapport à la valeur précédente ne dépasse pas
             (S_performances x 100)% on arrête la simulation
+        :cvar self.S_strategie_optimisation : String, nom de la stratégie de recherche de l'intervalle de changement de
+            rôle (cf Optimiseur.O_STRATEGIES)
+        :cvar self.S_consommation_vectorielle : bool, vrai si la consommation énergétique est simulée par le moteur
+            vectoriel MoteurEnergie, faux pour la simulation paquet par paquet d'origine
+        :cvar self.S_saut_evenements : bool, vrai si, entre deux changements de rôle, la simulation saute directement
+            au prochain événement (mort d'un capteur ou changement de rôle) au lieu d'avancer récolte par récolte
+        :cvar self.S_verification_incrementale : bool, vrai si la fin de vie n'est vérifiée à nouveau que lorsqu'un
+            capteur est mort ou qu'un changement de rôle a eu lieu depuis la dernière vérification
+        :cvar self.S_evaluation_parallele : bool, vrai si les intervalles candidats d'une même étape de la recherche
+            de l'intervalle sont simulés en même temps dans des processus séparés
+        :cvar self.S_evaluation_lot : bool, vrai si, lorsqu'ils ne sont pas évalués en parallèle, les intervalles
+            candidats d'une même étape sont simulés ensemble par SimulationLot (batteries de tous les candidats dans une
+            même matrice NumPy). Non utilisé avec S_reparation_routes
+        :cvar self.S_nombre_processus : int, nombre maximum de processus pour l'évaluation parallèle, None pour
+            utiliser tous les processeurs
+        :cvar self.S_enregistrer_etats : bool, vrai si les états intermédiaires du réseau sont enregistrés sur disque
+            pendant la simulation, faux pour ne garder que les statistiques (exécution en lot)
+        :cvar self.S_ponderation_batterie : bool, vrai si l'ensemble dominant est calculé avec des noeuds pondérés par
+            l'inverse de leur niveau de batterie (cf SactualisationPoids), afin d'écarter les capteurs les plus faibles
+        :cvar self.S_seuil_reparation_dominant : int, nombre maximum de capteurs morts depuis la configuration
+            topologique précédente pour lequel l'arbre dominant est réparé localement plutôt que recalculé (cf
+            MainteneurDominant), 0 pour ne réutiliser que l'arbre identique
+        :cvar self.S_seuil_epuisement_dominant : float, fraction du niveau de batterie moyen des capteurs en vie sous
+            laquelle un dominant est retiré de l'arbre réparé (cf MainteneurDominant), 0 pour ne retirer que les
+            dominants morts
+        :cvar self.S_taille_cache_configuration : int, nombre maximum de configurations topologiques conservées
+            (cf CacheConfiguration), 0 pour ne pas en conserver. Le cache n'est pas utilisé si l'arbre dominant est
+            réparé (S_seuil_reparation_dominant non nul)
+        :cvar self.S_pas_batterie_cache : float, largeur des tranches de niveau de batterie des clés du cache des
+            configurations, 0 pour ne reprendre une configuration que pour des niveaux identiques
+        :cvar self.S_reparation_routes : bool, vrai si, à la mort d'un capteur entre deux changements de rôle, les
+            noeuds qui routaient leurs données à travers lui sont rattachés au reste de l'arbre de routage (cf
+            ReparateurRoutes), faux pour attendre la configuration topologique suivante
+        :cvar self.S_reprise_prefixe : bool, vrai si chaque cycle reprend depuis le point de reprise qui partage avec
+            lui le plus long préfixe, au lieu d'être simulé depuis l'état initial
+        :cvar self.S_PARAMETRES : (String), les paramètres de simulation transmis aux processus de l'évaluation
+            parallèle
+        :cvar self.S_periode_journal : int, nombre de cycles simulés entre deux points de contrôle du journal qui
+            permet de reprendre une simulation interrompue (cf SreprendreSimulation), 0 pour ne pas tenir de journal
+        :cvar self.S_PARAMETRES_JOURNAL : (String), les paramètres de simulation enregistrés dans le journal
 
     """
     # TODO : demander les paramètres suivants à l'utilisateur à travers une fenêtre intermédiaire comme  FenetreCreation
@@ -67,33 +147,107 @@ class Simulateur:
     S_unite_consommation_reception = 0.025
     # Consommation énergétique d'une récolte de données
     S_unite_consommation_recolte = 0.005
+    # Modèle de consommation énergétique : "fixe" ou "premier_ordre" (coût d'émission croissant avec la distance)
+    S_modele_energie = "fixe"
+    # Consommation de l'amplificateur et exposant d'atténuation du modèle radio du premier ordre
+    S_radio_amplification = 0.0001
+    S_radio_exposant = 2
     # Pourcentage de réseaux connectés au puit à partir duquel on considère que la fin de vie du réseau est atteinte
     S_fin_de_vie = 0.1
     # Variable utilisée pour stocker la durée de vie du réseau
     S_duree_de_vie = 0
-    # Ratio qui détermine à partir de quand arrêter la simulation. Utilisé dans __SmaximumAtteint, si l'augmentation
+    # Ratio qui détermine à partir de quand arrêter la simulation. Utilisé par OptimiseurHeuristique, si l'augmentation
     # de durée de vie par rapport à la valeur précédente ne dépasse pas (S_performances x 100)% on arrête la simulation
     S_performance = 0.10
+    # Stratégie de recherche de l'intervalle de changement de rôle : "heuristique", "section_doree" ou "parabolique"
+    S_strategie_optimisation = "heuristique"
+    # Utilisation du moteur de consommation vectoriel (tableaux NumPy) plutôt que de la simulation paquet par paquet
+    S_consommation_vectorielle = True
+    # Saut direct au prochain événement (mort d'un capteur ou changement de rôle) entre deux récoltes
+    S_saut_evenements = True
+    # Vérification de la fin de vie uniquement lorsqu'un capteur est mort ou que les rôles ont changé
+    S_verification_incrementale = True
+    # Simulation simultanée, dans des processus séparés, des intervalles candidats d'une même étape de recherche
+    S_evaluation_parallele = True
+    # Simulation vectorielle simultanée des intervalles candidats lorsqu'ils ne sont pas évalués en parallèle.
+    # Désactivée par défaut : elle n'est pas plus rapide que la simulation des cycles l'un après l'autre
+    S_evaluation_lot = False
+    # Nombre maximum de processus utilisés pour l'évaluation parallèle (None : nombre de processeurs de la machine)
+    S_nombre_processus = None
+    # Enregistrement sur disque des états intermédiaires du réseau
+    S_enregistrer_etats = True
+    # Pondération de l'ensemble dominant par l'inverse du niveau de batterie des capteurs
+    S_ponderation_batterie = True
+    # Nombre maximum de capteurs morts pour lequel l'arbre dominant est réparé plutôt que recalculé
+    S_seuil_reparation_dominant = 0
+    # Fraction du niveau de batterie moyen sous laquelle un dominant est retiré de l'arbre réparé
+    S_seuil_epuisement_dominant = 0.25
+    # Nombre maximum de configurations topologiques conservées, et largeur des tranches de batterie de leurs clés
+    S_taille_cache_configuration = 64
+    S_pas_batterie_cache = 0
+    # Réparation locale du routage à la mort d'un capteur, entre deux changements de rôle
+    S_reparation_routes = False
+    # Reprise des cycles depuis l'état atteint par un cycle précédent avant son premier changement de rôle
+    S_reprise_prefixe = True
+    # Paramètres transmis aux processus de l'évaluation parallèle
+    S_PARAMETRES = ("S_intervalle_recolte", "S_unite_consommation_emission", "S_unite_consommation_reception",
+                    "S_unite_consommation_recolte", "S_fin_de_vie", "S_consommation_vectorielle", "S_saut_evenements",
+                    "S_verification_incrementale", "S_reprise_prefixe", "S_ponderation_batterie",
+                    "S_seuil_reparation_dominant", "S_seuil_epuisement_dominant",
+                    "S_reparation_routes", "S_taille_cache_configuration", "S_pas_batterie_cache",
+                    "S_modele_energie", "S_radio_amplification", "S_radio_exposant")
+    # Nombre de cycles simulés entre deux points de contrôle du journal de la simulation
+    S_periode_journal = 1
+    # Paramètres enregistrés dans le journal, restaurés à la reprise d'une simulation interrompue
+    S_PARAMETRES_JOURNAL = S_PARAMETRES + ("S_performance", "S_strategie_optimisation", "S_enregistrer_etats")
 
     def __init__(self, _connecteur):
         """
             Initialisateur de la classe
 
-        :param _connecteur: pyqtSignal, connecteur qui permet d'informer le controleur de l'avancement de la simulation
+        :param _connecteur: pyqtSignal ou Connecteur, connecteur qui permet d'informer le controleur de l'avancement de
+            la simulation, None pour ne notifier personne
         """
         super(Simulateur, self).__init__()
 
         _log.Linfo("Init -- Simulateur")
 
-        self.S_connecteur = _connecteur
+        # Sans connecteur (exécution sans interface), les notifications ne sont transmises à personne
+        self.S_connecteur = _connecteur if _connecteur is not None else Connecteur()
         self.S_resultats = []
         self.S_duree_simulation = 0
+        self.S_nouveaux_capteurs_vides = None
+        self.S_verifications_evitees = 0
+        self.S_points_de_reprise = dict()
+        self.S_tours_reutilises = 0
+        self.S_mainteneur_dominant = MainteneurDominant(self.S_seuil_reparation_dominant,
+                                                        self.S_seuil_epuisement_dominant)
+        self.S_cache_configuration = None
+        if self.S_taille_cache_configuration > 0:
+            self.S_cache_configuration = CacheConfiguration(self.S_taille_cache_configuration,
+                                                            self.S_pas_batterie_cache)
+        self.S_compteurs_cache = dict({"succes": 0, "echecs": 0})
+        self.S_noeuds_rattaches = 0
+        self.S_moteur_energie = None
+        self.S_emissions = None
 
     def SlancerSimulation(self, _reseau, _show_html):
         """
             Permet de lancer le processus de simulation de la vie du réseau. Cf diagramme d'activité pour connaitre son
             fonctionnement algorithmique.
 
+            Le réseau est simulé sur place : son état initial est capturé puis restauré au début de chaque cycle. À
+            la fin de la simulation il contient l'état du réseau à la fin du dernier cycle.
+            Lorsqu'une étape de la recherche de l'intervalle propose plusieurs intervalles candidats, ils peuvent être
+            simulés en même temps dans des processus séparés (S_evaluation_parallele). Les états enregistrés par chaque
+            processus sont ensuite rejoués dans l'ordre des candidats, comme si les cycles avaient été simulés l'un
+            après l'autre. Sans évaluation parallèle, ils peuvent aussi être simulés ensemble dans le processus courant
+            par SimulationLot (S_evaluation_lot) puis rejoués de la même manière.
+            Un cycle simulé seul ou dans un processus séparé reprend depuis le point de reprise qui partage avec lui le
+            plus long préfixe (S_reprise_prefixe, cf SpointDeReprise).
+            Un journal des points de contrôle de la simulation est tenu en local (S_periode_journal, cf
+            __SsimulerIntervalles) : si elle est interrompue, elle peut être poursuivie par SreprendreSimulation.
+
             :param _reseau: Reseau, le réseau à traiter
             :param _show_html: bool, Permet de définir si l'état du réseau doit être affiché pendant la simulation
 
@@ -110,190 +264,706 @@ class Simulateur:
             _log.Lerror("Valeur Argument errone _show_html")
             raise Exception("Valeur Argument errone _show_html")
 
+        # Chrono pour savoir combien de temps la simulation a durée
+        _start = time.time()
+
+        self.__SinitialiserCycles()
+        _optimiseur = Optimiseur.Ocreer(self.S_strategie_optimisation, self.S_performance, self.S_intervalle_recolte)
+        _journal = None
+        if self.S_periode_journal > 0:
+            from Controleur.Statistiques import Statistiques
+            _parametres = {_nom: getattr(Simulateur, _nom) for _nom in self.S_PARAMETRES_JOURNAL}
+            # Le réseau est sérialisé tout de suite, avant d'être modifié par le premier cycle
+            _journal = JournalSimulation(FileManager().FMobtenirCheminJournal(),
+                                         dict({"reseau": _reseau,
+                                               "parametres": _parametres,
+                                               "resultats": [dict(_resultat) for _resultat in self.S_resultats],
+                                               "etats": len(FileManager().FMlisterEtats()),
+                                               "statistiques": Statistiques().SextraireDonnees()}))
+
+        return self.__SsimulerIntervalles(_reseau, _show_html, _start, _optimiseur, _journal,
+                                          dict({"cycle": 0, "compteurs": dict({"etat": 0, "total": 1}),
+                                                "intervalles": []}))
+
+    def SreprendreSimulation(self, _show_html):
+        """
+            Reprend la simulation interrompue dont le journal (cf S_periode_journal) est enregistré en local, depuis son
+            dernier point de contrôle : paramètres de simulation, résultats de la recherche de l'intervalle, numéro de
+            cycle, statistiques et réseau y sont restaurés, les états enregistrés après ce point sont supprimés puis la
+            simulation continue comme si elle n'avait pas été interrompue.
+
+            :param _show_html: bool, Permet de définir si l'état du réseau doit être affiché pendant la simulation
+
+            :return: Reseau, le réseau une fois traité, None si aucune simulation interrompue n'a été trouvée
+        """
+        _log.Linfo("Début ## Simulateur.SreprendreSimulation")
+
+        if type(_show_html) is not bool:
+            _log.Lerror("Valeur Argument errone _show_html")
+            raise Exception("Valeur Argument errone _show_html")
+
         from Controleur.Statistiques import Statistiques
-        _statistiques = Statistiques()
         _file_manager = FileManager()
+        _entete, _points_de_controle, _taille = JournalSimulation.JSlire(_file_manager.FMobtenirCheminJournal())
+        if _entete is None:
+            _log.Linfo("Info ## Aucune simulation à reprendre")
+            return None
 
-        # Chrono pour savoir combien de temps la simulation a durée
         _start = time.time()
 
-        _dernier_roulement = 0
-        _reseau_simulation = _reseau
+        # Les paramètres sont reportés sur la classe car certaines méthodes statiques les lisent directement
+        for _nom, _valeur in _entete["parametres"].items():
+            setattr(Simulateur, _nom, _valeur)
+        self.__SinitialiserCycles()
+        _optimiseur = Optimiseur.Ocreer(self.S_strategie_optimisation, self.S_performance, self.S_intervalle_recolte)
+
+        _reseau = _entete["reseau"]
+        _statistiques = Statistiques()
+        _statistiques.SviderEtats(_garder_etat_initial=False)
+        _statistiques.SajouterExtrait(_entete["statistiques"])
+        for _point in _points_de_controle:
+            _statistiques.SajouterExtrait(_point["statistiques"])
+
+        self.S_resultats = [dict(_resultat) for _resultat in _entete["resultats"]]
+        _avancement = dict({"cycle": 0, "compteurs": dict({"etat": 0, "total": 1}), "intervalles": []})
+        if len(_points_de_controle) > 0:
+            _dernier = _points_de_controle[-1]
+            self.S_resultats = [dict(_resultat) for _resultat in _dernier["resultats"]]
+            self.S_duree_simulation = _dernier["duree_simulation"]
+            self.S_verifications_evitees = _dernier["verifications_evitees"]
+            self.S_tours_reutilises = _dernier["tours_reutilises"]
+            self.S_noeuds_rattaches = _dernier["noeuds_rattaches"]
+            _avancement = dict({"cycle": _dernier["cycle"], "compteurs": dict(_dernier["compteurs"]),
+                                "intervalles": list(_dernier["intervalles"]), "etat": _dernier["etat"]})
+        # La recherche de l'intervalle ne dépend que des durées de vie déjà obtenues
+        for _resultat in self.S_resultats:
+            _optimiseur.Omemoriser(_resultat["intervalle"], _resultat["resultat"])
+
+        if self.S_enregistrer_etats:
+            _file_manager.FMtronquerEtats(_entete["etats"] + _avancement["compteurs"]["etat"])
+
+        _log.Linfo("Info ## Reprise de la simulation au cycle " + str(_avancement["cycle"]))
+
+        _journal = JournalSimulation(_file_manager.FMobtenirCheminJournal(), _taille=_taille)
+        return self.__SsimulerIntervalles(_reseau, _show_html, _start, _optimiseur, _journal, _avancement)
+
+    def __SinitialiserCycles(self):
+        """
+            Remet à zéro le temps simulé, les compteurs et les structures conservées d'un cycle à l'autre
+        """
         self.S_duree_simulation = 0
         self.S_duree_de_vie = 0
         self.S_intervalle_roulement = 0
+        self.S_verifications_evitees = 0
+        self.S_points_de_reprise = dict()
+        self.S_tours_reutilises = 0
+        self.S_mainteneur_dominant = MainteneurDominant(self.S_seuil_reparation_dominant,
+                                                        self.S_seuil_epuisement_dominant)
+        self.S_cache_configuration = None
+        if self.S_taille_cache_configuration > 0:
+            self.S_cache_configuration = CacheConfiguration(self.S_taille_cache_configuration,
+                                                            self.S_pas_batterie_cache)
+        self.S_compteurs_cache = dict({"succes": 0, "echecs": 0})
+        self.S_noeuds_rattaches = 0
+        self.S_moteur_energie = None
+        self.S_emissions = None
+
+    def __SsimulerIntervalles(self, _reseau, _show_html, _start, _optimiseur, _journal, _avancement):
+        """
+            Boucle principale de SlancerSimulation et SreprendreSimulation : simule les intervalles proposés par
+            l'optimiseur jusqu'à la fin de la recherche, puis enregistre le dernier état et les statistiques.
+
+            Tous les S_periode_journal cycles simulés, un point de contrôle est déposé dans le journal. Il ne contient
+            que ce qui a changé depuis le précédent : les statistiques ajoutées depuis, et le réseau à la fin du cycle
+            (Reseau.RcaptureEtat), les résultats de la recherche et les intervalles restant à évaluer dans l'étape en
+            cours, qui ne représentent que quelques valeurs. Le journal est supprimé à la fin de la simulation.
+
+            :param _reseau: Reseau, le réseau à traiter, dans son état initial
+            :param _show_html: bool, Permet de définir si l'état du réseau doit être affiché pendant la simulation
+            :param _start: float, le début de la simulation (time.time)
+            :param _optimiseur: Optimiseur, la recherche de l'intervalle, qui connaît les résultats de S_resultats
+            :param _journal: JournalSimulation, le journal de la simulation, None pour ne pas en tenir
+            :param _avancement: dict{String : Objet}, le numéro du prochain cycle (cycle), les compteurs d'états
+                (compteurs), les intervalles restant à évaluer dans l'étape en cours (intervalles) et, lors d'une
+                reprise, le réseau à la fin du dernier cycle (etat)
+
+            :return: Reseau, le réseau une fois traité
+        """
+        from Controleur.Statistiques import Statistiques
+        _statistiques = Statistiques()
+        _file_manager = FileManager()
+
+        # Seules les parties du réseau modifiées par la simulation sont sauvegardées pour être restaurées à chaque cycle
+        _etat_initial = _reseau.RcaptureEtat()
+        _reseau_simulation = _reseau
+        if "etat" in _avancement:
+            _reseau.RrestaurerEtat(_avancement["etat"])
         # Initialisation des compteurs
-        _etat = 0
-        _total = 1
-        _cycle = 0
+        _compteurs = _avancement["compteurs"]
+        _cycle = _avancement["cycle"]
+        _executeur = None
+        # Données des statistiques déjà enregistrées dans le journal
+        _statistiques_journal = dict({"etats": _statistiques.S_nombre_etats,
+                                      "resultats": len(_statistiques.S_resultats)})
+
+        try:
+            _intervalles = _avancement["intervalles"]
+            if not _intervalles:
+                _intervalles = _optimiseur.Ointervalles(self.S_resultats)
+            while _intervalles:
+
+                # Seuls les intervalles qui n'ont encore jamais été simulés sont évalués en parallèle ou en lot
+                _resultats_precalcules = None
+                _a_simuler = [_intervalle for _intervalle in dict.fromkeys(_intervalles)
+                              if not _optimiseur.Oconnu(_intervalle)]
+                if self.S_evaluation_parallele and len(_a_simuler) > 1:
+                    _reseau.RrestaurerEtat(_etat_initial)
+                    _executeur, _resultats_precalcules = self.__SevaluationParallele(_executeur, _reseau, _a_simuler)
+                if _resultats_precalcules is None and self.S_evaluation_lot and self.S_consommation_vectorielle \
+                        and not self.S_reparation_routes and len(_a_simuler) > 1:
+                    _reseau.RrestaurerEtat(_etat_initial)
+                    _resultats_precalcules = dict(zip(_a_simuler, SimulationLot(self, _reseau, _a_simuler).SLsimuler()))
+
+                for _rang, _intervalle in enumerate(_intervalles, 1):
+
+                    # Intervalle déjà simulé : sa durée de vie est connue, il n'est pas simulé une seconde fois
+                    if _optimiseur.Oconnu(_intervalle):
+                        _log.Linfo("Info ## Intervalle " + str(_intervalle) + " déjà simulé")
+                        self.S_resultats.append(dict({"intervalle": _intervalle,
+                                                      "resultat": _optimiseur.O_memo[_intervalle]}))
+                        continue
+
+                    _log.Linfo("Info ## Cycle " + str(_cycle))
+
+                    self.S_connecteur.emit(Signaux.INITIALISATION_SIMULATION, dict())
+
+                    _reseau.RrestaurerEtat(_etat_initial)
+                    self.S_intervalle_roulement = _intervalle
+
+                    _text_progression = "Simulation en cours.. " \
+                                        "\nCycle " + str(_cycle) + \
+                                        "\nintervalle utilisé : " + str(self.S_intervalle_roulement) + \
+                                        " unité(s) de temps"
+                    self.S_connecteur.emit(Signaux.PROGRESSION_SIMULATION, dict({"avancee": 0,
+                                                                                 "text": _text_progression}))
+
+                    _enregistrer_etat = self.__SenregistreurEtats(_cycle, _compteurs, _show_html, _statistiques,
+                                                                  _file_manager)
+                    if _resultats_precalcules is None:
+                        _reseau_simulation = self.SsimulerCycle(_reseau, _intervalle, _enregistrer_etat,
+                                                                self.__Sprogression(_reseau, _text_progression),
+                                                                self.SpointDeReprise(_intervalle))
+                    else:
+                        _reseau_simulation = self.__SrejouerCycle(_reseau, _resultats_precalcules[_intervalle],
+                                                                  _enregistrer_etat)
+
+                    # La fin de vie du réseau a été atteinte, on sauvegarde le résultat et on recommence avec un nouvel
+                    # intervalle
+                    self.S_resultats.append(dict({"intervalle": self.S_intervalle_roulement,
+                                                  "resultat": self.S_duree_de_vie}))
+                    _statistiques.SajouterResultat(self.S_intervalle_roulement, self.S_duree_de_vie)
+                    _optimiseur.Omemoriser(self.S_intervalle_roulement, self.S_duree_de_vie)
+
+                    # On met la barre de progression à 100%
+                    self.S_connecteur.emit(Signaux.PROGRESSION_SIMULATION, dict({"avancee": 100,
+                                                                                 "text": _text_progression}))
+
+                    # Pour séparer les résultats d'un cycle à lautre
+                    self.S_duree_simulation += self.S_intervalle_recolte * 100
+                    _cycle += 1
+
+                    # Point de contrôle : seules les statistiques ajoutées depuis le précédent sont copiées, l'écriture
+                    # est faite en tâche de fond par le journal
+                    if _journal is not None and _cycle % self.S_periode_journal == 0:
+                        _extrait = _statistiques.SextraireDonnees(_statistiques_journal["etats"],
+                                                                  _statistiques_journal["resultats"])
+                        _statistiques_journal["etats"] = _statistiques.S_nombre_etats
+                        _statistiques_journal["resultats"] = len(_statistiques.S_resultats)
+                        _journal.JSajouter(dict({"cycle": _cycle,
+                                                 "compteurs": dict(_compteurs),
+                                                 "intervalles": list(_intervalles[_rang:]),
+                                                 "resultats": [dict(_resultat) for _resultat in self.S_resultats],
+                                                 "duree_simulation": self.S_duree_simulation,
+                                                 "verifications_evitees": self.S_verifications_evitees,
+                                                 "tours_reutilises": self.S_tours_reutilises,
+                                                 "noeuds_rattaches": self.S_noeuds_rattaches,
+                                                 "statistiques": _extrait,
+                                                 "etat": _reseau_simulation.RcaptureEtat()}))
+
+                # Détermination des intervalles de temps à évaluer lors de l'étape suivante
+                _intervalles = _optimiseur.Ointervalles(self.S_resultats)
+        finally:
+            if _executeur is not None:
+                _executeur.shutdown()
+            # Une simulation interrompue garde son journal, pour être reprise
+            if _journal is not None:
+                _journal.JSfermer()
+
+        # Fin while, cad fin de la simulation, le maximum a été trouvé
 
-        while not self.__SmaximumAtteint():
+        # Si les étapes intermédiaires n'ont pas été enregistrées sous format html, en enregistre quand même le dernier
+        # état afin d'avoir le premier et le dernier état d'affiché
+        if not _show_html and self.S_enregistrer_etats:
+            _compteurs["etat"] += 1
+            _compteurs["total"] += 1
+            _file_manager.FMenregistrerEtat(_reseau_simulation, True)
+            self.S_connecteur.emit(Signaux.NOUVEL_ETAT, dict({"etat": _compteurs["etat"],
+                                                              "total": _compteurs["total"]}))
 
-            _log.Linfo("Info ## Cycle " + str(_cycle))
+        FileManager.FMsauvegarderStatistiques()
+        if _journal is not None:
+            _journal.JSfermer(_supprimer=True)
+
+        # Informations sur la durée de la simulation
+        _end = time.time()
+        _temps = (_end - _start) // 1
+        _succes, _echecs = self.ScompteursCache()
+        self.S_connecteur.emit(Signaux.FIN_SIMULATION, dict({"duree": abs(_temps),
+                                                             "verifications_evitees": self.S_verifications_evitees,
+                                                             "tours_reutilises": self.S_tours_reutilises,
+                                                             "configurations_en_cache": _succes,
+                                                             "configurations_calculees": _echecs}))
+
+        _log.Linfo("Info ## Fin simulation, vérifications de fin de vie évitées : "
+                   + str(self.S_verifications_evitees) + ", récoltes reprises d'un préfixe commun : "
+                   + str(self.S_tours_reutilises) + ", noeuds rattachés par réparation du routage : "
+                   + str(self.S_noeuds_rattaches) + ", configurations reprises du cache : "
+                   + str(_succes) + ", configurations absentes du cache : " + str(_echecs))
 
-            self.S_connecteur.emit(Signaux.INITIALISATION_SIMULATION, dict())
+        return _reseau_simulation
 
-            _reseau_simulation = copy.deepcopy(_reseau)
+    def SsimulerCycle(self, _reseau, _intervalle_roulement, _enregistrer_etat, _progression=None, _reprise=None):
+        """
+            Simule la vie du réseau, depuis son état courant jusqu'à sa fin de vie, avec un intervalle de changement de
+            rôle donné. Le réseau est modifié sur place.
 
-            # Détermination de l'intervalle de temps
-            self.__SdeterminationIntervalleTemps()
+            Si S_reprise_prefixe est vrai, l'état du réseau est conservé comme point de reprise juste avant le premier
+            changement de rôle qui suit l'instant 0, ou à la fin de vie si elle survient avant (cf SpointDeReprise).
+            Un cycle peut reprendre depuis un tel point (_reprise) : les états du préfixe commun sont rejoués et seule
+            la suite est simulée.
 
-            _text_progression = "Simulation en cours.. " \
-                                "\nCycle " + str(_cycle) + \
-                                "\nintervalle utilisé : " + str(self.S_intervalle_roulement) + " unité(s) de temps"
-            self.S_connecteur.emit(Signaux.PROGRESSION_SIMULATION, dict({"avancee": 0, "text": _text_progression}))
+            :param _reseau: Reseau, le réseau à traiter
+            :param _intervalle_roulement: float, l'intervalle de temps entre chaque changement de rôle des capteurs
+            :param _enregistrer_etat: fonction(Reseau, float, Accessibilite), appelée à chaque changement de rôle et à
+                la fin de vie du réseau avec le réseau, le moment (S_duree_simulation) et les noeuds reliés au puit
+            :param _progression: fonction(int[]), appelée après chaque vérification de la fin de vie avec la liste des
+                capteurs déconnectés, None pour ne pas suivre la progression
+            :param _reprise: dict{String : Objet}, le point de reprise depuis lequel reprendre (cf SpointDeReprise),
+                None pour simuler depuis l'état courant du réseau
+            :return: Reseau, le réseau à sa fin de vie
+        """
+        _log.Linfo("Début ## Simulateur.SsimulerCycle")
+
+        self.S_intervalle_roulement = _intervalle_roulement
+        _pas = self.SpasRoulement(_intervalle_roulement)
+        _debut = self.S_duree_simulation
+        _verifications_evitees = self.S_verifications_evitees
+        # Les états enregistrés avant le premier changement de rôle qui suit l'instant 0 sont communs à tous les
+        # intervalles plus grands : ils sont conservés avec le point de reprise
+        _prefixe = [] if self.S_reprise_prefixe and _pas > 0 else None
+        # Les index du réparateur suivent les routes du cycle, ils sont reconstruits à chaque configuration
+        _reparateur = ReparateurRoutes() if self.S_reparation_routes else None
+        # Le réseau vient d'être restauré : le moteur de la configuration précédente ne lui correspond plus
+        self.__SinvaliderConsommation()
+
+        def _enregistrer(_reseau_etat, _accessibilite_etat):
+            if _prefixe is not None:
+                _prefixe.append((_reseau_etat.RcaptureEtat(), self.S_duree_de_vie))
+            _enregistrer_etat(_reseau_etat, self.S_duree_simulation, _accessibilite_etat)
+
+        if _reprise is None:
+            _dernier_roulement = 0
 
             # Configuration topologique du réseau (routage et ensemble dominant)
-            _reseau_simulation = self.SconfigurationTopologique(_reseau_simulation)
+            _reseau_simulation = self.__SconfigurationTopologique(_reseau)
 
+            _accessibilite = self.Saccessibilite(_reseau_simulation)
             _fin_de_vie_atteinte, _capteurs_deconnectes = self.SfinDeVieAtteinte(_reseau_simulation,
-                                                                                 self.S_intervalle_roulement)
+                                                                                 self.S_intervalle_roulement,
+                                                                                 _accessibilite)
             self.S_duree_de_vie = 0
+        else:
+            _log.Linfo("Info ## Reprise du cycle à l'instant " + str(_reprise["duree_de_vie"]))
+
+            # Les états du préfixe commun sont rejoués comme s'ils venaient d'être simulés
+            for _etat, _moment in _reprise["etats"]:
+                _reseau.RrestaurerEtat(_etat)
+                _enregistrer_etat(_reseau, _debut + _moment, self.Saccessibilite(_reseau))
+            if _prefixe is not None:
+                _prefixe.extend(_reprise["etats"])
+
+            _reseau.RrestaurerEtat(_reprise["etat"])
+            # L'arbre dominant des configurations suivantes dépend de celui du préfixe (cf MainteneurDominant)
+            self.S_mainteneur_dominant.MDrestaurerEtat(_reprise["mainteneur"], _reseau)
+            _reseau_simulation = _reseau
+            _dernier_roulement = 0
+            _fin_de_vie_atteinte = _reprise["fin_de_vie"]
+            _capteurs_deconnectes = list(_reprise["capteurs_deconnectes"])
+            _accessibilite = self.Saccessibilite(_reseau_simulation)
+            self.S_nouveaux_capteurs_vides = _reprise["nouveaux_capteurs_vides"]
+            self.S_duree_de_vie = _reprise["duree_de_vie"]
+            self.S_duree_simulation = _debut + _reprise["duree_de_vie"]
+            self.S_verifications_evitees += _reprise["verifications_evitees"]
+            self.S_tours_reutilises += int(_reprise["duree_de_vie"] // self.S_intervalle_recolte)
+
+        # Tant que la fin de vie du réseau n'a pas été atteinte, on simule la consommation énergétique en
+        # enregistrant les étapes intermédiaires
+        while not _fin_de_vie_atteinte:
+            _log.Linfo("Info ## Temps " + str(self.S_duree_de_vie))
+
+            # Cas où le temps écoulé correspond à l'intervalle de temps de changement de rôles des capteurs :
+            # le rôle des capteurs est modifié et l'état est enregistré
+            _roulement_effectue = False
+            if self.S_intervalle_roulement != 0:
+                if self.S_duree_de_vie == 0 \
+                        or self.S_duree_de_vie - _dernier_roulement >= self.S_intervalle_roulement:
+                    # Fin du préfixe commun : l'état est conservé avant que les rôles ne soient modifiés
+                    if _prefixe is not None and self.S_duree_de_vie > 0:
+                        self.__SenregistrerPointDeReprise(_pas, _reseau_simulation, _prefixe, False,
+                                                          _capteurs_deconnectes,
+                                                          self.S_verifications_evitees - _verifications_evitees)
+                        _prefixe = None
+                    _dernier_roulement = self.S_duree_de_vie
+                    _reseau_simulation = self.__SconfigurationTopologique(_reseau_simulation)
+                    _roulement_effectue = True
+                    _enregistrer(_reseau_simulation, _accessibilite)
+
+            # On simule la consommation énergétique des capteurs puis on regarde si la fin de vie a été atteinte
+            # Le routage étant fixe jusqu'au prochain changement de rôle, on peut enchaîner directement les
+            # récoltes jusqu'au prochain événement
+            _tours_max = 1
+            if self.S_saut_evenements:
+                _tours_max = self.__StoursAvantRoulement(_dernier_roulement)
+            _reseau_simulation = self.__SsimulationSurUnRoulement(_reseau_simulation, _capteurs_deconnectes,
+                                                                  _tours_max)
+
+            # Les noeuds qui routaient leurs données à travers un capteur mort sont rattachés au reste de l'arbre
+            if _reparateur is not None and (self.S_nouveaux_capteurs_vides is None
+                                            or len(self.S_nouveaux_capteurs_vides) > 0):
+                _morts = self.S_nouveaux_capteurs_vides
+                if _morts is None:
+                    _morts = self.ScapteursVides(_reseau_simulation)
+                _rattaches, _isoles = _reparateur.RPreparer(_reseau_simulation, _morts)
+                if _rattaches > 0 or _isoles > 0:
+                    self.__SinvaliderConsommation()
+                self.S_noeuds_rattaches += _rattaches
+
+            # Si aucun capteur n'est mort et que le routage n'a pas changé, les capteurs déconnectés sont les
+            # mêmes qu'à la vérification précédente : inutile de refaire le parcours
+            if self.S_verification_incrementale and not _roulement_effectue \
+                    and self.S_nouveaux_capteurs_vides is not None and len(self.S_nouveaux_capteurs_vides) == 0:
+                self.S_verifications_evitees += 1
+            else:
+                _accessibilite = self.Saccessibilite(_reseau_simulation)
+                _fin_de_vie_atteinte, _capteurs_deconnectes = self.SfinDeVieAtteinte(_reseau_simulation,
+                                                                                     self.S_intervalle_roulement,
+                                                                                     _accessibilite)
+            if _progression is not None:
+                _progression(_capteurs_deconnectes)
 
-            # Tant que la fin de vie du réseau n'a pas été atteinte, on simule la consommation énergétique en
-            # enregistrant les étapes intermédiaires
-            while not _fin_de_vie_atteinte:
-                _log.Linfo("Info ## état " + str(_etat))
-
-                # Cas où le temps écoulé correspond à l'intervalle de temps de changement de rôles des capteurs :
-                # le rôle des capteurs est modifié et l'état est enregistré
-                if self.S_intervalle_roulement != 0:
-                    if self.S_duree_de_vie == 0 \
-                            or self.S_duree_de_vie - _dernier_roulement >= self.S_intervalle_roulement:
-                        _dernier_roulement = self.S_duree_de_vie
-                        _reseau_simulation = self.SconfigurationTopologique(_reseau_simulation)
-                        _etat += 1
-                        _total += 1
-                        _file_manager.FMenregistrerEtat(_reseau_simulation, _show_html)
-                        _statistiques.SajouterDonnees(_reseau_simulation, _cycle, self.S_duree_simulation)
-                        self.S_connecteur.emit(Signaux.NOUVEL_ETAT, dict({"etat": _etat, "total": _total}))
-
-                # On simule la consommation énergétique des capteurs puis on regarde si la fin de vie a été atteinte
-                _reseau_simulation = self.__SsimulationSurUnRoulement(_reseau_simulation, _capteurs_deconnectes)
+            if _fin_de_vie_atteinte:
+                # Ajout de l'état de la fin de vie du réseau
+                _enregistrer(_reseau_simulation, _accessibilite)
 
-                _fin_de_vie_atteinte, _capteurs_deconnectes = self.SfinDeVieAtteinte(_reseau_simulation,
-                                                                                     self.S_intervalle_roulement)
-                _ratio = len(_capteurs_deconnectes) / _reseau.R_nbr_noeuds - (1 - self.S_fin_de_vie)
-                self.S_connecteur.emit(Signaux.PROGRESSION_SIMULATION, dict({"avancee": int(_ratio * 100),
-                                                                             "text": _text_progression}))
+        # Fin de vie atteinte avant le premier changement de rôle : le cycle entier est commun aux intervalles plus
+        # grands
+        if _prefixe is not None and (_reprise is None or not _reprise["fin_de_vie"]):
+            self.__SenregistrerPointDeReprise(_pas, _reseau_simulation, _prefixe, True, _capteurs_deconnectes,
+                                              self.S_verifications_evitees - _verifications_evitees)
 
-            # Fin premier While : la fin de vie du réseau a été atteinte, on sauvegarde les états et on recommence avec
-            # un nouvel intervalle
+        return _reseau_simulation
 
-            # Ajout de l'état de la fin de vie du réseau
-            _etat += 1
-            _total += 1
-            _file_manager.FMenregistrerEtat(_reseau_simulation, _show_html)
-            _statistiques.SajouterDonnees(_reseau_simulation, _cycle, self.S_duree_simulation)
+    def SpasRoulement(self, _intervalle_roulement):
+        """
+            Les récoltes étant espacées de S_intervalle_recolte, les changements de rôle avec un intervalle donné ont
+            lieu toutes les m récoltes, m étant le pas de l'intervalle. Deux intervalles de même pas donnent la même
+            simulation.
 
-            self.S_resultats.append(dict({"intervalle": self.S_intervalle_roulement, "resultat": self.S_duree_de_vie}))
-            _statistiques.SajouterResultat(self.S_intervalle_roulement, self.S_duree_de_vie)
+            :param _intervalle_roulement: float, l'intervalle de temps entre chaque changement de rôle des capteurs
+            :return: int, le nombre de récoltes entre deux changements de rôle, 0 si il n'y en a aucun
+        """
+        if _intervalle_roulement == 0:
+            return 0
+        return math.ceil(_intervalle_roulement / self.S_intervalle_recolte)
 
-            self.S_connecteur.emit(Signaux.NOUVEL_ETAT, dict({"etat": _etat, "total": _total}))
-            # On met la barre de progression à 100%
-            self.S_connecteur.emit(Signaux.PROGRESSION_SIMULATION, dict({"avancee": 100, "text": _text_progression}))
+    def SpointDeReprise(self, _intervalle_roulement):
+        """
+            Recherche le point de reprise qui partage le plus long préfixe avec un intervalle donné.
 
-            self.S_duree_simulation += self.S_intervalle_recolte * 100  # Pour séparer les résultats d'un cycle à lautre
-            _cycle += 1
+            Jusqu'à son premier changement de rôle après l'instant 0 (à m x S_intervalle_recolte, m son pas), un cycle
+            ne dépend pas de son intervalle : tous les cycles de pas supérieur passent par le même état. Un cycle
+            terminé avant ce changement de rôle donne le même résultat pour tous les pas supérieurs ou égaux.
 
-        # Fin while, cad fin de la simulation, le maximum a été trouvé
+            :param _intervalle_roulement: float, l'intervalle de temps entre chaque changement de rôle des capteurs
+            :return: dict{String : Objet}, le point de reprise : etat (l'état du réseau), etats (les états du préfixe
+                associés à leur moment), duree_de_vie, capteurs_deconnectes, nouveaux_capteurs_vides,
+                verifications_evitees, fin_de_vie (vrai si la fin de vie est atteinte) et mainteneur (l'état du
+                MainteneurDominant), None si aucun ne convient
+        """
+        _pas = self.SpasRoulement(_intervalle_roulement)
+        if not self.S_reprise_prefixe or _pas == 0:
+            return None
+
+        _meilleur = None
+        for _pas_point, _point in self.S_points_de_reprise.items():
+            if _point["fin_de_vie"] and _pas_point <= _pas:
+                return _point
+            if not _point["fin_de_vie"] and _pas_point < _pas \
+                    and (_meilleur is None or _point["duree_de_vie"] > _meilleur["duree_de_vie"]):
+                _meilleur = _point
+        return _meilleur
+
+    def __SenregistrerPointDeReprise(self, _pas, _reseau, _etats, _fin_de_vie, _capteurs_deconnectes,
+                                     _verifications_evitees):
+        """
+            Conserve l'état courant du cycle comme point de reprise, cf SpointDeReprise
+
+            :param _pas: int, le pas de l'intervalle du cycle
+            :param _reseau: Reseau, le réseau dans son état courant
+            :param _etats: [(dict, int)], les états enregistrés depuis le début du cycle, associés à leur moment
+            :param _fin_de_vie: bool, vrai si la fin de vie du réseau est atteinte
+            :param _capteurs_deconnectes: int[], les capteurs déconnectés lors de la dernière vérification
+            :param _verifications_evitees: int, le nombre de vérifications évitées depuis le début du cycle
+        """
+        self.S_points_de_reprise[_pas] = dict({"etat": _reseau.RcaptureEtat(),
+                                               "etats": list(_etats),
+                                               "duree_de_vie": self.S_duree_de_vie,
+                                               "capteurs_deconnectes": list(_capteurs_deconnectes),
+                                               "nouveaux_capteurs_vides": self.S_nouveaux_capteurs_vides,
+                                               "verifications_evitees": _verifications_evitees,
+                                               "fin_de_vie": _fin_de_vie,
+                                               "mainteneur": self.S_mainteneur_dominant.MDcaptureEtat()})
+
+    def SrechercherIntervalle(self, _reseau):
+        """
+            Recherche l'intervalle de changement de rôle qui maximise la durée de vie, comme SlancerSimulation, mais
+            sans enregistrer les états, sans statistiques et sans notification : utilisé pour les simulations en lot.
+            Les cycles sont simulés l'un après l'autre, sur place, à partir de l'état initial du réseau.
 
-        # Si les étapes intermédiaires n'ont pas été enregistrées sous format html, en enregistre quand même le dernier
-        # état afin d'avoir le premier et le dernier état d'affiché
-        if not _show_html:
-            _etat += 1
-            _total += 1
-            _file_manager.FMenregistrerEtat(_reseau_simulation, True)
-            self.S_connecteur.emit(Signaux.NOUVEL_ETAT, dict({"etat": _etat, "total": _total}))
+            :param _reseau: Reseau, le réseau à traiter, dans son état initial
+            :return: [dict{String : double, String : int}], les résultats de la recherche (cf S_resultats)
+        """
+        _log.Linfo("Début ## Simulateur.SrechercherIntervalle")
 
-        FileManager.FMsauvegarderStatistiques()
+        _etat_initial = _reseau.RcaptureEtat()
+        self.S_resultats = []
+        self.__SinitialiserCycles()
+        _optimiseur = Optimiseur.Ocreer(self.S_strategie_optimisation, self.S_performance, self.S_intervalle_recolte)
+
+        _intervalles = _optimiseur.Ointervalles(self.S_resultats)
+        while _intervalles:
+            for _intervalle in _intervalles:
+                if not _optimiseur.Oconnu(_intervalle):
+                    _reseau.RrestaurerEtat(_etat_initial)
+                    self.SsimulerCycle(_reseau, _intervalle, lambda _reseau_etat, _moment, _accessibilite: None,
+                                       _reprise=self.SpointDeReprise(_intervalle))
+                    _optimiseur.Omemoriser(_intervalle, self.S_duree_de_vie)
+                self.S_resultats.append(dict({"intervalle": _intervalle, "resultat": _optimiseur.O_memo[_intervalle]}))
+            _intervalles = _optimiseur.Ointervalles(self.S_resultats)
+
+        return self.S_resultats
 
-        # Informations sur la durée de la simulation
-        _end = time.time()
-        _temps = (_end - _start) // 1
-        self.S_connecteur.emit(Signaux.FIN_SIMULATION, dict({"duree": abs(_temps)}))
+    @staticmethod
+    def SsimulerCycleIsole(_reseau, _intervalle_roulement, _parametres, _reprise=None):
+        """
+            Simule un cycle complet dans un processus séparé. Les états à enregistrer ne peuvent pas être transmis au
+            FileManager et aux Statistiques de ce processus : ils sont capturés (Reseau.RcaptureEtat) et renvoyés pour
+            être rejoués par le processus principal.
+
+            :param _reseau: Reseau, le réseau dans son état initial
+            :param _intervalle_roulement: float, l'intervalle de temps entre chaque changement de rôle des capteurs
+            :param _parametres: dict{String : Objet}, les paramètres du simulateur principal (cf S_PARAMETRES)
+            :param _reprise: dict{String : Objet}, le point de reprise depuis lequel reprendre (cf SpointDeReprise),
+                None pour simuler depuis l'état initial
+            :return: dict{String : Objet}, duree_de_vie (int), duree_simulation (int) le temps simulé pendant le
+                cycle, verifications_evitees (int), tours_reutilises (int), noeuds_rattaches (int),
+                configurations_en_cache (int) et configurations_calculees (int) les compteurs du cache du processus,
+                etats, la liste des états capturés associés à leur moment, et points_de_reprise, ceux enregistrés
+                pendant le cycle
+        """
+        _log.Linfo("Début ## Simulateur.SsimulerCycleIsole")
 
-        _log.Linfo("Info ## Fin simulation")
+        # Les paramètres sont reportés sur la classe car certaines méthodes statiques les lisent directement
+        for _nom, _valeur in _parametres.items():
+            setattr(Simulateur, _nom, _valeur)
+        _simulateur = Simulateur(None)
+        _simulateur.S_evaluation_parallele = False
 
-        return _reseau_simulation
+        _etats = []
+
+        def _capturer_etat(_reseau_etat, _moment, _accessibilite):
+            _etats.append((_reseau_etat.RcaptureEtat(), _moment))
 
-    def __SmaximumAtteint(self):
+        _simulateur.SsimulerCycle(_reseau, _intervalle_roulement, _capturer_etat, _reprise=_reprise)
+        _succes, _echecs = _simulateur.ScompteursCache()
+
+        return dict({"duree_de_vie": _simulateur.S_duree_de_vie,
+                     "duree_simulation": _simulateur.S_duree_simulation,
+                     "verifications_evitees": _simulateur.S_verifications_evitees,
+                     "tours_reutilises": _simulateur.S_tours_reutilises,
+                     "noeuds_rattaches": _simulateur.S_noeuds_rattaches,
+                     "configurations_en_cache": _succes,
+                     "configurations_calculees": _echecs,
+                     "etats": _etats,
+                     "points_de_reprise": _simulateur.S_points_de_reprise})
+
+    def __SevaluationParallele(self, _executeur, _reseau, _intervalles):
         """
-            Permet de déterminer si la durée de vie maximale a été atteinte.
-            On estime que la durée maximale a été atteinte si la durée de vie est plus petite que la précédente ou si
-            l'augmentation de la durée de vie par rapport à la précédente ne dépasse pas un paramètre fixé S_performance
+            Simule en même temps, dans des processus séparés, un cycle pour chacun des intervalles candidats
+
+            :param _executeur: ProcessPoolExecutor, le groupe de processus à utiliser, None pour le créer
+            :param _reseau: Reseau, le réseau dans son état initial
+            :param _intervalles: float[], les intervalles candidats
+            :return:    ProcessPoolExecutor, le groupe de processus utilisé
+                        dict{float : dict}, le résultat de SsimulerCycleIsole pour chaque intervalle, None si
+                        l'évaluation parallèle a échoué (les cycles sont alors simulés l'un après l'autre)
         """
+        _log.Linfo("Début ## Simulateur.__SevaluationParallele")
+
+        _parametres = {_nom: getattr(self, _nom) for _nom in Simulateur.S_PARAMETRES}
+        try:
+            if _executeur is None:
+                _executeur = ProcessPoolExecutor(max_workers=self.S_nombre_processus)
+            _futurs = [_executeur.submit(Simulateur.SsimulerCycleIsole, _reseau, _intervalle, _parametres,
+                                         self.SpointDeReprise(_intervalle))
+                       for _intervalle in _intervalles]
+            return _executeur, {_intervalle: _futur.result() for _intervalle, _futur in zip(_intervalles, _futurs)}
+        except (OSError, BrokenProcessPool, pickle.PicklingError) as _erreur:
+            _log.Lerror("Évaluation parallèle impossible, les cycles sont simulés l'un après l'autre : " + str(_erreur))
+            self.S_evaluation_parallele = False
+            return _executeur, None
+
+    def __SrejouerCycle(self, _reseau, _resultat, _enregistrer_etat):
+        """
+            Rejoue les états d'un cycle simulé dans un processus séparé, comme s'il venait d'être simulé
 
-        _log.Linfo("Début ## Simulateur.__SmaximumAtteint")
-
-        # Comparaison des deux premières solutions
-        if len(self.S_resultats) == 2:
+            :param _reseau: Reseau, le réseau sur lequel restaurer les états
+            :param _resultat: dict{String : Objet}, le résultat de SsimulerCycleIsole
+            :param _enregistrer_etat: fonction(Reseau, float, Accessibilite), cf SsimulerCycle
+            :return: Reseau, le réseau à sa fin de vie
+        """
+        _log.Linfo("Début ## Simulateur.__SrejouerCycle")
+
+        _debut = self.S_duree_simulation
+        for _etat, _moment in _resultat["etats"]:
+            _reseau.RrestaurerEtat(_etat)
+            _enregistrer_etat(_reseau, _debut + _moment, self.Saccessibilite(_reseau))
+
+        self.S_duree_de_vie = _resultat["duree_de_vie"]
+        self.S_duree_simulation = _debut + _resultat["duree_simulation"]
+        self.S_verifications_evitees += _resultat["verifications_evitees"]
+        # Les points de reprise du processus séparé servent aux cycles suivants
+        self.S_tours_reutilises += _resultat.get("tours_reutilises", 0)
+        self.S_noeuds_rattaches += _resultat.get("noeuds_rattaches", 0)
+        self.S_compteurs_cache["succes"] += _resultat.get("configurations_en_cache", 0)
+        self.S_compteurs_cache["echecs"] += _resultat.get("configurations_calculees", 0)
+        for _pas, _point in _resultat.get("points_de_reprise", dict()).items():
+            self.S_points_de_reprise.setdefault(_pas, _point)
 
-            _dernier_resultat = self.S_resultats[-1]["resultat"]
-            _avant_dernier_resultat = self.S_resultats[-2]["resultat"]
+        return _reseau
 
-            if _dernier_resultat <= _avant_dernier_resultat:
-                return True
+    def ScompteursCache(self):
+        """
+            Permet de connaître l'efficacité du cache des configurations topologiques (cf CacheConfiguration), y
+            compris celle des caches des processus séparés
 
-            _ratio = (_dernier_resultat - _avant_dernier_resultat) / _dernier_resultat
-            if _ratio < self.S_performance:
-                return True
+            :return:    int, le nombre de configurations topologiques reprises du cache
+                        int, le nombre de configurations absentes du cache, donc calculées
+        """
+        _succes = self.S_compteurs_cache["succes"]
+        _echecs = self.S_compteurs_cache["echecs"]
+        if self.S_cache_configuration is not None:
+            _succes += self.S_cache_configuration.CC_succes
+            _echecs += self.S_cache_configuration.CC_echecs
+        return _succes, _echecs
+
+    def __SenregistreurEtats(self, _cycle, _compteurs, _show_html, _statistiques, _file_manager):
+        """
+            Crée la fonction qui enregistre un nouvel état du réseau : sauvegarde sur disque, statistiques et
+            notification du controleur
+
+            :param _cycle: int, le numéro du cycle en cours
+            :param _compteurs: dict{String : int}, le numéro du dernier état (etat) et le nombre d'états (total),
+                mis à jour à chaque enregistrement
+            :param _show_html: bool, vrai si l'état doit aussi être enregistré au format html
+            :param _statistiques: Statistiques, les statistiques de la simulation
+            :param _file_manager: FileManager, le gestionnaire de fichiers
+            :return: fonction(Reseau, float, Accessibilite), cf SsimulerCycle
+        """
+        def _enregistrer_etat(_reseau, _moment, _accessibilite):
+            # Les mesures de l'état sont calculées une seule fois pour le rendu et les statistiques
+            _analyse = AnalyseEtat(_reseau, _accessibilite)
+            if self.S_enregistrer_etats:
+                _compteurs["etat"] += 1
+                _compteurs["total"] += 1
+                _file_manager.FMenregistrerEtat(_reseau, _show_html, _analyse)
+            _statistiques.SajouterDonnees(_reseau, _cycle, _moment, _accessibilite, _analyse)
+            if self.S_enregistrer_etats:
+                self.S_connecteur.emit(Signaux.NOUVEL_ETAT, dict({"etat": _compteurs["etat"],
+                                                                  "total": _compteurs["total"]}))
+
+        return _enregistrer_etat
+
+    def __Sprogression(self, _reseau, _text_progression):
+        """
+            Crée la fonction qui notifie le controleur de l'avancement d'un cycle
 
-        # Sinon si 4 solutions ont déjà étées réalisées
-        elif len(self.S_resultats) > 4 and len(self.S_resultats) % 2 == 0:
-            _resultat_base = self.S_resultats[-3]["resultat"]
-            _avant_dernier_resultat = self.S_resultats[-2]["resultat"]
-            _dernier_resultat = self.S_resultats[-1]["resultat"]
+            :param _reseau: Reseau, le réseau simulé
+            :param _text_progression: String, le texte à afficher au dessus de la barre de progression
+            :return: fonction(int[]), cf SsimulerCycle
+        """
+        def _progression(_capteurs_deconnectes):
+            _ratio = len(_capteurs_deconnectes) / _reseau.R_nbr_noeuds - (1 - self.S_fin_de_vie)
+            self.S_connecteur.emit(Signaux.PROGRESSION_SIMULATION, dict({"avancee": int(_ratio * 100),
+                                                                         "text": _text_progression}))
 
-            if _dernier_resultat <= _resultat_base and _avant_dernier_resultat <= _resultat_base:
-                return True
+        return _progression
 
-            _ratio_dernier = (_dernier_resultat - _resultat_base) / _dernier_resultat
-            _ratio_avant_dernier = (_avant_dernier_resultat - _resultat_base) / _avant_dernier_resultat
-            if _ratio_dernier < self.S_performance and _ratio_avant_dernier < self.S_performance:
-                return True
+    def __SconfigurationTopologique(self, _reseau):
+        """
+            Configure le réseau avec le mainteneur de l'ensemble dominant et le cache du simulateur (cf
+            SconfigurationTopologique), puis invalide le moteur de consommation de la configuration précédente
 
-        return False
+            :param _reseau: Reseau, le réseau à configurer
+            :return: Reseau, le réseau configuré
+        """
+        _reseau = self.SconfigurationTopologique(_reseau, self.S_mainteneur_dominant, self.S_cache_configuration)
+        self.__SinvaliderConsommation()
+        return _reseau
 
-    def __SdeterminationIntervalleTemps(self):
+    def __SinvaliderConsommation(self):
+        """
+            Oublie le moteur de consommation et les coûts d'émission de la configuration courante : ils seront
+            reconstruits à la prochaine récolte
         """
-            Permet de déterminer l'intervalle de changement de rôle des capteurs en fonction du précédent et des tours
-            de simulation précédents.
-            Le premier tour l'intervalle est nul.
-            Le deuxième tour l'intervalle est positioné arbitrairement à la moitié du résultat du 1er tour
-            Les autres autres se font en deux phases :
-                On compare le résultat du tour précédent avec - la moitié de l'intervalle précédent
-                                                              - l'intervalle précédent plus sa moitié
-                Et on garde le meilleur des trois
+        self.S_moteur_energie = None
+        self.S_emissions = None
+
+    def __SmoteurEnergie(self, _reseau):
         """
-        _log.Linfo("Début ## Simulateur.__SdeterminationIntervalleTemps")
+            Permet d'obtenir le moteur de consommation de la configuration courante. Il n'est construit qu'une fois par
+            configuration : les niveaux de batterie du réseau sont ceux qu'il y a lui-même reportés (MEappliquer)
 
-        # Premier tour
-        if len(self.S_resultats) == 0:
-            self.S_intervalle_roulement = 0
-        # Deuxième tours
-        elif len(self.S_resultats) == 1:
-            self.S_intervalle_roulement = self.S_duree_de_vie / 2
-        # Autres tours
+            :param _reseau: Reseau, le réseau à traiter
+            :return: MoteurEnergie, le moteur, prêt pour une nouvelle récolte
+        """
+        if self.S_moteur_energie is None:
+            self.S_moteur_energie = MoteurEnergie(_reseau, self.SmodeleEnergie())
         else:
-            # Si le nombre de résultats est pair : les deux phases sont passées
-            if len(self.S_resultats) % 2 == 0:
-                if self.S_resultats[-1]["resultat"] < self.S_resultats[-2]["resultat"] \
-                        and len(self.S_resultats) - 2 != 0:
-                    # On inverse les deux derniers résultats afin d'avoir le meilleur à la fin de la liste
-                    _temp = self.S_resultats[-2]
-                    self.S_resultats.remove(self.S_resultats[-2])
-                    self.S_resultats.append(_temp)
-                self.S_intervalle_roulement = self.S_resultats[-1]["intervalle"] * 1.5
-            else:
-                self.S_intervalle_roulement = self.S_resultats[-2]["intervalle"] * 0.5
+            self.S_moteur_energie.MEnouvelleEtape()
+        return self.S_moteur_energie
 
     @staticmethod
-    def SconfigurationTopologique(_reseau):
+    def SconfigurationTopologique(_reseau, _mainteneur=None, _cache=None):
         """
             Permet de déterminer le rôle des capteurs, le routage de leurs données et l'ensemble dominant du graphe
 
         :param _reseau: Reseau, le réseau à configurer
+        :param _mainteneur: MainteneurDominant, maintient l'ensemble dominant d'une configuration à l'autre, None pour
+            le recalculer entièrement
+        :param _cache: CacheConfiguration, les configurations déjà calculées, None pour toujours calculer la
+            configuration. Il n'est pas utilisé si le mainteneur répare l'arbre : l'arbre réparé dépend de l'état du
+            mainteneur, que la clé du cache ne contient pas
         :return: Reseau, le réseau configuré
         """
         _log.Linfo("Début ## Simulateur.SconfigurationTopologique")
@@ -303,8 +973,20 @@ class Simulateur:
             _log.Lerror("Valeur Argument errone _reseau")
             raise Exception("Valeur Argument errone _reseau")
 
+        # Configuration déjà calculée pour la même topologie et les mêmes niveaux de batterie
+        _cle = None
+        if _mainteneur is not None and _mainteneur.MD_seuil_changements > 0:
+            _cache = None
+        if _cache is not None:
+            _cle = _cache.CCcle(_reseau)
+            if _cache.CCappliquer(_cle, _reseau):
+                return _reseau
+
         # Détermination des rôles des capteurs en prenant en compte l'ensemble dominant
-        _ensemble_dominant = Simulateur.SdeterminationEnsembleDominant(_reseau)
+        if _mainteneur is not None:
+            _ensemble_dominant = _mainteneur.MDensembleDominant(_reseau)
+        else:
+            _ensemble_dominant = Simulateur.SdeterminationEnsembleDominant(_reseau)
         _reseau.R_ensemble_dominant = _ensemble_dominant
 
         # Tous les noeuds de l'ensemble dominant prennent le rôle de Recepteur/Emetteur
@@ -326,6 +1008,9 @@ class Simulateur:
         # Finalement on rempli les informations de routage dans chaque noeud
         Simulateur.SdeterminationRoutage(_reseau, _ensemble_dominant)
 
+        if _cache is not None:
+            _cache.CCajouter(_cle, _reseau)
+
         return _reseau
 
     @staticmethod
@@ -344,13 +1029,15 @@ class Simulateur:
             _log.Lerror("Valeur Argument errone _reseau")
             raise Exception("Valeur Argument errone _reseau")
 
-        # Avant tout on créé un copie du réseau duquel on supprime l'ensemble des noeuds qui n'ont plus de batterie
-        # ainsi que les arcs qui y sont reliés
+        # En premier, stocke dans chaque noeuds et arc un poids inversement égale au niveau de la batterie des noeuds
+        if Simulateur.S_ponderation_batterie:
+            Simulateur.SactualisationPoids(_reseau_initial)
+
+        # On créé une vue du réseau de laquelle on retire l'ensemble des noeuds qui n'ont plus de batterie ainsi que
+        # les arcs qui y sont reliés. La vue reflète les poids du réseau d'origine
         _reseau, _ = Simulateur.SreseauSansCapteursVides(_reseau_initial)
 
-        # # En premier, stocke dans chaque noeuds et arc un poids inversement égale au niveau de la batterie des noeuds
-        # _reseau = Simulateur.SactualisationPoids(_reseau)
-        # # Sélection des noeuds dominants avec un algorithme de networkX
+        # Sélection des noeuds dominants avec un algorithme de networkX
         _ensemble_dominant = dominating_set.min_weighted_dominating_set(
             _reseau.R_graphe,
             weight="poids_dominant"
@@ -363,127 +1050,11 @@ class Simulateur:
                 _ensemble_dominant.add(_noeud)
 
         # On créé un multigraphe intermédiaire en reprennant uniquement les arcs et noeuds qui sont dans l'ensemble
-        # dominant
-        _noeuds_dominants = {}
-        for _n in _ensemble_dominant:
-            _noeuds_dominants[_n] = _reseau.R_graphe.node[_n]
-        _arcs_dominants = []
-        for _a in _reseau.R_graphe.edges():
-            if _a[0] in _ensemble_dominant and _a[1] in _ensemble_dominant:
-                _arcs_dominants.append(_a)
-
-        _multigraphe = nx.Graph()
-        _multigraphe.add_nodes_from(_noeuds_dominants)
-        _multigraphe.add_edges_from(_arcs_dominants)
-
-        # Dans ce multigraphe on retranscrit les informations de position
-        _pos = {}
-        for _n in _multigraphe.nodes():
-            _pos[_n] = _reseau.R_graphe.node[_n]['pos']
-
-        nx.set_node_attributes(_multigraphe, _pos, "pos")
-
+        # dominant.
         # La suite vise à rendre connexe le multigraphe en ajoutant dans l'ensemble dominant les noeuds sur le plus
         # court chemin (avec le niveau de la batterie comme poids) entre les deux noeuds les plus proches de chaque
         # sous-graphe
-
-        # Récupère les sous-graphes
-        _subgraphs_generator = nx.connected_component_subgraphs(_multigraphe, copy=True)
-        _subgraphs = []
-        for _subgraph in _subgraphs_generator:
-            _subgraphs.append(_subgraph)
-
-        # Tant qu'il y a encore des sous-graphes
-        while len(_subgraphs) > 1:
-            # ----------------------------------------------------------------------------------------------------------
-            # On prend le premier sous-graphe et le sous-graphe le plus proche de lui
-            # ----------------------------------------------------------------------------------------------------------
-            _subgraph1 = _subgraphs[0]
-            # Calcul du centre de gravité du premier sous-graphe
-            _x, _y = 0, 0
-            _nbr_noeuds = 0
-            for _node in _subgraph1.node:
-                _x += _subgraph1.node[_node]['pos'][0]
-                _y += _subgraph1.node[_node]['pos'][1]
-                _nbr_noeuds += 1
-            _g_x = _x / _nbr_noeuds
-            _g_y = _y / _nbr_noeuds
-            _subgraphs.remove(_subgraph1)
-
-            # Puis on compare les distances avec tout les autres sous-graphes pour récupérer le plus proche
-            _distance_min = 0
-            _sub_graph_plus_pres = _subgraphs[0]
-            for _subgraph in _subgraphs:
-                _x, _y = 0, 0
-                _nbr_noeuds = 0
-                for _node in _subgraph.node:
-                    _x += _subgraph.node[_node]['pos'][0]
-                    _y += _subgraph.node[_node]['pos'][1]
-                    _nbr_noeuds += 1
-                _distance = math.sqrt(math.pow(_g_x - _x / _nbr_noeuds, 2) +
-                                      math.pow(_g_y - _y / _nbr_noeuds, 2))
-                if _distance_min == 0 or _distance < _distance_min:
-                    _distance_min = _distance
-                    _sub_graph_plus_pres = _subgraph
-
-            # ----------------------------------------------------------------------------------------------------------
-            # Ensuite on récupère les deux points les plus proches entre les deux sous-graphes
-            # ----------------------------------------------------------------------------------------------------------
-
-            _paire_la_plus_proche = None
-            _distance_min = 0
-            for _noeud1 in _subgraph1:
-                for _noeud2 in _sub_graph_plus_pres:
-                    _distance = math.sqrt(math.pow(_subgraph1.node[_noeud1]['pos'][0] -
-                                                   _sub_graph_plus_pres.node[_noeud2]['pos'][0], 2) +
-                                          math.pow(_subgraph1.node[_noeud1]['pos'][1] -
-                                                   _sub_graph_plus_pres.node[_noeud2]['pos'][1], 2))
-                    if _paire_la_plus_proche is None or _distance < _distance_min:
-                        _distance_min = _distance
-                        _paire_la_plus_proche = (_noeud1, _noeud2)
-
-            # ----------------------------------------------------------------------------------------------------------
-            # Puis on relie les deux sous-graphes en incorporant au graphe dominant les arcs et noeuds situés sur le
-            # plus cours chemin entre les deux noeuds les plus proches
-            # ----------------------------------------------------------------------------------------------------------
-
-            try:
-                _plus_court_chemin = shortest_path(_reseau.R_graphe,
-                                                   _paire_la_plus_proche[0], _paire_la_plus_proche[1],
-                                                   weight='poids_dominant')
-            except:
-                # Si une exception est retournée c'est qu'il n'est plus possible de relier les deux noeuds :
-                # en conséquent on supprime le sous graphe qu'on essayait d'incorporer et on passe au tour de boucle
-                # suivant
-                _subgraphs.remove(_sub_graph_plus_pres)
-                continue
-
-            # On ajoute les nouveaux noeuds et arcs à l'ensemble dominant
-            # Arcs
-            for _a in _reseau.R_graphe.edges():
-                if (_a[0] in _plus_court_chemin and _a[1] in _plus_court_chemin) or \
-                        (_a[0] in _plus_court_chemin and _a[1] in _noeuds_dominants) or \
-                        (_a[0] in _noeuds_dominants and _a[1] in _plus_court_chemin):
-                    _arcs_dominants.append(_a)
-            # Noeuds
-            for _n in _plus_court_chemin:
-                _noeuds_dominants[_n] = _reseau.R_graphe.node[_n]
-
-            # Puis on recréer un multigraphe à partir de ces nouveaux ensembles
-            _multigraphe = nx.Graph()
-            _multigraphe.add_nodes_from(_noeuds_dominants)
-            _multigraphe.add_edges_from(_arcs_dominants)
-            _pos = {}
-            for _n in _multigraphe.nodes():
-                _pos[_n] = _reseau.R_graphe.node[_n]['pos']
-            nx.set_node_attributes(_multigraphe, _pos, "pos")
-
-            # Pour finalement diviser le multigraphe en sous-graphe et recommencer un tour de boucle
-            _subgraphs_generator = nx.connected_component_subgraphs(_multigraphe, copy=True)
-            _subgraphs = []
-            for _subgraph in _subgraphs_generator:
-                _subgraphs.append(_subgraph)
-        # FIN WHILE
+        _multigraphe = FusionFragments(_reseau.R_graphe, _ensemble_dominant).FFrelierFragments()
 
         # Maintenant le graphe devenu connexe, on le transforme en un arbre de racine un puit, après plusieurs essais
         # l'algorithme de prim est apparu comme le plus performant car le plus directement connecté au puit.
@@ -496,7 +1067,9 @@ class Simulateur:
     def SactualisationPoids(_reseau):
         """
             Permet de donner un poids aux éléments du réseau. Ce poids, égal à l'inverse du niveau de la batterie du
-            noeud, est utilisé par les algorithmes de la configuration topologique
+            noeud, est utilisé par les algorithmes de la configuration topologique. Les puits, qui n'ont pas de
+            batterie, ont un poids nul : les routes sont attirées vers eux.
+            Les poids sont calculés sur un tableau NumPy des niveaux de batterie, puis recopiés dans les noeuds.
 
             :param _reseau: Reseau, le réseau à configurer
             :return: Reseau, le réseau configuré
@@ -508,17 +1081,21 @@ class Simulateur:
             _log.Lerror("Valeur Argument errone _reseau")
             raise Exception("Valeur Argument errone _reseau")
 
-        _poids = {}
+        _donnees_noeuds = [_donnees for _, _donnees in _reseau.R_graphe.nodes(data=True)]
+        _batteries = np.fromiter((_donnees['batterie'] for _donnees in _donnees_noeuds), dtype=float,
+                                 count=len(_donnees_noeuds))
 
-        for _noeud in _reseau.R_graphe:
-            # Si la batterie est vide, le poid est mit à son maximum
-            if _reseau.R_graphe.node[_noeud]['batterie'] <= 0:
-                _poids[_noeud] = 1
-            # Sinon il est l'inverse du niveau de la batterie
-            else:
-                _poids[_noeud] = 1 / _reseau.R_graphe.node[_noeud]['batterie']
+        _puits = np.fromiter((_donnees['role'] == Roles.PUIT for _donnees in _donnees_noeuds), dtype=bool,
+                             count=len(_donnees_noeuds))
 
-        nx.set_node_attributes(_reseau.R_graphe, _poids, "poids_dominant")
+        # Si la batterie est vide, le poid est mit à son maximum, sinon il est l'inverse du niveau de la batterie
+        _poids = np.ones(len(_donnees_noeuds))
+        np.divide(1, _batteries, out=_poids, where=_batteries > 0)
+        # Les puits ont le poids minimum
+        _poids[_puits] = 0
+
+        for _donnees, _poids_noeud in zip(_donnees_noeuds, _poids.tolist()):
+            _donnees['poids_dominant'] = _poids_noeud
         Simulateur.SmigrerPoidsDansArcs(_reseau.R_graphe)
 
         return _reseau
@@ -527,7 +1104,7 @@ class Simulateur:
     def SmigrerPoidsDansArcs(_graphe):
         """
             Permet de déplacer le poids des noeuds dans les arcs les reliants. le poids d'un arc est égal à la somme
-            du poids des deux noeuds
+            du poids des deux noeuds. Les sommes sont calculées en une fois à partir des index des extrémités des arcs.
 
             :param _graphe: Graphe Networkx, le graphe à configurer
         """
@@ -537,11 +1114,16 @@ class Simulateur:
             _log.Lerror("Valeur Argument errone _graphe")
             raise Exception("Valeur Argument errone _graphe")
 
-        _datas = {}
-        for _edge in _graphe.edges():
-            _poids_arc = _graphe.node[_edge[0]]['poids_dominant'] + _graphe.node[_edge[1]]['poids_dominant']
-            _datas[_edge[0], _edge[1]] = _poids_arc
-        nx.set_edge_attributes(_graphe, _datas, "poids_dominant")
+        _index = {_noeud: _i for _i, _noeud in enumerate(_graphe)}
+        _poids = np.fromiter((_donnees['poids_dominant'] for _, _donnees in _graphe.nodes(data=True)), dtype=float,
+                             count=len(_index))
+
+        _arcs = list(_graphe.edges(data=True))
+        _extremites = np.array([(_index[_n1], _index[_n2]) for _n1, _n2, _ in _arcs], dtype=int).reshape(-1, 2)
+        _poids_arcs = _poids[_extremites[:, 0]] + _poids[_extremites[:, 1]]
+
+        for (_, _, _donnees), _poids_arc in zip(_arcs, _poids_arcs.tolist()):
+            _donnees['poids_dominant'] = _poids_arc
 
     @staticmethod
     def SdeterminationRoutage(_reseau, _ensemble_dominant):
@@ -569,64 +1151,87 @@ class Simulateur:
         for _noeud in _reseau.R_graphe.nodes():
             _reseau.R_graphe.nodes[_noeud]['route'] = -1
 
-        # On travail sur l'arbre dominant : on part depuis le puit et par récursivité on descend jusqu'aux feuilles
-        # en assignant le précédent noeud comme noeud vers lequel envoyer les données.
-        # On traite d'abord le cas du puit
-        _puit = None
-        for _noeud in _ensemble_dominant.nodes():
-            if _reseau.R_graphe.nodes[_noeud]['role'] == Roles.PUIT:
-                _puit = _noeud
-                _reseau.R_graphe.nodes[_puit]['route'] = _puit
+        # On travail sur l'arbre dominant : on part depuis les puits et par un parcours en largeur on descend jusqu'aux
+        # feuilles en assignant le précédent noeud comme noeud vers lequel envoyer les données.
+        # On traite d'abord le cas des puits, qui routent vers eux-même
+        _puits = Simulateur.Spuits(_reseau)
+        for _puit in _puits:
+            _reseau.R_graphe.nodes[_puit]['route'] = _puit
 
-        # Appelle à la fonction récursive en partant du puit
-        Simulateur.SrouteRecursive(_puit, _reseau, _ensemble_dominant)
+        # Un seul parcours, partant de tous les puits à la fois : chaque noeud de l'arbre route vers le puit le plus
+        # proche (en nombre de sauts dans l'arbre), le routage forme une forêt dont chaque arbre a pour racine un puit
+        Simulateur.SrouteParcoursLargeur([_puit for _puit in _puits if _puit in _ensemble_dominant],
+                                         _reseau, _ensemble_dominant)
 
         # Ensuite pour tout les noeuds du graphe qui n'ont pas encore de routage (donc qui sont pas dans l'ensemble
         # dominant), on les fait router vers le noeud voisin de l'arbre dominant avec le plus d'énergie
-        for _noeud in _reseau.R_graphe.nodes:
+        _noeuds = _reseau.R_graphe.nodes
+        _adjacence = _reseau.R_graphe.adj
+        _dominants = _reseau.R_ensemble_dominant.nodes
+        # Rang de chaque noeud, afin de parcourir les voisins dans l'ordre où R_graphe.edges() les énumère
+        _rang = {_noeud: _i for _i, _noeud in enumerate(_noeuds)}
+        _ensemble_puits = set(_puits)
+        for _noeud in _noeuds:
             # Si le routage n'a pas été déterminé (donc si il ne fait pas parti de l'ensemble dominant)
-            if _reseau.R_graphe.nodes[_noeud]['route'] == -1:
+            if _noeuds[_noeud]['route'] == -1:
                 _meilleur_routage = _noeud
                 _meilleur_energie = 0
-                # Pour tout arcs, si le noeud est relié au puit c'est incontestablement son meilleur routage possible
-                # Sinon on prend le noeud avec le plus de batterie
-                # pour cela on parcourt chaque arc et on ne regarde uniquement ceux qui
-                # -
-                for _arc in _reseau.R_graphe.edges():
-                    if (_arc[0] == _noeud and _arc[1] == _puit) or (_arc[1] == _noeud and _arc[0] == _puit):
-                        _meilleur_routage = _puit
-                        break
-                    elif _arc[0] == _noeud \
-                            and _meilleur_energie <= _reseau.R_graphe.nodes[_arc[1]]['batterie'] \
-                            and _arc[1] in _reseau.R_ensemble_dominant.nodes\
-                            and (_reseau.R_graphe.nodes[_arc[1]]['route'] == -1 or
-                            _reseau.R_graphe.nodes[_reseau.R_graphe.nodes[_arc[1]]['route']]['route'] != _arc[1]):
-                        _meilleur_energie = _reseau.R_graphe.nodes[_arc[1]]['batterie']
-                        _meilleur_routage = _arc[1]
-                    elif _arc[1] == _noeud \
-                            and _meilleur_energie <= _reseau.R_graphe.nodes[_arc[0]]['batterie'] \
-                            and _arc[0] in _reseau.R_ensemble_dominant.nodes\
-                            and (_reseau.R_graphe.nodes[_arc[0]]['route'] == -1 or
-                            _reseau.R_graphe.nodes[_reseau.R_graphe.nodes[_arc[0]]['route']]['route'] != _arc[0]):
-                        _meilleur_energie = _reseau.R_graphe.nodes[_arc[0]]['batterie']
-                        _meilleur_routage = _arc[0]
-                _reseau.R_graphe.nodes[_noeud]['route'] = _meilleur_routage
+                # Si le noeud est relié à un puit c'est incontestablement son meilleur routage possible (le premier
+                # puit de sa liste d'adjacence si il en a plusieurs)
+                # Sinon on prend le voisin dominant avec le plus de batterie (le dernier en cas d'égalité) qui ne
+                # route pas déjà ses données vers lui
+                _puit_voisin = next((_voisin for _voisin in _adjacence[_noeud] if _voisin in _ensemble_puits), None)
+                if _puit_voisin is not None:
+                    _meilleur_routage = _puit_voisin
+                else:
+                    for _voisin in Simulateur.SvoisinsOrdonnes(_noeud, _adjacence, _rang):
+                        if _meilleur_energie <= _noeuds[_voisin]['batterie'] \
+                                and _voisin in _dominants \
+                                and (_noeuds[_voisin]['route'] == -1 or
+                                     _noeuds[_noeuds[_voisin]['route']]['route'] != _voisin):
+                            _meilleur_energie = _noeuds[_voisin]['batterie']
+                            _meilleur_routage = _voisin
+                _noeuds[_noeud]['route'] = _meilleur_routage
 
         return _reseau
 
     @staticmethod
-    def SrouteRecursive(_noeud, _reseau, _ensemble_dominant):
+    def SvoisinsOrdonnes(_noeud, _adjacence, _rang):
+        """
+            Liste les voisins d'un noeud dans l'ordre où ils apparaissent dans les arcs énumérés par Graph.edges() :
+            d'abord les voisins qui précèdent le noeud dans l'ordre des noeuds (triés selon cet ordre), puis les autres
+            dans l'ordre de la liste d'adjacence du noeud
+
+        :param _noeud: int, le numéro du noeud
+        :param _adjacence: AdjacencyView NetworkX, la liste d'adjacence du graphe
+        :param _rang: dict{int : int}, la position de chaque noeud dans l'ordre des noeuds du graphe
+        :return: int[], les voisins du noeud
         """
-            Fonction récursive pour déterminer le routage des noeuds précédents le _noeud
+        _rang_noeud = _rang[_noeud]
+        _precedents = sorted((_voisin for _voisin in _adjacence[_noeud] if _rang[_voisin] < _rang_noeud),
+                             key=_rang.__getitem__)
+        _suivants = [_voisin for _voisin in _adjacence[_noeud] if _rang[_voisin] > _rang_noeud]
+        return _precedents + _suivants
 
-        :param _noeud: int, le numéro du noeud source (commencer par le puit pour couvrir l'ensemble du graphe
+    @staticmethod
+    def SrouteParcoursLargeur(_noeud, _reseau, _ensemble_dominant):
+        """
+            Détermine, par un parcours en largeur de l'ensemble dominant, le routage des noeuds situés derrière le
+            _noeud : chaque noeud atteint envoie ses données vers le noeud depuis lequel il a été atteint. Chaque arc
+            n'est examiné qu'une fois dans chaque sens, O(n + m), et aucun appel récursif n'est effectué.
+            L'ensemble dominant étant un arbre, le routage obtenu est celui de son unique chemin vers _noeud.
+            Avec plusieurs sources, le parcours part de toutes à la fois : chaque noeud route vers la source la plus
+            proche (la première de la liste en cas d'égalité), pour le même coût O(n + m) quel que soit leur nombre.
+
+        :param _noeud: int ou int[], le numéro du ou des noeuds sources (commencer par les puits pour couvrir
+            l'ensemble du graphe), dont le routage doit déjà être déterminé
         :param _reseau: Reseau, le réseau à traiter
         :param _ensemble_dominant: Graphe networkX l'ensemble dominant associé au graphe
         """
-        _log.Linfo("Début ## Simulateur.SrouteRecursive")
-        # TODO : Ajoiter l'exclusion des arcs déjà visités pour l'optimisation de l'algorithme
+        _log.Linfo("Début ## Simulateur.SrouteParcoursLargeur")
 
-        if type(_noeud) is not int or _noeud < 0:
+        _sources = _noeud if type(_noeud) is list else [_noeud]
+        if any(type(_source) is not int or _source < 0 for _source in _sources):
             _log.Lerror("Valeur Argument errone _noeud")
             raise Exception("Valeur Argument errone _noeud")
         from Modele.Reseau import Reseau
@@ -637,27 +1242,71 @@ class Simulateur:
             _log.Lerror("Valeur Argument errone _ensemble_dominant")
             raise Exception("Valeur Argument errone _ensemble_dominant")
 
-        for _arc in _ensemble_dominant.edges():
-            if _arc[0] == _noeud and _reseau.R_graphe.nodes[_arc[1]]['route'] == -1:
-                _reseau.R_graphe.nodes[_arc[1]]['route'] = _noeud
-                Simulateur.SrouteRecursive(_arc[1], _reseau, _ensemble_dominant)
-            elif _arc[1] == _noeud and _reseau.R_graphe.nodes[_arc[0]]['route'] == -1:
-                _reseau.R_graphe.nodes[_arc[0]]['route'] = _noeud
-                Simulateur.SrouteRecursive(_arc[0], _reseau, _ensemble_dominant)
+        _noeuds = _reseau.R_graphe.nodes
+        _adjacence = _ensemble_dominant.adj
+        _file = deque(_sources)
+        while _file:
+            _parent = _file.popleft()
+            for _voisin in _adjacence[_parent]:
+                if _noeuds[_voisin]['route'] == -1:
+                    _noeuds[_voisin]['route'] = _parent
+                    _file.append(_voisin)
+
+    def SmodeleEnergie(self):
+        """
+            Permet d'obtenir le modèle de consommation énergétique correspondant aux paramètres du simulateur
+
+            :return: ModeleEnergie, le modèle
+        """
+        return ModeleEnergie.MENcreer(self.S_modele_energie,
+                                      self.S_unite_consommation_recolte,
+                                      self.S_unite_consommation_emission,
+                                      self.S_unite_consommation_reception,
+                                      self.S_radio_amplification,
+                                      self.S_radio_exposant)
+
+    def __StoursAvantRoulement(self, _dernier_roulement):
+        """
+            Permet de déterminer le nombre de récoltes qui peuvent être simulées avant le prochain changement de rôle
+            des capteurs
+
+            :param _dernier_roulement: int, le moment du dernier changement de rôle
+            :return: int, le nombre de récoltes (au moins une)
+        """
+        if self.S_intervalle_roulement == 0:
+            return sys.maxsize
+
+        _tours = math.ceil((self.S_intervalle_roulement - (self.S_duree_de_vie - _dernier_roulement))
+                           / self.S_intervalle_recolte)
+        return max(1, _tours)
 
-    def __SsimulationSurUnRoulement(self, _reseau, _capteurs_deconnectes):
+    def __SsimulationSurUnRoulement(self, _reseau, _capteurs_deconnectes, _tours_max=1):
         """
-            Permet de simuler la consommation énergétique du réseau sur une unité de temps.
+            Permet de simuler la consommation énergétique du réseau sur une unité de temps. Si _tours_max est supérieur
+            à 1, les récoltes suivantes sont enchaînées directement tant qu'aucun capteur ne tombe à court d'énergie.
 
             :param _reseau: Reseau, le réseau à traiter
             :param _capteurs_deconnectes: la liste des capteurs déconnectés de la passerelle
+            :param _tours_max: int, le nombre maximum de récoltes à simuler
             :return: Reseau, le réseau traité
         """
         _log.Linfo("Début ## Simulateur.__SsimulationSurUnRoulement")
 
-        self.S_duree_de_vie += self.S_intervalle_recolte
-        self.S_duree_simulation += self.S_intervalle_recolte
-        self.__Sconsommation(_reseau, _capteurs_deconnectes)
+        _tours = 1
+        if self.S_consommation_vectorielle:
+            _moteur = self.__SmoteurEnergie(_reseau)
+            if _tours_max > 1:
+                _tours = _moteur.MEconsommationSansEvenement(_capteurs_deconnectes, _tours_max)
+            else:
+                _moteur.MEconsommation(_capteurs_deconnectes)
+            _moteur.MEappliquer(_reseau)
+            self.S_nouveaux_capteurs_vides = _moteur.MEnouveauxCapteursVides()
+        else:
+            self.__Sconsommation(_reseau, _capteurs_deconnectes)
+            self.S_nouveaux_capteurs_vides = None
+
+        self.S_duree_de_vie += self.S_intervalle_recolte * _tours
+        self.S_duree_simulation += self.S_intervalle_recolte * _tours
         return _reseau
 
     def __Sconsommation(self, _reseau, _capteurs_deconnectes):
@@ -672,6 +1321,11 @@ class Simulateur:
         """
         _log.Linfo("Début ## Simulateur.__Sconsommation")
 
+        if self.S_consommation_vectorielle:
+            _moteur = self.__SmoteurEnergie(_reseau)
+            _moteur.MEconsommation(_capteurs_deconnectes)
+            return _moteur.MEappliquer(_reseau)
+
         # On prend chaque capteur et on suit le parcourt que suit son envoie de données en diminuant
         # l'énergie des noeuds relais au passage
 
@@ -683,6 +1337,20 @@ class Simulateur:
 
         _contenants_donnees = []
 
+        # Coût d'une émission de chaque noeud vers sa route, selon le modèle de consommation, calculé une fois par
+        # configuration
+        if self.S_emissions is None:
+            _modele = self.SmodeleEnergie()
+            self.S_emissions = dict()
+            for _noeud, _donnees in _reseau.R_graphe.nodes(data=True):
+                _longueur = 0
+                if _modele.MEN_DISTANCES and _donnees["route"] in _reseau.R_graphe:
+                    # Même calcul que MoteurEnergie.MElongueursLiens, pour obtenir exactement les mêmes coûts
+                    _ecart = np.subtract(_donnees["pos"], _reseau.R_graphe.nodes[_donnees["route"]]["pos"])
+                    _longueur = float(np.hypot(_ecart[0], _ecart[1]))
+                self.S_emissions[_noeud] = _modele.MENemission(_longueur)
+        _emissions = self.S_emissions
+
         # Chaque capteur récolte de l'information (sauf le puit ou si ils n'ont plus d'énergie),
         # ils sont donc tous placés dans la liste
         for _noeud in _reseau.R_graphe.nodes():
@@ -704,7 +1372,7 @@ class Simulateur:
             _noeud = _contenants_donnees[0]
             _noeud_destinataire = _reseau.R_graphe.nodes()[_noeud]["route"]
 
-            if _reseau.R_graphe.nodes()[_noeud]["batterie"] - self.S_unite_consommation_emission < 0:
+            if _reseau.R_graphe.nodes()[_noeud]["batterie"] - _emissions[_noeud] < 0:
                 _reseau.R_graphe.nodes()[_noeud]["batterie"] = 0
             elif _reseau.R_graphe.nodes()[_noeud_destinataire]["role"] != Roles.PUIT and \
                     _reseau.R_graphe.nodes()[_noeud_destinataire]["batterie"] - self.S_unite_consommation_reception < 0:
@@ -713,19 +1381,21 @@ class Simulateur:
                 if _reseau.R_graphe.nodes()[_noeud_destinataire]["role"] != Roles.PUIT:
                     _contenants_donnees.append(_noeud_destinataire)
                     _reseau.R_graphe.nodes()[_noeud_destinataire]["batterie"] -= self.S_unite_consommation_reception
-                _reseau.R_graphe.nodes()[_noeud]["batterie"] -= self.S_unite_consommation_emission
+                _reseau.R_graphe.nodes()[_noeud]["batterie"] -= _emissions[_noeud]
             _contenants_donnees.remove(_noeud)
 
         return _reseau
 
     @staticmethod
-    def SfinDeVieAtteinte(_reseau, _intervalle_roulement):
+    def SfinDeVieAtteinte(_reseau, _intervalle_roulement, _accessibilite=None):
         """
             Permet de déterminer si le réseau a atteint sa fin de vie. Un ratio du nombre de capteur relié au puit est
             utilisé.
 
         :param _reseau: Reseau, le réseau à traiter
         :param _intervalle_roulement : float, l'intervalle de temps entre chaque changement de rôle des capteurs
+        :param _accessibilite : Accessibilite, les noeuds reliés au puit dans le réseau sans les capteurs vides. Si
+            None, elle est calculée à partir du réseau
         :return:    boolean, vrai si la fin de vie du réseau a été atteinte
                     int[], liste des noeuds déconnectés
         """
@@ -741,48 +1411,166 @@ class Simulateur:
 
         # Pour chaque noeud, suivre la chaine de routage qui le lie au puit. Si la chaîne est brisée décompter ce noeud
         _noeuds_deconnectes = []
+        # Mêmes noeuds que _noeuds_deconnectes, pour des tests d'appartenance en temps constant
+        _ensemble_deconnectes = set()
         _fin_de_vie_atteinte = False
-        _puit = 0
 
-        # On récupère une copie du réseau sans les noeuds vides puis on le configure topologiquement
-        _reseau_sans_capteurs_vides, _noeuds_vides = Simulateur.SreseauSansCapteursVides(_reseau)
-        _reseau_sans_capteurs_vides = Simulateur.SconfigurationTopologique(_reseau_sans_capteurs_vides)
+        # Récupération des puits
+        _puits = set(Simulateur.Spuits(_reseau))
 
-        # Récupération du puit
-        for _noeud in _reseau.R_graphe.nodes():
-            if _reseau.R_graphe.node[_noeud]['role'] == Roles.PUIT:
-                _puit = _noeud
-                break
+        # Un seul parcours depuis les puits suffit pour connaître l'ensemble des noeuds qui leur sont reliés
+        # Seule la connexité compte : aucune configuration topologique (ensemble dominant, routage) n'est nécessaire
+        if _accessibilite is None:
+            _accessibilite = Simulateur.Saccessibilite(_reseau)
+        _noeuds_vides = _accessibilite.A_noeuds_vides
+
+        # Sans changement de rôle, les chaînes de routage de tous les noeuds sont vérifiées en une seule fois
+        _chaines_reliees = None
+        if _intervalle_roulement == 0:
+            _chaines_reliees = Simulateur.SchainesReliees(_reseau)
 
         # Pour tout les noeuds, on teste si le noeud est relié sinon dans le cas du premier cycle on descend de routage
         # en routage vers le puit
-        for _noeud in _reseau.R_graphe.nodes():
+        for _i, _noeud in enumerate(_reseau.R_graphe.nodes()):
             # Si on détecte une anomalie : le routage d'un noeud est lui-même, on déconnecte ce noeud
-            if _noeud != _puit and _reseau.R_graphe.node[_noeud]['route'] == _noeud:
+            if _noeud not in _puits and _reseau.R_graphe.node[_noeud]['route'] == _noeud:
                 _noeuds_deconnectes.append(_noeud)
+                _ensemble_deconnectes.add(_noeud)
             # Si il n'y a pas de chemin possible vers le puit on déconnecte le noeud
-            elif _noeud in _noeuds_vides or not has_path(_reseau_sans_capteurs_vides.R_graphe, _noeud, _puit):
+            elif _noeud in _noeuds_vides or not _accessibilite.Aaccessible(_noeud):
                 _noeuds_deconnectes.append(_noeud)
-            # Au premier tour on test si la route n'est pas brisée
-            elif _intervalle_roulement == 0:
-                # La récurisivité est utilisée pour descendre de routage en routage jusqu'au puit
-                _, _noeuds_deconnectes = Simulateur.Sparcourt(_noeud, _reseau, _noeuds_deconnectes)
-
-        # On teste si la fin de vie a été atteinte en fonction du ratio de noeuds déconnecté toléré
-        if len(_noeuds_deconnectes) / (_reseau.R_nbr_noeuds - 1) >= Simulateur.S_fin_de_vie:
+                _ensemble_deconnectes.add(_noeud)
+            # Au premier tour on test si la route n'est pas brisée : seules les chaînes brisées sont parcourues, pour
+            # ajouter leurs noeuds dans le même ordre qu'un parcours complet
+            elif _intervalle_roulement == 0 and not _chaines_reliees[_i]:
+                _, _noeuds_deconnectes = Simulateur.Sparcourt(_noeud, _reseau, _noeuds_deconnectes,
+                                                              _ensemble_deconnectes)
+
+        # On teste si la fin de vie a été atteinte en fonction du ratio de noeuds déconnecté toléré. Un réseau sans
+        # autre capteur que ses puits n'a rien à récolter : sa fin de vie est atteinte
+        _nbr_capteurs = _reseau.R_nbr_noeuds - len(_puits)
+        if _nbr_capteurs <= 0 or len(_noeuds_deconnectes) / _nbr_capteurs >= Simulateur.S_fin_de_vie:
             _fin_de_vie_atteinte = True
 
         return _fin_de_vie_atteinte, _noeuds_deconnectes
 
     @staticmethod
-    def Sparcourt(_noeud, _reseau, _noeuds_deconnectes):
+    def Spuit(_reseau):
         """
-            Fonction récursive qui permet de parcourir remonter d'un noeud vers le puit et de déterminer si ce noeuds
-            n'est pas déconnecté de celui-ci.
+            Permet de récupérer le puit du réseau
+
+        :param _reseau: Reseau, le réseau à traiter
+        :return: int, le numéro du premier noeud de rôle puit, 0 si aucun n'a été trouvé
+        """
+        for _noeud in _reseau.R_graphe.nodes():
+            if _reseau.R_graphe.node[_noeud]['role'] == Roles.PUIT:
+                return _noeud
+        return 0
+
+    @staticmethod
+    def Spuits(_reseau):
+        """
+            Permet de récupérer les puits du réseau
+
+        :param _reseau: Reseau, le réseau à traiter
+        :return: int[], les noeuds de rôle puit, dans l'ordre des noeuds du graphe
+        """
+        return [_noeud for _noeud, _donnees in _reseau.R_graphe.nodes(data=True) if _donnees['role'] == Roles.PUIT]
+
+    @staticmethod
+    def Saccessibilite(_reseau):
+        """
+            Permet de déterminer, en un seul parcours, l'ensemble des noeuds reliés à un puit par des capteurs qui ont
+            encore de l'énergie. L'objet retourné peut être transmis à SfinDeVieAtteinte ou à
+            Statistiques.SajouterDonnees tant que les niveaux de batterie n'ont pas changé.
+
+        :param _reseau: Reseau, le réseau à traiter
+        :return: Accessibilite, les noeuds reliés au puit
+        """
+        _log.Linfo("Début ## Simulateur.Saccessibilite")
+
+        # Le parcours ignore lui-même les capteurs vides, il peut donc se faire directement sur le graphe complet
+        return Accessibilite(_reseau.R_graphe, Simulateur.Spuits(_reseau), Simulateur.ScapteursVides(_reseau))
+
+    @staticmethod
+    def SchainesReliees(_reseau):
+        """
+            Détermine par saut de pointeurs, pour tous les noeuds à la fois, si la chaîne de routage du noeud atteint le
+            puit sans passer par un capteur vide. Aucun appel récursif, O(n log n).
+
+            :param _reseau: Reseau, le réseau à traiter
+            :return: numpy.ndarray(bool), pour chaque noeud dans l'ordre du graphe, vrai si sa chaîne de routage est
+                reliée au puit
+        """
+        _log.Linfo("Début ## Simulateur.SchainesReliees")
+
+        _, _fins, _puits = Simulateur.__SfinsDeChaines(_reseau)
+
+        return _puits[_fins]
+
+    @staticmethod
+    def SchargePuits(_reseau):
+        """
+            Détermine la charge de chaque puit : le nombre de capteurs dont la chaîne de routage aboutit à ce puit sans
+            passer par un capteur vide. Comme SchainesReliees, par saut de pointeurs, O(n log n) quel que soit le nombre
+            de puits.
+
+            :param _reseau: Reseau, le réseau à traiter
+            :return: dict{int : int}, pour chaque puit, dans l'ordre des noeuds, le nombre de capteurs qui lui envoient
+                leurs données
+        """
+        _log.Linfo("Début ## Simulateur.SchargePuits")
+
+        _noeuds, _fins, _puits = Simulateur.__SfinsDeChaines(_reseau)
+
+        # Les puits eux-même ne sont pas comptés
+        _charges = np.bincount(_fins[_puits[_fins] & ~_puits], minlength=len(_noeuds))
+        return {_noeuds[_i]: int(_charges[_i]) for _i in np.flatnonzero(_puits).tolist()}
+
+    @staticmethod
+    def __SfinsDeChaines(_reseau):
+        """
+            Suit par saut de pointeurs, pour tous les noeuds à la fois, les chaînes de routage jusqu'à leur fin
+
+            :param _reseau: Reseau, le réseau à traiter
+            :return:    int[], les noeuds du graphe, dans l'ordre du graphe
+                        numpy.ndarray(int), pour chaque noeud, la position du noeud sur lequel sa chaîne s'arrête
+                        numpy.ndarray(bool), pour chaque noeud, vrai si c'est un puit
+        """
+        _noeuds = _reseau.R_graphe.nodes
+        _index = {_noeud: _i for _i, _noeud in enumerate(_noeuds)}
+        _nbr_noeuds = len(_index)
+
+        # Les chaînes s'arrêtent sur les puits, les capteurs vides et les noeuds sans routage valide, qui pointent sur
+        # eux-même
+        _suivant = np.arange(_nbr_noeuds)
+        _puits = np.zeros(_nbr_noeuds, dtype=bool)
+        for _noeud, _i in _index.items():
+            _donnees = _noeuds[_noeud]
+            if _donnees["role"] == Roles.PUIT:
+                _puits[_i] = True
+            elif _donnees["batterie"] > 0 and _donnees["route"] in _index:
+                _suivant[_i] = _index[_donnees["route"]]
+
+        for _ in range(max(1, int(_nbr_noeuds).bit_length())):
+            _suivant = _suivant[_suivant]
+
+        # Une chaîne qui boucle sans atteindre de puit s'arrête sur un noeud quelconque de la boucle
+        return list(_index), _suivant, _puits
+
+    @staticmethod
+    def Sparcourt(_noeud, _reseau, _noeuds_deconnectes, _ensemble_deconnectes=None):
+        """
+            Permet de remonter d'un noeud vers le puit et de déterminer si ce noeud n'est pas déconnecté de celui-ci.
+            Si la chaîne est brisée, le capteur vide qui la brise (si il n'est pas déjà déconnecté) puis les noeuds
+            parcourus, du plus proche de la rupture au noeud de départ, sont ajoutés aux noeuds déconnectés.
+            Le parcours est itératif : la profondeur de l'arbre de routage n'est pas limitée.
 
             :param _noeud: int, le numéro du noeud d'où partir
             :param _reseau: Le réseau à traiter
             :param _noeuds_deconnectes: int[],  l'ensemble des noeuds déjà parcourus et déconnecté
+            :param _ensemble_deconnectes: set(int), les mêmes noeuds que _noeuds_deconnectes, complété en même temps
+                que lui, None pour le construire à partir de la liste
             :return:    bool, vrai si le noeud est déconnecté, faux sinon
                         _noeuds_deconnectes (int[]), l'ensemble des noeuds déjà parcourus et déconnecté
         """
@@ -798,37 +1586,50 @@ class Simulateur:
             _log.Lerror("Valeur Argument errone _noeuds_deconnectes")
             raise Exception("Valeur Argument errone _noeuds_deconnectes")
 
-        # Si le noeud rencontré est le puit on stop la récursivité : le noeud initial n'est pas déconnecté
-        if _reseau.R_graphe.nodes()[_noeud]["role"] == Roles.PUIT:
-            return False, _noeuds_deconnectes
+        if _ensemble_deconnectes is None:
+            _ensemble_deconnectes = set(_noeuds_deconnectes)
+
+        _noeuds = _reseau.R_graphe.nodes
+        _chemin = []
+        _parcourus = set()
+        _courant = _noeud
+        while True:
+            # Si le noeud rencontré est le puit on s'arrête : le noeud initial n'est pas déconnecté
+            if _noeuds[_courant]["role"] == Roles.PUIT:
+                return False, _noeuds_deconnectes
+
+            # Si le noeud rencontré a déjà été considéré comme déconnecté, on s'arrête : le noeud initial est
+            # déconnecté
+            if _courant in _ensemble_deconnectes:
+                break
 
-        # Si le noeud rencontré a déjà été considéré comme déconnecté, on stop : le noeud initial est déconnecté
-        elif _noeud in _noeuds_deconnectes:
-            return True, _noeuds_deconnectes
+            # Si le noeud n'a plus de batterie on s'arrête : le noeud initial est déconnecté
+            if _noeuds[_courant]["batterie"] <= 0:
+                _noeuds_deconnectes.append(_courant)
+                _ensemble_deconnectes.add(_courant)
+                break
 
-        else:
-            # Si le noeud n'a plus de batterie on stop : le noeud initial est déconnecté
-            if _reseau.R_graphe.nodes()[_noeud]["batterie"] <= 0:
-                _noeuds_deconnectes.append(_noeud)
-                return True, _noeuds_deconnectes
+            # Une chaîne qui boucle ou dont le routage n'existe pas n'atteindra jamais le puit
+            _suivant = _noeuds[_courant]["route"]
+            _parcourus.add(_courant)
+            _chemin.append(_courant)
+            if _suivant in _parcourus or _suivant not in _noeuds:
+                break
+            _courant = _suivant
 
-            else:
-                # Sinon on applique la récursivité
-                _chaine_brisee, _noeuds_deconnectes = Simulateur.Sparcourt(_reseau.R_graphe.nodes()[_noeud]["route"],
-                                                                           _reseau,
-                                                                           _noeuds_deconnectes)
-                # Suivant les résultats on ajoute ou pas le noeud parmis les noeuds déconnectés
-                if _chaine_brisee:
-                    _noeuds_deconnectes.append(_noeud)
-                    return True, _noeuds_deconnectes
-                else:
-                    return False, _noeuds_deconnectes
+        # Les noeuds parcourus sont ajoutés parmis les noeuds déconnectés, du plus proche de la rupture au premier
+        for _parcouru in reversed(_chemin):
+            _noeuds_deconnectes.append(_parcouru)
+            _ensemble_deconnectes.add(_parcouru)
+        return True, _noeuds_deconnectes
 
     @staticmethod
     def SreseauSansCapteursVides(_reseau):
         """
-            Permet de créer une copie d'un réseau en lui enlevant les capteurs qui n'ont plus d'énergie (et les arcs
-            associés)
+            Permet d'obtenir un réseau dont le graphe est une vue filtrée du graphe d'origine, sans les capteurs qui
+            n'ont plus d'énergie (ni les arcs associés). Aucune donnée n'est copiée : la vue est en lecture seule et
+            reflète les attributs du graphe d'origine. L'ordre de parcours des noeuds et des arcs est le même que celui
+            du graphe d'origine privé des capteurs vides.
 
             :param _reseau: Reseau, le réseau à traiter
             :return:    Reseau, Le réseau sans les capteurs qui n'ont plus d'énergie (ni les arcs associés)
@@ -841,16 +1642,27 @@ class Simulateur:
             _log.Lerror("Valeur Argument errone _reseau")
             raise Exception("Valeur Argument errone _reseau")
 
-        _copie = copy.deepcopy(_reseau)
+        _noeuds_vides = Simulateur.ScapteursVides(_reseau)
+
+        _reseau_filtre = Reseau(_reseau.R_nbr_noeuds, nx.restricted_view(_reseau.R_graphe, _noeuds_vides, []))
+        _reseau_filtre.R_ensemble_dominant = _reseau.R_ensemble_dominant
+        _reseau_filtre.R_capacite_batterie_max = _reseau.R_capacite_batterie_max
+
+        return _reseau_filtre, _noeuds_vides
+
+    @staticmethod
+    def ScapteursVides(_reseau):
+        """
+            Permet de lister les capteurs qui n'ont plus d'énergie
+
+            :param _reseau: Reseau, le réseau à traiter
+            :return: int[], l'ensemble des noeuds sans énergie (hors puits)
+        """
         _noeuds_vides = []
 
         # Parcourt de tout les noeuds, si la batterie est vide on l'ajoute à la liste
-        for _noeud in _copie.R_graphe.nodes():
-            if _copie.R_graphe.nodes()[_noeud]["role"] != Roles.PUIT and \
-                    _copie.R_graphe.nodes()[_noeud]["batterie"] == 0:
+        for _noeud, _donnees in _reseau.R_graphe.nodes(data=True):
+            if _donnees["role"] != Roles.PUIT and _donnees["batterie"] == 0:
                 _noeuds_vides.append(_noeud)
 
-        # Puis on supprime tout les noeuds vides du graphe
-        _copie.R_graphe.remove_nodes_from(_noeuds_vides)
-
-        return _copie, _noeuds_vides
+        return _noeuds_vides
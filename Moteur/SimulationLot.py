@@ -0,0 +1,321 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module SimulationLot
+
+    Module contenant la classe qui simule en une seule passe plusieurs intervalles de changement de rôle à partir du
+    même réseau : SimulationLot
+
+"""
+
+import math
+import sys
+
+import numpy as np
+
+from Moteur.MainteneurDominant import MainteneurDominant
+from Moteur.MoteurEnergie import MoteurEnergie
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class SimulationLot:
+    """
+        class SimulationLot
+
+        Simule K cycles (un par intervalle de changement de rôle) qui partent du même état du réseau. Les niveaux de
+        batterie des K cycles sont stockés dans une matrice NumPy (K, n) : entre deux événements, les récoltes de tous
+        les cycles sont appliquées ensemble, une opération vectorielle par récolte, au lieu d'une boucle Python par
+        cycle.
+        Seuls les événements sont traités cycle par cycle : changement de rôle (configuration topologique), mort d'un
+        capteur (vérification de la fin de vie) et récolte au cours de laquelle un capteur risque de tomber à court
+        d'énergie (MoteurEnergie.MEconsommation). Pour cela un unique réseau est utilisé : l'état du cycle concerné y
+        est restauré (Reseau.RrestaurerEtat), puis capturé à nouveau si sa configuration topologique a changé.
+
+        Chaque cycle suit exactement les mêmes étapes que Simulateur.SsimulerCycle, dans le même ordre, avec les mêmes
+        opérations flottantes : les résultats sont identiques. Ils sont rendus sous la forme de ceux de
+        Simulateur.SsimulerCycleIsole pour être rejoués par le simulateur.
+
+        :var self.SL_simulateur : Simulateur, le simulateur dont les paramètres sont utilisés
+        :var self.SL_reseau : Reseau, le réseau de travail, modifié sur place
+        :var self.SL_intervalles : double[K], l'intervalle de changement de rôle de chaque cycle
+        :var self.SL_modele : ModeleEnergie, le modèle de consommation énergétique du simulateur
+        :var self.SL_noeuds : int[n], les numéros des noeuds, dans l'ordre des colonnes des matrices
+        :var self.SL_puits : numpy.ndarray(bool)[n], vrai si le noeud est un puit
+        :var self.SL_batterie_initiale : numpy.ndarray(float)[n], les niveaux de batterie de départ
+        :var self.SL_batteries : numpy.ndarray(float)[K, n], les niveaux de batterie de chaque cycle
+        :var self.SL_actifs : numpy.ndarray(bool)[K, n], vrai si le capteur récolte de l'information dans ce cycle
+        :var self.SL_paquets_valides : numpy.ndarray(bool)[K], faux si une chaîne de routage n'aboutit pas à un puit
+        :var self.SL_sequences : [(numpy.ndarray(float), numpy.ndarray(int))], les suites de charges subies par
+            chaque noeud lors d'une récolte, selon le routage du cycle (cf MoteurEnergie.MEsequenceCharges)
+        :var self.SL_charges : numpy.ndarray(float)[K, n], l'énergie consommée par chaque noeud lors d'une récolte
+        :var self.SL_moteurs : [MoteurEnergie], le moteur de chaque cycle, utilisé pour les récoltes à risque
+        :var self.SL_mainteneurs : [MainteneurDominant], le mainteneur de l'ensemble dominant de chaque cycle : un
+            arbre réparé dépend des configurations précédentes de son cycle, il ne peut pas être partagé
+        :var self.SL_etats : [dict], l'état (Reseau.RcaptureEtat) de chaque cycle lors de son dernier passage sur le
+            réseau de travail
+        :var self.SL_deconnectes : [int[]], les capteurs déconnectés de chaque cycle
+        :var self.SL_fin : bool[K], vrai si la fin de vie du cycle a été atteinte
+        :var self.SL_duree : int[K], la durée de vie courante de chaque cycle
+        :var self.SL_dernier_roulement : int[K], le moment du dernier changement de rôle de chaque cycle
+        :var self.SL_verifications_evitees : int[K], le nombre de vérifications de fin de vie évitées par cycle
+        :var self.SL_enregistrements : [[(dict, int)]], les états à enregistrer de chaque cycle, avec leur moment
+    """
+
+    def __init__(self, _simulateur, _reseau, _intervalles):
+        """
+            Constructeur de la classe
+
+            :param _simulateur: Simulateur, le simulateur dont les paramètres sont utilisés
+            :param _reseau: Reseau, le réseau dans son état initial
+            :param _intervalles: double[], les intervalles de changement de rôle à simuler
+        """
+        _log.Linfo("Init -- SimulationLot")
+
+        if len(_intervalles) == 0:
+            _log.Lerror("Valeur Argument errone _intervalles")
+            raise Exception("Valeur Argument errone _intervalles")
+
+        self.SL_simulateur = _simulateur
+        self.SL_reseau = _reseau
+        self.SL_intervalles = list(_intervalles)
+        self.SL_modele = _simulateur.SmodeleEnergie()
+
+        _nbr_cycles = len(self.SL_intervalles)
+        _moteur = self.__SLmoteur()
+        self.SL_noeuds = _moteur.ME_noeuds
+        self.SL_puits = _moteur.ME_puits
+        self.SL_batterie_initiale = _moteur.ME_batterie.copy()
+
+        _forme = (_nbr_cycles, len(self.SL_noeuds))
+        self.SL_batteries = np.tile(self.SL_batterie_initiale, (_nbr_cycles, 1))
+        self.SL_actifs = np.zeros(_forme, dtype=bool)
+        self.SL_paquets_valides = np.zeros(_nbr_cycles, dtype=bool)
+        self.SL_sequences = [None] * _nbr_cycles
+        self.SL_charges = np.zeros(_forme, dtype=float)
+        self.SL_moteurs = [None] * _nbr_cycles
+        self.SL_mainteneurs = [MainteneurDominant(_simulateur.S_seuil_reparation_dominant,
+                                                  _simulateur.S_seuil_epuisement_dominant)
+                               for _ in range(_nbr_cycles)]
+
+        _etat_initial = _reseau.RcaptureEtat()
+        self.SL_etats = [_etat_initial] * _nbr_cycles
+        self.SL_deconnectes = [[] for _ in range(_nbr_cycles)]
+        self.SL_fin = [False] * _nbr_cycles
+        self.SL_duree = [0] * _nbr_cycles
+        self.SL_dernier_roulement = [0] * _nbr_cycles
+        self.SL_verifications_evitees = [0] * _nbr_cycles
+        self.SL_enregistrements = [[] for _ in range(_nbr_cycles)]
+        # Cycle dont l'état (hors niveaux de batterie) occupe le réseau de travail
+        self.__SL_cycle_charge = None
+
+    def SLsimuler(self):
+        """
+            Simule tous les cycles jusqu'à leur fin de vie
+
+            :return: [dict{String : Objet}], pour chaque intervalle, dans l'ordre, le résultat au format de
+                Simulateur.SsimulerCycleIsole : duree_de_vie, duree_simulation, verifications_evitees et etats
+        """
+        _log.Linfo("Début ## SimulationLot.SLsimuler")
+
+        _simulateur = self.SL_simulateur
+
+        # Configuration topologique initiale et première vérification de la fin de vie de chaque cycle
+        for _cycle in range(len(self.SL_intervalles)):
+            self.__SLcharger(_cycle)
+            _simulateur.SconfigurationTopologique(self.SL_reseau, self.SL_mainteneurs[_cycle],
+                                                  _simulateur.S_cache_configuration)
+            self.__SLcapturer(_cycle)
+            self.__SLverifierFinDeVie(_cycle)
+
+        _en_cours = [_cycle for _cycle in range(len(self.SL_intervalles)) if not self.SL_fin[_cycle]]
+        while _en_cours:
+            _tours_max = dict()
+            _roulements = set()
+
+            # Changements de rôle, cycle par cycle
+            for _cycle in _en_cours:
+                _intervalle = self.SL_intervalles[_cycle]
+                if _intervalle != 0:
+                    if self.SL_duree[_cycle] == 0 \
+                            or self.SL_duree[_cycle] - self.SL_dernier_roulement[_cycle] >= _intervalle:
+                        self.SL_dernier_roulement[_cycle] = self.SL_duree[_cycle]
+                        self.__SLcharger(_cycle)
+                        _simulateur.SconfigurationTopologique(self.SL_reseau, self.SL_mainteneurs[_cycle],
+                                                              _simulateur.S_cache_configuration)
+                        self.__SLcapturer(_cycle)
+                        self.SL_enregistrements[_cycle].append((self.SL_etats[_cycle], self.SL_duree[_cycle]))
+                        self.__SLpreparer(_cycle)
+                        _roulements.add(_cycle)
+                _tours_max[_cycle] = self.__SLtoursAvantRoulement(_cycle)
+
+            _batteries_avant = self.SL_batteries.copy()
+            _tours = self.__SLconsommation(_en_cours, _tours_max)
+
+            # Vérification de la fin de vie, uniquement pour les cycles dont un capteur est mort ou dont les rôles ont
+            # changé (comme dans Simulateur.SsimulerCycle)
+            _nouveaux_vides = np.any((self.SL_batteries == 0) & (_batteries_avant != 0) & ~self.SL_puits, axis=1)
+            for _cycle in _en_cours:
+                self.SL_duree[_cycle] += _simulateur.S_intervalle_recolte * _tours[_cycle]
+                if _simulateur.S_verification_incrementale and _cycle not in _roulements \
+                        and not _nouveaux_vides[_cycle]:
+                    self.SL_verifications_evitees[_cycle] += 1
+                else:
+                    self.__SLcharger(_cycle)
+                    self.__SLverifierFinDeVie(_cycle)
+
+            _en_cours = [_cycle for _cycle in _en_cours if not self.SL_fin[_cycle]]
+
+        return [dict({"duree_de_vie": self.SL_duree[_cycle],
+                      "duree_simulation": self.SL_duree[_cycle],
+                      "verifications_evitees": self.SL_verifications_evitees[_cycle],
+                      "etats": self.SL_enregistrements[_cycle]})
+                for _cycle in range(len(self.SL_intervalles))]
+
+    def __SLconsommation(self, _en_cours, _tours_max):
+        """
+            Simule la consommation énergétique des cycles en cours jusqu'à leur prochain événement.
+            Les cycles dont les récoltes peuvent être enchaînées sans qu'aucun capteur ne meure avancent ensemble, une
+            opération vectorielle par récolte sur les suites de charges de tous ces cycles mises bout à bout ; les
+            autres simulent une seule récolte avec leur MoteurEnergie.
+
+            :param _en_cours: int[], les cycles en cours
+            :param _tours_max: dict{int : int}, le nombre maximum de récoltes avant le prochain changement de rôle de
+                chaque cycle
+            :return: dict{int : int}, le nombre de récoltes simulées par cycle
+        """
+        _tours = dict()
+        _lot = []
+        for _cycle in _en_cours:
+            _tours_sans_mort = 0
+            if _tours_max[_cycle] > 1 and self.SL_paquets_valides[_cycle]:
+                _tours_sans_mort = self.__SLtoursSansMort(_cycle)
+            if _tours_sans_mort > 0:
+                _tours[_cycle] = min(_tours_sans_mort, _tours_max[_cycle])
+                _lot.append(_cycle)
+            else:
+                _moteur = self.SL_moteurs[_cycle]
+                _moteur.ME_batterie = self.SL_batteries[_cycle].copy()
+                _moteur.MEconsommation(self.SL_deconnectes[_cycle])
+                self.SL_batteries[_cycle] = _moteur.ME_batterie
+                _tours[_cycle] = 1
+
+        if _lot:
+            _lot = np.array(_lot)
+            _restants = np.array([_tours[_cycle] for _cycle in _lot])
+            _actifs = self.SL_actifs[_lot]
+            _recolte_actifs = self.SL_modele.MEN_recolte * _actifs
+            # Suites de charges des cycles du lot mises bout à bout, les cases des noeuds décalées en conséquence
+            _sequences = [self.SL_sequences[_cycle] for _cycle in _lot]
+            _decalages = np.cumsum([0] + [len(_sequence) for _sequence, _ in _sequences[:-1]])
+            _sequence = np.concatenate([_sequence for _sequence, _ in _sequences])
+            _debuts = np.concatenate([_debuts + _decalage for (_, _debuts), _decalage in zip(_sequences, _decalages)])
+            # Les récoltes sont appliquées une à une, avec les mêmes opérations que MoteurEnergie, afin d'obtenir
+            # exactement les mêmes arrondis que la simulation cycle par cycle. Les cycles qui ont atteint leur
+            # nombre de récoltes sont calculés avec les autres mais ne sont pas mis à jour
+            for _recolte in range(int(_restants.max())):
+                _lignes = _restants > _recolte
+                _apres_recolte = self.SL_batteries[_lot] - _recolte_actifs
+                _apres = MoteurEnergie.MEappliquerSequence(_apres_recolte.ravel(), _sequence, _debuts)
+                self.SL_batteries[_lot[_lignes]] = _apres.reshape(_actifs.shape)[_lignes]
+
+        return _tours
+
+    def __SLtoursSansMort(self, _cycle):
+        """
+            Cf MoteurEnergie.MEtoursSansMort, pour un cycle
+
+            :param _cycle: int, le cycle
+            :return: int, le nombre de récoltes qui peuvent être enchaînées, 0 si aucune
+        """
+        _moteur = self.SL_moteurs[_cycle]
+        _moteur.ME_batterie = self.SL_batteries[_cycle]
+        _tours = _moteur.MEtoursSansMort(self.SL_charges[_cycle])
+        return 0 if _tours is None else _tours
+
+    def __SLtoursAvantRoulement(self, _cycle):
+        """
+            Cf Simulateur.__StoursAvantRoulement, pour un cycle
+
+            :param _cycle: int, le cycle
+            :return: int, le nombre de récoltes (au moins une)
+        """
+        _simulateur = self.SL_simulateur
+        _intervalle = self.SL_intervalles[_cycle]
+        if not _simulateur.S_saut_evenements:
+            return 1
+        if _intervalle == 0:
+            return sys.maxsize
+
+        _tours = math.ceil((_intervalle - (self.SL_duree[_cycle] - self.SL_dernier_roulement[_cycle]))
+                           / _simulateur.S_intervalle_recolte)
+        return max(1, _tours)
+
+    def __SLverifierFinDeVie(self, _cycle):
+        """
+            Vérifie la fin de vie d'un cycle chargé sur le réseau de travail, enregistre son état final si elle est
+            atteinte et prépare ses tableaux sinon
+
+            :param _cycle: int, le cycle
+        """
+        _simulateur = self.SL_simulateur
+        _accessibilite = _simulateur.Saccessibilite(self.SL_reseau)
+        self.SL_fin[_cycle], self.SL_deconnectes[_cycle] = \
+            _simulateur.SfinDeVieAtteinte(self.SL_reseau, self.SL_intervalles[_cycle], _accessibilite)
+        if self.SL_fin[_cycle]:
+            self.__SLcapturer(_cycle)
+            self.SL_enregistrements[_cycle].append((self.SL_etats[_cycle], self.SL_duree[_cycle]))
+        else:
+            self.__SLpreparer(_cycle)
+
+    def __SLcharger(self, _cycle):
+        """
+            Place l'état d'un cycle sur le réseau de travail : restauration de son dernier état capturé, si un autre
+            cycle occupe le réseau, puis report des niveaux de batterie qui ont changé
+
+            :param _cycle: int, le cycle
+        """
+        if self.__SL_cycle_charge != _cycle:
+            self.SL_reseau.RrestaurerEtat(self.SL_etats[_cycle])
+            self.__SL_cycle_charge = _cycle
+        _noeuds = self.SL_reseau.R_graphe.nodes
+        _batteries = self.SL_batteries[_cycle]
+        # Comme MoteurEnergie.MEappliquer, seuls les niveaux qui ont changé sont reportés (en float)
+        for _index in np.flatnonzero(_batteries != self.SL_batterie_initiale).tolist():
+            _noeuds[self.SL_noeuds[_index]]["batterie"] = float(_batteries[_index])
+
+    def __SLcapturer(self, _cycle):
+        """
+            Capture l'état du réseau de travail comme dernier état du cycle. Seules la configuration topologique et la
+            fin de vie modifient autre chose que les niveaux de batterie : l'état n'est capturé qu'à ces moments.
+
+            :param _cycle: int, le cycle
+        """
+        self.SL_etats[_cycle] = self.SL_reseau.RcaptureEtat()
+
+    def __SLpreparer(self, _cycle):
+        """
+            Calcule, à partir du routage du cycle chargé sur le réseau de travail, les capteurs actifs, les paquets
+            émis, les suites de charges et la consommation par récolte de chaque noeud
+
+            :param _cycle: int, le cycle
+        """
+        _moteur = self.__SLmoteur()
+        _actifs = _moteur.MEactifs(self.SL_deconnectes[_cycle])
+        _paquets = _moteur.MEpaquetsParNoeud(_actifs)
+
+        self.SL_moteurs[_cycle] = _moteur
+        self.SL_actifs[_cycle] = _actifs
+        self.SL_paquets_valides[_cycle] = _paquets is not None
+        if _paquets is not None:
+            self.SL_sequences[_cycle] = _moteur.MEsequenceCharges(_actifs)
+            self.SL_charges[_cycle] = _moteur.MEchargesParTour(_actifs, _paquets)
+
+    def __SLmoteur(self):
+        """
+            :return: MoteurEnergie, un moteur construit sur le réseau de travail
+        """
+        return MoteurEnergie(self.SL_reseau, self.SL_modele)
@@ -0,0 +1,316 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module __main__
+
+    Point d'entrée en ligne de commande des moteurs, sans interface graphique : n'importe ni Qt, ni QtWebEngine, ni
+    matplotlib. Utilisé pour générer, simuler et exporter des réseaux sur des machines de calcul.
+
+    Utilisation (depuis la racine du projet) :
+        python -m Moteur generer --capteurs 100 --taille 100 --distance-max 20 --batterie 100
+        python -m Moteur simuler [--reseau reseau.xml] [--html] [--sans-etats] [--strategie parabolique]
+                                 [--energie premier_ordre]
+        python -m Moteur reprendre [--html]
+        python -m Moteur exporter destination
+        python -m Moteur montecarlo --reseaux 200 --graine 1 --capteurs 100 --taille 100 --distance-max 20
+
+    L'avancement est écrit sur la sortie d'erreur, une ligne par signal émis par les moteurs.
+
+"""
+
+import argparse
+import sys
+
+from Modele.Parametres import ParametresCreation
+from Moteur.Generateur import Generateur
+from Moteur.ModeleEnergie import ModeleEnergie
+from Moteur.MonteCarlo import MonteCarlo
+from Moteur.Optimiseur import Optimiseur
+from Moteur.Simulateur import Simulateur
+from Utilitaires.Connecteur import Connecteur
+from Utilitaires.FileManager import FileManager
+from Utilitaires.Log import Log
+
+
+_log = Log()
+
+
+def afficherSignal(_signal, *_donnees):
+    """
+        Écrit un signal émis par un moteur sur la sortie d'erreur
+
+        :param _signal: Signaux, le signal émis
+        :param _donnees: les données émises avec le signal, (float, String, float) pour Generateur, (dict) pour
+            Simulateur
+    """
+    if len(_donnees) == 1 and isinstance(_donnees[0], dict):
+        _texte = " ".join(str(_cle) + "=" + str(_valeur).replace("\n", " ") for _cle, _valeur in _donnees[0].items())
+    else:
+        _texte = " ".join(str(_donnee).replace("\n", " ") for _donnee in _donnees)
+    print(_signal.name + " " + _texte, file=sys.stderr)
+
+
+def afficherMessage(_message, _erreur):
+    """
+        Notificateur de FileManager : écrit le message sur la sortie d'erreur
+
+        :param _message: String, le message
+        :param _erreur: bool, vrai si il s'agit d'une erreur
+    """
+    print(("ERREUR " if _erreur else "INFORMATION ") + _message, file=sys.stderr)
+
+
+def enregistrerEtatInitial(_reseau, _show_html):
+    """
+        Remplace les résultats locaux par le réseau, enregistré comme état initial de la simulation
+
+        :param _reseau: Reseau, le réseau
+        :param _show_html: bool, vrai si l'état doit aussi être enregistré au format html
+    """
+    from Controleur.Statistiques import Statistiques
+
+    _file_manager = FileManager()
+    _file_manager.FMviderEtats(_garder_etat_initial=False)
+    _file_manager.FMenregistrerEtat(_reseau=_reseau, _show_html=_show_html)
+    Statistiques().SajouterDonnees(_reseau, 0)
+    _file_manager.FMsauvegarderStatistiques()
+
+
+def parametresCreation(_arguments):
+    """
+        Construit les paramètres de création d'un réseau à partir des arguments de la ligne de commande, avec les mêmes
+        règles que la fenêtre de paramétrage
+
+        :param _arguments: argparse.Namespace, les arguments de la ligne de commande
+        :return: ParametresCreation, les paramètres
+    """
+    return ParametresCreation(_max_size=_arguments.taille,
+                              _marge=int(_arguments.taille / 100),
+                              _max_distance=_arguments.distance_max,
+                              _min_distance=_arguments.distance_min,
+                              _nbr_capteurs=_arguments.capteurs,
+                              _capacitees_batteries=_arguments.batterie,
+                              _nbr_puits=_arguments.puits)
+
+
+def ajouterArgumentsCreation(_parseur):
+    """
+        Ajoute à une sous-commande les arguments de création d'un réseau
+
+        :param _parseur: argparse.ArgumentParser, le parseur de la sous-commande
+    """
+    _parseur.add_argument("--capteurs", type=int, required=True, help="nombre de capteurs, puits compris")
+    _parseur.add_argument("--puits", type=int, default=1, help="nombre de puits (passerelles)")
+    _parseur.add_argument("--taille", type=int, default=100, help="taille de la surface de répartition")
+    _parseur.add_argument("--distance-max", type=int, default=10,
+                          help="distance maximale pour que deux capteurs soient connectés")
+    _parseur.add_argument("--distance-min", type=int, default=1, help="distance minimale entre deux capteurs")
+    _parseur.add_argument("--batterie", type=int, default=100, help="capacité des batteries")
+
+
+def ajouterArgumentsSimulation(_parseur):
+    """
+        Ajoute à une sous-commande les arguments de simulation
+
+        :param _parseur: argparse.ArgumentParser, le parseur de la sous-commande
+    """
+    _parseur.add_argument("--strategie", default=Simulateur.S_strategie_optimisation,
+                          choices=sorted(Optimiseur.O_STRATEGIES),
+                          help="stratégie de recherche de l'intervalle de changement de rôle")
+    _parseur.add_argument("--energie", default=Simulateur.S_modele_energie,
+                          choices=sorted(ModeleEnergie.MEN_MODELES),
+                          help="modèle de consommation énergétique")
+    _parseur.add_argument("--processus", type=int, default=None, help="nombre maximum de processus")
+
+
+def generer(_arguments):
+    """
+        Sous-commande generer : génère un réseau et l'enregistre comme état initial
+
+        :param _arguments: argparse.Namespace, les arguments de la ligne de commande
+        :return: int, le code de retour
+    """
+    _log.Linfo("Début ## __main__.generer")
+
+    if _arguments.graine is not None:
+        import random
+        random.seed(_arguments.graine)
+
+    _reseau = Generateur(Connecteur(afficherSignal)).GcreerReseau(parametresCreation(_arguments))
+    enregistrerEtatInitial(_reseau, _arguments.html)
+
+    if _arguments.sortie is not None:
+        FileManager().FMsauvegarderReseauVersXML(_reseau, _arguments.sortie)
+    return 0
+
+
+def simuler(_arguments):
+    """
+        Sous-commande simuler : simule la vie du réseau enregistré comme état initial, ou d'un réseau chargé depuis un
+        fichier XML
+
+        :param _arguments: argparse.Namespace, les arguments de la ligne de commande
+        :return: int, le code de retour
+    """
+    _log.Linfo("Début ## __main__.simuler")
+
+    _file_manager = FileManager()
+    if _arguments.reseau is not None:
+        _reseau = _file_manager.FMchargerReseauDepuisXML(_arguments.reseau)
+        if _reseau is None:
+            return 1
+        enregistrerEtatInitial(_reseau, _arguments.html)
+    else:
+        _file_manager.FMviderEtats(_garder_etat_initial=True)
+        _reseau = _file_manager.FMchargerEtat(0)
+        if _reseau is None:
+            afficherMessage("Aucun réseau à exploiter", True)
+            return 1
+
+    Simulateur.S_strategie_optimisation = _arguments.strategie
+    Simulateur.S_modele_energie = _arguments.energie
+    Simulateur.S_enregistrer_etats = not _arguments.sans_etats
+    Simulateur.S_periode_journal = _arguments.journal
+    Simulateur.S_evaluation_parallele = not _arguments.sequentiel
+    Simulateur.S_nombre_processus = _arguments.processus
+
+    _simulateur = Simulateur(Connecteur(afficherSignal))
+    _simulateur.SlancerSimulation(_reseau, _arguments.html)
+
+    for _resultat in _simulateur.S_resultats:
+        print(str(_resultat["intervalle"]) + "\t" + str(_resultat["resultat"]))
+    return 0
+
+
+def reprendre(_arguments):
+    """
+        Sous-commande reprendre : poursuit la dernière simulation interrompue depuis son dernier point de contrôle
+
+        :param _arguments: argparse.Namespace, les arguments de la ligne de commande
+        :return: int, le code de retour
+    """
+    _log.Linfo("Début ## __main__.reprendre")
+
+    Simulateur.S_evaluation_parallele = not _arguments.sequentiel
+    Simulateur.S_nombre_processus = _arguments.processus
+
+    _simulateur = Simulateur(Connecteur(afficherSignal))
+    if _simulateur.SreprendreSimulation(_arguments.html) is None:
+        afficherMessage("Aucune simulation à reprendre", True)
+        return 1
+
+    for _resultat in _simulateur.S_resultats:
+        print(str(_resultat["intervalle"]) + "\t" + str(_resultat["resultat"]))
+    return 0
+
+
+def exporter(_arguments):
+    """
+        Sous-commande exporter : copie les résultats de la dernière simulation
+
+        :param _arguments: argparse.Namespace, les arguments de la ligne de commande
+        :return: int, le code de retour
+    """
+    _log.Linfo("Début ## __main__.exporter")
+
+    _resultat, _erreur = FileManager().FMexporterResultat(_arguments.destination)
+    if not _resultat:
+        afficherMessage(_erreur, True)
+        return 1
+    return 0
+
+
+def montecarlo(_arguments):
+    """
+        Sous-commande montecarlo : génère et simule de nombreux réseaux de mêmes paramètres, puis écrit le résultat de
+        chacun et la synthèse de leurs statistiques
+
+        :param _arguments: argparse.Namespace, les arguments de la ligne de commande
+        :return: int, le code de retour
+    """
+    _log.Linfo("Début ## __main__.montecarlo")
+
+    Simulateur.S_strategie_optimisation = _arguments.strategie
+    Simulateur.S_modele_energie = _arguments.energie
+
+    _monte_carlo = MonteCarlo(parametresCreation(_arguments), _arguments.reseaux, _arguments.graine,
+                              _arguments.processus, Connecteur(afficherSignal))
+    _monte_carlo.MClancer()
+
+    print("\t".join(("graine",) + MonteCarlo.MC_MESURES))
+    for _resultat in _monte_carlo.MC_resultats:
+        print("\t".join(str(_resultat[_cle]) for _cle in ("graine",) + MonteCarlo.MC_MESURES))
+
+    for _mesure, _statistiques in _monte_carlo.MCresume().items():
+        print("# " + _mesure + " : moyenne " + str(round(_statistiques["moyenne"], 3)) +
+              " ; écart type " + str(round(_statistiques["ecart_type"], 3)) +
+              " ; centiles " + ", ".join(str(_centile) + "% " + str(round(_valeur, 3))
+                                         for _centile, _valeur in _statistiques["centiles"].items()))
+    return 0
+
+
+def main(_arguments=None):
+    """
+        Méthode principale de la ligne de commande
+
+        :param _arguments: String[], les arguments, None pour ceux de sys.argv
+        :return: int, le code de retour
+    """
+    _parseur = argparse.ArgumentParser(prog="python -m Moteur",
+                                       description="Simulateur de Réseaux de Capteurs Dynamiques, sans interface")
+    _sous_parseurs = _parseur.add_subparsers(dest="commande")
+    _sous_parseurs.required = True
+
+    _generer = _sous_parseurs.add_parser("generer", help="génère un réseau et l'enregistre comme état initial")
+    ajouterArgumentsCreation(_generer)
+    _generer.add_argument("--graine", type=int, default=None, help="graine du générateur aléatoire")
+    _generer.add_argument("--html", action="store_true", help="enregistre aussi l'état initial au format html")
+    _generer.add_argument("--sortie", default=None, help="fichier XML (sans extension) où copier le réseau")
+    _generer.set_defaults(fonction=generer)
+
+    _simuler = _sous_parseurs.add_parser("simuler", help="simule la vie du réseau")
+    _simuler.add_argument("--reseau", default=None,
+                          help="fichier XML du réseau à simuler, par défaut l'état initial enregistré")
+    _simuler.add_argument("--html", action="store_true", help="enregistre aussi les états au format html")
+    _simuler.add_argument("--sans-etats", action="store_true",
+                          help="n'enregistre pas les états intermédiaires, seulement les statistiques")
+    ajouterArgumentsSimulation(_simuler)
+    _simuler.add_argument("--sequentiel", action="store_true", help="désactive l'évaluation parallèle")
+    _simuler.add_argument("--journal", type=int, default=Simulateur.S_periode_journal,
+                          help="nombre de cycles entre deux points de contrôle, 0 pour ne pas pouvoir reprendre la "
+                               "simulation si elle est interrompue")
+    _simuler.set_defaults(fonction=simuler)
+
+    _reprendre = _sous_parseurs.add_parser("reprendre",
+                                           help="poursuit la dernière simulation interrompue depuis son dernier "
+                                                "point de contrôle")
+    _reprendre.add_argument("--html", action="store_true", help="enregistre aussi les états au format html")
+    _reprendre.add_argument("--processus", type=int, default=None, help="nombre maximum de processus")
+    _reprendre.add_argument("--sequentiel", action="store_true", help="désactive l'évaluation parallèle")
+    _reprendre.set_defaults(fonction=reprendre)
+
+    _exporter = _sous_parseurs.add_parser("exporter", help="copie les résultats de la dernière simulation")
+    _exporter.add_argument("destination", help="dossier de destination")
+    _exporter.set_defaults(fonction=exporter)
+
+    _montecarlo = _sous_parseurs.add_parser("montecarlo",
+                                            help="génère et simule de nombreux réseaux aléatoires de mêmes paramètres")
+    _montecarlo.add_argument("--reseaux", type=int, required=True, help="nombre de réseaux à générer et simuler")
+    _montecarlo.add_argument("--graine", type=int, default=0, help="graine du premier réseau")
+    ajouterArgumentsCreation(_montecarlo)
+    ajouterArgumentsSimulation(_montecarlo)
+    _montecarlo.set_defaults(fonction=montecarlo)
+
+    _arguments = _parseur.parse_args(_arguments)
+    # Mêmes règles que ReseauControleur.RCcontroleParametres : il doit rester au moins un capteur hors puits
+    if hasattr(_arguments, "puits") and not 1 <= _arguments.puits < _arguments.capteurs:
+        _parseur.error("--puits doit être compris entre 1 et --capteurs - 1")
+
+    FileManager().FMdefinirNotificateur(afficherMessage)
+    return _arguments.fonction(_arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
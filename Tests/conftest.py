@@ -0,0 +1,16 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module conftest
+
+    Configuration de pytest : ajoute la racine du projet au chemin d'import, pour que les tests puissent être lancés
+    depuis n'importe quel dossier.
+
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,83 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module outils
+
+    Module contenant les fonctions communes aux tests : génération de réseaux reproductibles et simulation complète
+    d'un réseau avec un jeu de paramètres du simulateur.
+
+"""
+
+import copy
+import random
+import sys
+import tempfile
+
+import numpy as np
+
+from Controleur.Statistiques import Statistiques
+from Modele.Parametres import ParametresCreation
+from Moteur.Generateur import Generateur
+from Moteur.Simulateur import Simulateur
+from Utilitaires.FileManager import FileManager
+
+sys.setrecursionlimit(100000)
+
+# Les fichiers de la simulation (états, journal) sont écrits dans un dossier temporaire
+FileManager.FM_chemin_local = tempfile.mkdtemp(prefix="simulateur_tests_")
+
+# Réseaux de test : (nombre de capteurs, graine, niveau de batterie initial)
+RESEAUX = ((30, 1, 20), (60, 2, 20), (80, 3, 50), (50, 4, 100), (100, 7, 100))
+
+# Simulation de référence : toutes les optimisations désactivées
+REFERENCE = dict({"S_consommation_vectorielle": False, "S_saut_evenements": False,
+                  "S_verification_incrementale": False, "S_evaluation_parallele": False,
+                  "S_evaluation_lot": False, "S_reprise_prefixe": False, "S_taille_cache_configuration": 0,
+                  "S_enregistrer_etats": False})
+
+
+def reseau(_nombre_capteurs, _graine, _batterie):
+    """
+        Génère un réseau aléatoire reproductible
+
+        :param _nombre_capteurs: int, le nombre de capteurs du réseau
+        :param _graine: int, la graine des générateurs aléatoires
+        :param _batterie: int, le niveau de batterie initial des capteurs
+        :return: Reseau, le réseau généré
+    """
+    random.seed(_graine)
+    np.random.seed(_graine)
+    return Generateur(None).GcreerReseau(ParametresCreation(100, 1, 15, 2, _nombre_capteurs, _batterie, 1))
+
+
+def simuler(_reseau, **_parametres):
+    """
+        Simule un réseau du début à la fin avec les paramètres de REFERENCE modifiés par _parametres. Les paramètres
+        sont reportés sur la classe Simulateur, où certaines méthodes statiques les lisent, puis restaurés.
+
+        :param _reseau: Reseau, le réseau à simuler, qui n'est pas modifié
+        :param _parametres: dict{String : Objet}, les paramètres du simulateur à modifier
+        :return: tuple, les résultats de chaque cycle, le nombre de capteurs actifs et le niveau de batterie moyen
+            de chaque état enregistré, puis le niveau de batterie et la route de chaque noeud à la fin de la simulation
+    """
+    _parametres = dict(REFERENCE, **_parametres)
+    _sauvegarde = {_nom: getattr(Simulateur, _nom) for _nom in _parametres}
+    try:
+        for _nom, _valeur in _parametres.items():
+            setattr(Simulateur, _nom, _valeur)
+        FileManager().FMviderEtats(False)
+        Statistiques().SviderEtats(False)
+        _simulateur = Simulateur(None)
+        _final = _simulateur.SlancerSimulation(copy.deepcopy(_reseau), False)
+    finally:
+        for _nom, _valeur in _sauvegarde.items():
+            setattr(Simulateur, _nom, _valeur)
+
+    _statistiques = Statistiques()
+    _noeuds = _final.R_graphe.nodes
+    return (_simulateur.S_resultats, list(_statistiques.S_nbr_actifs),
+            list(_statistiques.S_niveau_de_batterie_moyen),
+            {_noeud: _noeuds[_noeud]['batterie'] for _noeud in _noeuds},
+            {_noeud: _noeuds[_noeud]['route'] for _noeud in _noeuds})
@@ -0,0 +1,39 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module test_cache_configuration
+
+    Vérifie que le cache des configurations topologiques (Simulateur.S_taille_cache_configuration) donne exactement les
+    mêmes résultats que le calcul de chaque configuration, avec et sans réparation de l'arbre dominant.
+
+"""
+
+import unittest
+
+from outils import RESEAUX, reseau, simuler
+
+
+class TestCacheConfiguration(unittest.TestCase):
+    """
+        class TestCacheConfiguration
+
+        Compare, sur chaque réseau de test, la simulation avec et sans cache des configurations
+    """
+
+    def test_memes_durees_de_vie(self):
+        for _parametres in RESEAUX:
+            with self.subTest(reseau=_parametres):
+                _reseau = reseau(*_parametres)
+                _sans_cache = simuler(_reseau)
+                _avec_cache = simuler(_reseau, S_taille_cache_configuration=64)
+                self.assertEqual(_sans_cache, _avec_cache)
+
+    def test_memes_durees_de_vie_avec_reparation(self):
+        for _parametres in RESEAUX:
+            with self.subTest(reseau=_parametres):
+                _reseau = reseau(*_parametres)
+                _sans_cache = simuler(_reseau, S_seuil_reparation_dominant=3)
+                _avec_cache = simuler(_reseau, S_seuil_reparation_dominant=3, S_taille_cache_configuration=64)
+                self.assertEqual(_sans_cache, _avec_cache)
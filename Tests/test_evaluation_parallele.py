@@ -0,0 +1,37 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module test_evaluation_parallele
+
+    Vérifie que l'évaluation des intervalles candidats dans des processus séparés (Simulateur.S_evaluation_parallele)
+    donne exactement les mêmes résultats que leur évaluation l'un après l'autre.
+
+"""
+
+import unittest
+
+from outils import RESEAUX, reseau, simuler
+
+
+class TestEvaluationParallele(unittest.TestCase):
+    """
+        class TestEvaluationParallele
+
+        Compare, sur chaque réseau de test, la simulation avec et sans évaluation parallèle des intervalles candidats
+    """
+
+    def verifier(self, **_parametres):
+        for _parametres_reseau in RESEAUX:
+            with self.subTest(reseau=_parametres_reseau):
+                _reseau = reseau(*_parametres_reseau)
+                _sequentielle = simuler(_reseau, **_parametres)
+                _parallele = simuler(_reseau, S_evaluation_parallele=True, **_parametres)
+                self.assertEqual(_sequentielle, _parallele)
+
+    def test_memes_resultats(self):
+        self.verifier()
+
+    def test_memes_resultats_arbre_repare(self):
+        self.verifier(S_seuil_reparation_dominant=3)
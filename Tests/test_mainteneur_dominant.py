@@ -0,0 +1,53 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module test_mainteneur_dominant
+
+    Vérifie la réparation de l'arbre dominant par MainteneurDominant.
+
+"""
+
+import math
+import unittest
+
+import networkx as nx
+
+from outils import reseau
+from Modele.Roles import Roles
+from Moteur.MainteneurDominant import MainteneurDominant
+from Moteur.Simulateur import Simulateur
+
+
+class TestMainteneurDominant(unittest.TestCase):
+    """
+        class TestMainteneurDominant
+
+        Répare un arbre dont le seul dominant, voisin du puit, vient de mourir
+    """
+
+    def test_puit_candidat(self):
+        _reseau = reseau(30, 1, 20)
+        _noeuds = _reseau.R_graphe.nodes
+        _puit = next(_noeud for _noeud in _noeuds if _noeuds[_noeud]['role'] == Roles.PUIT)
+        _mort = next(iter(_reseau.R_graphe.adj[_puit]))
+
+        _arbre = nx.Graph()
+        _arbre.add_node(_mort)
+        _mainteneur = MainteneurDominant(1)
+        _mainteneur.MDrestaurerEtat(dict({"vides": frozenset(), "energie": math.inf, "batteries": None,
+                                          "arbre": _arbre}), _reseau)
+        _noeuds[_mort]['batterie'] = 0
+
+        _sauvegarde = Simulateur.S_ponderation_batterie
+        Simulateur.S_ponderation_batterie = True
+        try:
+            _repare = _mainteneur.MDensembleDominant(_reseau)
+        finally:
+            Simulateur.S_ponderation_batterie = _sauvegarde
+
+        # Le puit, de poids nul, n'est plus dominé : il est choisi pour se couvrir lui-même
+        self.assertEqual(_mainteneur.MD_compteurs["reparation"], 1)
+        self.assertIn(_puit, _repare)
+        self.assertNotIn(_mort, _repare)
@@ -0,0 +1,37 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module test_moteur_energie
+
+    Vérifie que le moteur de consommation vectoriel (MoteurEnergie) donne exactement les mêmes niveaux de batterie et
+    les mêmes durées de vie que la simulation paquet par paquet de Simulateur.__Sconsommation.
+
+"""
+
+import unittest
+
+from outils import RESEAUX, reseau, simuler
+
+
+class TestMoteurEnergie(unittest.TestCase):
+    """
+        class TestMoteurEnergie
+
+        Compare, sur chaque réseau de test, la simulation paquet par paquet et celle du moteur vectoriel, pour chaque
+        modèle de consommation
+    """
+
+    def test_memes_resultats_modele_fixe(self):
+        for _parametres in RESEAUX:
+            with self.subTest(reseau=_parametres):
+                _reseau = reseau(*_parametres)
+                self.assertEqual(simuler(_reseau), simuler(_reseau, S_consommation_vectorielle=True))
+
+    def test_memes_resultats_modele_premier_ordre(self):
+        for _parametres in RESEAUX:
+            with self.subTest(reseau=_parametres):
+                _reseau = reseau(*_parametres)
+                self.assertEqual(simuler(_reseau, S_modele_energie="premier_ordre"),
+                                 simuler(_reseau, S_modele_energie="premier_ordre", S_consommation_vectorielle=True))
@@ -0,0 +1,80 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module test_optimiseur
+
+    Vérifie les stratégies de recherche de l'intervalle de changement de rôle (Optimiseur) sur des durées de vie
+    calculées par une fonction, sans simulation.
+
+"""
+
+import unittest
+
+from Moteur.Optimiseur import Optimiseur, OptimiseurEncadrement
+from Moteur.Simulateur import Simulateur
+
+
+def rechercher(_optimiseur, _duree_de_vie):
+    """
+        Déroule une recherche comme Simulateur.SrechercherIntervalle
+
+        :param _optimiseur: Optimiseur, la stratégie de recherche
+        :param _duree_de_vie: fonction(double), la durée de vie obtenue pour un intervalle
+        :return: [dict{String : double, String : int}], les résultats de la recherche
+    """
+    _resultats = []
+    _intervalles = _optimiseur.Ointervalles(_resultats)
+    while _intervalles:
+        for _intervalle in _intervalles:
+            if not _optimiseur.Oconnu(_intervalle):
+                _optimiseur.Omemoriser(_intervalle, _duree_de_vie(_intervalle))
+            _resultats.append(dict({"intervalle": _intervalle, "resultat": _optimiseur.O_memo[_intervalle]}))
+        _intervalles = _optimiseur.Ointervalles(_resultats)
+    return _resultats
+
+
+class TestOptimiseur(unittest.TestCase):
+    """
+        class TestOptimiseur
+
+        Recherche le maximum de durées de vie unimodales avec chaque stratégie
+    """
+
+    DUREES_DE_VIE = (lambda _x: int(100 - (_x - 37) ** 2 / 20), lambda _x: int(60 - abs(_x - 12)),
+                     lambda _x: 20 if _x == 0 else int(20 + _x) if _x < 90 else 110)
+
+    def test_classe_abstraite(self):
+        with self.assertRaises(TypeError):
+            Optimiseur(Simulateur.S_performance, 1)
+        with self.assertRaises(TypeError):
+            OptimiseurEncadrement(Simulateur.S_performance, 1)
+
+    def test_strategie_par_defaut(self):
+        self.assertEqual(Simulateur.S_strategie_optimisation, "heuristique")
+
+    def test_evaluations_bornees(self):
+        for _strategie in ("section_doree", "parabolique"):
+            for _duree_de_vie in self.DUREES_DE_VIE:
+                with self.subTest(strategie=_strategie):
+                    _optimiseur = Optimiseur.Ocreer(_strategie, Simulateur.S_performance, 1)
+                    _resultats = rechercher(_optimiseur, _duree_de_vie)
+                    self.assertLessEqual(len(_optimiseur.O_memo), OptimiseurEncadrement.O_EVALUATIONS_MAX)
+                    # Chaque résultat est celui de son intervalle, le meilleur est bien retenu
+                    for _resultat in _resultats:
+                        self.assertEqual(_resultat["resultat"], _duree_de_vie(_resultat["intervalle"]))
+                    self.assertEqual(_optimiseur.Omeilleur()[1], max(_optimiseur.O_memo.values()))
+
+    def test_memoire(self):
+        for _strategie in Optimiseur.O_STRATEGIES:
+            with self.subTest(strategie=_strategie):
+                _evaluations = []
+
+                def _duree_de_vie(_intervalle):
+                    _evaluations.append(_intervalle)
+                    return self.DUREES_DE_VIE[0](_intervalle)
+
+                rechercher(Optimiseur.Ocreer(_strategie, Simulateur.S_performance, 1), _duree_de_vie)
+                # Un intervalle n'est jamais évalué deux fois
+                self.assertEqual(len(_evaluations), len(set(_evaluations)))
@@ -0,0 +1,61 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module test_reparateur_routes
+
+    Vérifie la réparation locale du routage (ReparateurRoutes) à la mort de capteurs.
+
+"""
+
+import unittest
+
+from outils import RESEAUX, reseau
+from Modele.Roles import Roles
+from Moteur.ReparateurRoutes import ReparateurRoutes
+from Moteur.Simulateur import Simulateur
+
+
+class TestReparateurRoutes(unittest.TestCase):
+    """
+        class TestReparateurRoutes
+
+        Tue un relais et tous les autres dominants voisins d'un de ses enfants, qui ne peut donc pas être rattaché
+    """
+
+    def test_orphelins_deconnectes(self):
+        for _parametres in RESEAUX:
+            with self.subTest(reseau=_parametres):
+                _reseau = Simulateur.SconfigurationTopologique(reseau(*_parametres))
+                _noeuds = _reseau.R_graphe.nodes
+                _puits = set(Simulateur.Spuits(_reseau))
+                _dominants = _reseau.R_ensemble_dominant.nodes
+
+                # Un enfant d'un relais, qui n'est pas voisin d'un puit
+                _orphelin = next(_noeud for _noeud in _noeuds
+                                 if _noeud not in _puits and _noeuds[_noeud]['route'] not in _puits
+                                 and _noeuds[_noeud]['route'] != _noeud
+                                 and not any(_voisin in _puits for _voisin in _reseau.R_graphe.adj[_noeud]))
+                _morts = [_voisin for _voisin in _reseau.R_graphe.adj[_orphelin] if _voisin in _dominants]
+                self.assertIn(_noeuds[_orphelin]['route'], _morts)
+
+                _reparateur = ReparateurRoutes()
+                _reparateur.RPindexer(_reseau)
+                for _mort in _morts:
+                    _noeuds[_mort]['batterie'] = 0
+                _rattaches, _isoles = _reparateur.RPreparer(_reseau, _morts)
+
+                # L'orphelin est déconnecté, aucun noeud vivant n'envoie plus ses données vers un capteur mort
+                self.assertGreaterEqual(_isoles, 1)
+                self.assertEqual(_noeuds[_orphelin]['route'], _orphelin)
+                self.assertIn(_orphelin, Simulateur.SfinDeVieAtteinte(_reseau, 1.0)[1])
+                for _noeud in _noeuds:
+                    _route = _noeuds[_noeud]['route']
+                    if _noeuds[_noeud]['role'] != Roles.PUIT and _noeuds[_noeud]['batterie'] > 0 \
+                            and _route != _noeud and _route in _noeuds:
+                        self.assertTrue(_route in _puits or _noeuds[_route]['batterie'] > 0)
+                # Les index suivent les routes
+                for _noeud, _enfants in _reparateur.RP_enfants.items():
+                    for _enfant in _enfants:
+                        self.assertEqual(_noeuds[_enfant]['route'], _noeud)
@@ -0,0 +1,44 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module test_reprise_prefixe
+
+    Vérifie que la reprise des cycles depuis un point de reprise (Simulateur.S_reprise_prefixe) donne, pour chaque
+    intervalle évalué, exactement les mêmes résultats que la simulation de chaque cycle depuis l'état initial, que les
+    cycles soient simulés l'un après l'autre ou en parallèle.
+
+"""
+
+import unittest
+
+from outils import RESEAUX, reseau, simuler
+
+
+class TestReprisePrefixe(unittest.TestCase):
+    """
+        class TestReprisePrefixe
+
+        Compare, sur chaque réseau de test, la simulation avec et sans reprise depuis le préfixe commun
+    """
+
+    def __comparer(self, **_parametres):
+        for _parametres_reseau in RESEAUX:
+            with self.subTest(reseau=_parametres_reseau, **_parametres):
+                _reseau = reseau(*_parametres_reseau)
+                _sans_reprise = simuler(_reseau, **_parametres)
+                _avec_reprise = simuler(_reseau, S_reprise_prefixe=True, **_parametres)
+                _parallele = simuler(_reseau, S_reprise_prefixe=True, S_evaluation_parallele=True, **_parametres)
+                # Durée de vie de chaque intervalle évalué, puis états enregistrés et état final
+                self.assertEqual(_sans_reprise[0], _avec_reprise[0])
+                self.assertEqual(_sans_reprise[0], _parallele[0])
+                self.assertEqual(_sans_reprise, _avec_reprise)
+                self.assertEqual(_sans_reprise, _parallele)
+
+    def test_memes_resultats(self):
+        self.__comparer(S_consommation_vectorielle=True, S_saut_evenements=True)
+
+    def test_memes_resultats_arbre_repare(self):
+        # L'arbre réparé dépend de celui du préfixe : l'état du MainteneurDominant fait partie du point de reprise
+        self.__comparer(S_consommation_vectorielle=True, S_saut_evenements=True, S_seuil_reparation_dominant=3)
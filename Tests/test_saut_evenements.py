@@ -0,0 +1,32 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module test_saut_evenements
+
+    Vérifie que le saut direct au prochain événement (Simulateur.S_saut_evenements) donne exactement les mêmes
+    résultats que la simulation récolte par récolte.
+
+"""
+
+import unittest
+
+from outils import RESEAUX, reseau, simuler
+
+
+class TestSautEvenements(unittest.TestCase):
+    """
+        class TestSautEvenements
+
+        Compare, sur chaque réseau de test, la simulation avec et sans saut au prochain événement
+    """
+
+    def test_memes_durees_de_vie(self):
+        for _parametres in RESEAUX:
+            with self.subTest(reseau=_parametres):
+                _reseau = reseau(*_parametres)
+                _sans_saut = simuler(_reseau, S_consommation_vectorielle=True)
+                _avec_saut = simuler(_reseau, S_consommation_vectorielle=True, S_saut_evenements=True)
+                self.assertEqual(_sans_saut[0], _avec_saut[0])
+                self.assertEqual(_sans_saut, _avec_saut)
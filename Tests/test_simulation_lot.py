@@ -0,0 +1,41 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module test_simulation_lot
+
+    Vérifie que la simulation simultanée des intervalles candidats d'une étape (SimulationLot) donne exactement les
+    mêmes résultats que leur simulation l'un après l'autre.
+
+"""
+
+import unittest
+
+from outils import RESEAUX, reseau, simuler
+
+
+class TestSimulationLot(unittest.TestCase):
+    """
+        class TestSimulationLot
+
+        Compare, sur chaque réseau de test, la simulation des cycles en lot et l'un après l'autre
+    """
+
+    def __comparer(self, **_parametres):
+        for _parametres_reseau in RESEAUX:
+            with self.subTest(reseau=_parametres_reseau, **_parametres):
+                _reseau = reseau(*_parametres_reseau)
+                _sequentiel = simuler(_reseau, S_consommation_vectorielle=True, **_parametres)
+                _lot = simuler(_reseau, S_consommation_vectorielle=True, S_evaluation_lot=True, **_parametres)
+                self.assertEqual(_sequentiel[0], _lot[0])
+                self.assertEqual(_sequentiel, _lot)
+
+    def test_memes_resultats(self):
+        self.__comparer()
+
+    def test_memes_resultats_saut_evenements(self):
+        self.__comparer(S_saut_evenements=True, S_verification_incrementale=True)
+
+    def test_memes_resultats_arbre_repare(self):
+        self.__comparer(S_saut_evenements=True, S_seuil_reparation_dominant=3)
@@ -0,0 +1,40 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module test_verification_incrementale
+
+    Vérifie que la vérification incrémentale de la fin de vie (Simulateur.S_verification_incrementale) donne exactement
+    les mêmes résultats que la vérification après chaque récolte.
+
+"""
+
+import unittest
+
+from outils import RESEAUX, reseau, simuler
+
+
+class TestVerificationIncrementale(unittest.TestCase):
+    """
+        class TestVerificationIncrementale
+
+        Compare, sur chaque réseau de test, la simulation avec et sans vérification incrémentale de la fin de vie
+    """
+
+    def verifier(self, **_parametres):
+        for _parametres_reseau in RESEAUX:
+            with self.subTest(reseau=_parametres_reseau):
+                _reseau = reseau(*_parametres_reseau)
+                _complete = simuler(_reseau, **_parametres)
+                _incrementale = simuler(_reseau, S_verification_incrementale=True, **_parametres)
+                self.assertEqual(_complete, _incrementale)
+
+    def test_memes_resultats(self):
+        self.verifier()
+
+    def test_memes_resultats_saut_evenements(self):
+        self.verifier(S_consommation_vectorielle=True, S_saut_evenements=True)
+
+    def test_memes_resultats_reparation_routes(self):
+        self.verifier(S_reparation_routes=True)
@@ -0,0 +1,72 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module Connecteur
+
+    Module contenant un connecteur sans Qt, utilisable à la place d'un pyqtSignal par les moteurs (Generateur,
+    Simulateur) lorsque l'application est lancée sans interface graphique : Connecteur
+
+"""
+
+from Utilitaires.Log import Log
+
+
+_log = Log()
+
+
+class Connecteur:
+    """
+        class Connecteur
+
+        Reprend l'interface d'un pyqtSignal (connect, emit) : chaque émission appelle, dans l'ordre de leur connexion,
+        les fonctions connectées avec les arguments émis.
+        Les moteurs émettent (Signaux, ...) : Generateur émet (Signaux, float, String, float), Simulateur émet
+        (Signaux, dict).
+
+        :var self.C_fonctions : [fonction], les fonctions connectées
+    """
+
+    def __init__(self, _fonction=None):
+        """
+            Constructeur de la classe
+
+            :param _fonction: fonction, une première fonction à connecter (optionnelle)
+        """
+        _log.Linfo("Init -- Connecteur")
+
+        self.C_fonctions = []
+        if _fonction is not None:
+            self.connect(_fonction)
+
+    def connect(self, _fonction):
+        """
+            Connecte une fonction, appelée à chaque émission
+
+            :param _fonction: fonction, la fonction à connecter
+        """
+        if not callable(_fonction):
+            _log.Lerror("Valeur Argument errone _fonction")
+            raise Exception("Valeur Argument errone _fonction")
+        self.C_fonctions.append(_fonction)
+
+    def disconnect(self, _fonction=None):
+        """
+            Déconnecte une fonction, ou toutes les fonctions
+
+            :param _fonction: fonction, la fonction à déconnecter, None pour toutes les déconnecter
+        """
+        if _fonction is None:
+            self.C_fonctions = []
+        elif _fonction in self.C_fonctions:
+            self.C_fonctions.remove(_fonction)
+
+    def emit(self, *_arguments):
+        """
+            Émet un signal : appelle toutes les fonctions connectées
+
+            :param _arguments: les arguments transmis aux fonctions connectées
+        """
+        for _fonction in self.C_fonctions:
+            _fonction(*_arguments)
@@ -0,0 +1,153 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module ConnecteurLimite
+
+    Module contenant un connecteur qui limite la fréquence à laquelle les signaux d'avancement d'une simulation sont
+    transmis à l'interface : ConnecteurLimite
+
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from Modele.Signaux import Signaux
+from Utilitaires.Log import Log
+
+
+_log = Log()
+
+
+class ConnecteurLimite:
+    """
+        class ConnecteurLimite
+
+        S'intercale entre le Simulateur et le connecteur de l'interface (pyqtSignal ou Connecteur), dont il reprend la
+        méthode emit. Chaque NOUVEL_ETAT fait recharger la page du réseau et redessiner les graphiques, chaque
+        PROGRESSION_SIMULATION redessine la barre de progression : émis à chaque récolte, ils saturent le thread de
+        l'interface.
+
+        Les signaux de CL_signaux ne sont donc transmis qu'au plus CL_frequence_max fois par seconde chacun. Un signal
+        émis trop tôt est mis en attente à la place du précédent, qui est abandonné : seule la dernière valeur compte.
+        Un signal en attente est transmis à son échéance par une minuterie (threading.Timer : le thread de la
+        simulation n'a pas de boucle d'événements Qt), ou plus tôt si un signal émis ensuite le trouve échu, et dans
+        tous les cas avant tout autre signal (INITIALISATION_SIMULATION, FIN_SIMULATION) : l'interface reçoit toujours
+        la dernière valeur, même si la simulation n'émet plus rien pendant un long calcul. Le nombre de signaux
+        abandonnés est ajouté aux données de FIN_SIMULATION (signaux_abandonnes).
+
+        :var self.CL_connecteur : pyqtSignal ou Connecteur, le connecteur auquel les signaux sont transmis
+        :var self.CL_frequence_max : float, le nombre maximum de transmissions par seconde de chaque signal limité
+        :var self.CL_signaux : (Signaux), les signaux limités
+        :var self.CL_derniere_emission : dict{Signaux : float}, le moment (time.monotonic) de la dernière transmission
+            de chaque signal limité
+        :var self.CL_en_attente : OrderedDict{Signaux : tuple}, les données du dernier signal mis en attente, pour
+            chaque signal limité, du moins au plus récemment émis
+        :var self.CL_abandonnes : dict{Signaux : int}, le nombre de signaux abandonnés, pour chaque signal limité
+        :var self.CL_minuterie : threading.Timer, la minuterie qui transmettra les signaux en attente à leur
+            échéance, None si aucun signal n'est en attente
+        :var self.CL_verrou : threading.RLock, protège les signaux en attente, partagés entre le thread de la
+            simulation et celui de la minuterie
+    """
+
+    def __init__(self, _connecteur, _frequence_max, _signaux=(Signaux.NOUVEL_ETAT, Signaux.PROGRESSION_SIMULATION)):
+        """
+            Constructeur de la classe
+
+            :param _connecteur: pyqtSignal ou Connecteur, le connecteur auquel transmettre les signaux
+            :param _frequence_max: float, le nombre maximum de transmissions par seconde de chaque signal limité
+            :param _signaux: (Signaux), les signaux limités, les autres sont toujours transmis
+        """
+        _log.Linfo("Init -- ConnecteurLimite")
+
+        if not hasattr(_connecteur, "emit"):
+            _log.Lerror("Valeur Argument errone _connecteur")
+            raise Exception("Valeur Argument errone _connecteur")
+        if type(_frequence_max) not in (int, float) or _frequence_max <= 0:
+            _log.Lerror("Valeur Argument errone _frequence_max")
+            raise Exception("Valeur Argument errone _frequence_max")
+
+        self.CL_connecteur = _connecteur
+        self.CL_frequence_max = _frequence_max
+        self.CL_signaux = tuple(_signaux)
+        self.CL_derniere_emission = dict()
+        self.CL_en_attente = OrderedDict()
+        self.CL_abandonnes = {_signal: 0 for _signal in self.CL_signaux}
+        self.CL_minuterie = None
+        self.CL_verrou = threading.RLock()
+
+    def emit(self, _signal, *_donnees):
+        """
+            Émet un signal : le transmet, le met en attente ou, pour FIN_SIMULATION, le complète avec le nombre de
+            signaux abandonnés, cf description de la classe
+
+            :param _signal: Signaux, le signal émis
+            :param _donnees: les données émises avec le signal
+        """
+        with self.CL_verrou:
+            if _signal not in self.CL_signaux:
+                self.CLvider()
+                if _signal == Signaux.FIN_SIMULATION and len(_donnees) == 1 and isinstance(_donnees[0], dict):
+                    _donnees = (dict(_donnees[0], signaux_abandonnes=self.CLnombreAbandonnes()),)
+                self.CL_connecteur.emit(_signal, *_donnees)
+                return
+
+            # Une valeur plus récente remplace celle en attente
+            if _signal in self.CL_en_attente:
+                del self.CL_en_attente[_signal]
+                self.CL_abandonnes[_signal] += 1
+            self.CL_en_attente[_signal] = _donnees
+
+            self.__CLtransmettreEchus()
+
+    def __CLtransmettreEchus(self):
+        """
+            Transmet, dans l'ordre de leur émission, les signaux en attente dont le délai est écoulé, puis programme la
+            minuterie à l'échéance du prochain signal encore en attente
+        """
+        with self.CL_verrou:
+            _maintenant = time.monotonic()
+            _intervalle = 1 / self.CL_frequence_max
+            _prochaine_echeance = None
+            for _en_attente in list(self.CL_en_attente):
+                _echeance = self.CL_derniere_emission.get(_en_attente, float("-inf")) + _intervalle
+                if _maintenant >= _echeance:
+                    self.CL_derniere_emission[_en_attente] = _maintenant
+                    self.CL_connecteur.emit(_en_attente, *self.CL_en_attente.pop(_en_attente))
+                elif _prochaine_echeance is None or _echeance < _prochaine_echeance:
+                    _prochaine_echeance = _echeance
+
+            if _prochaine_echeance is not None and self.CL_minuterie is None:
+                self.CL_minuterie = threading.Timer(_prochaine_echeance - _maintenant, self.__CLecheance)
+                self.CL_minuterie.daemon = True
+                self.CL_minuterie.start()
+
+    def __CLecheance(self):
+        """
+            Appelée par la minuterie : transmet les signaux en attente arrivés à échéance
+        """
+        with self.CL_verrou:
+            self.CL_minuterie = None
+            self.__CLtransmettreEchus()
+
+    def CLvider(self):
+        """
+            Transmet immédiatement les signaux en attente et arrête la minuterie
+        """
+        with self.CL_verrou:
+            if self.CL_minuterie is not None:
+                self.CL_minuterie.cancel()
+                self.CL_minuterie = None
+            _maintenant = time.monotonic()
+            while self.CL_en_attente:
+                _signal, _donnees = self.CL_en_attente.popitem(last=False)
+                self.CL_derniere_emission[_signal] = _maintenant
+                self.CL_connecteur.emit(_signal, *_donnees)
+
+    def CLnombreAbandonnes(self):
+        """
+            :return: int, le nombre total de signaux abandonnés
+        """
+        return sum(self.CL_abandonnes.values())
@@ -40,6 +40,9 @@ class Singleton(object):
 
         :var self.FM_chemin_local : String, le chemin absolu vers le dossier local contenant les documents
             intermédiaires généré par le programme
+        :var self.FM_notificateur : fonction(String, bool), appelée avec le message et vrai si il s'agit d'une erreur
+            pour informer l'utilisateur d'un problème de chargement. None : le message est uniquement écrit dans les
+            logs
     """
 
     # Elements clé pour la création d'un singleton en python
@@ -51,7 +54,34 @@ class Singleton(object):
             cls._instances[cls].__init__()
         return cls._instances[cls]
 
-    FM_chemin_local = _path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..\\donnees\\reseau"))
+    # Chemin construit avec os.path.join pour être aussi résolu hors de Windows (machines de calcul sans interface)
+    FM_chemin_local = _path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "donnees", "reseau"))
+
+    FM_notificateur = None
+
+    def FMdefinirNotificateur(self, _notificateur):
+        """
+            Permet de définir la fonction qui informe l'utilisateur des problèmes de chargement (boite de dialogue pour
+            l'interface graphique, console pour la ligne de commande)
+
+            :param _notificateur: fonction(String, bool), le message et vrai si il s'agit d'une erreur, None pour
+                uniquement écrire dans les logs
+        """
+        if _notificateur is not None and not callable(_notificateur):
+            _log.Lerror("Valeur Argument errone _notificateur")
+            raise Exception("Valeur Argument errone _notificateur")
+        self.FM_notificateur = _notificateur
+
+    def __FMnotifier(self, _message, _erreur):
+        """
+            Informe l'utilisateur d'un problème de chargement à travers le notificateur
+
+            :param _message: String, le message
+            :param _erreur: bool, vrai si il s'agit d'une erreur, faux pour une information
+        """
+        _log.Lerror(_message)
+        if self.FM_notificateur is not None:
+            self.FM_notificateur(_message, _erreur)
 
     def FMsauvegarderReseauVersXML(self, _reseau, _chemin):
         """
@@ -182,7 +212,6 @@ class Singleton(object):
         _log.Linfo("Début ## FileManager.FMchargerReseauDepuisXML")
 
         # Importation en local pour éviter les conflits
-        from Controleur.ReseauControleur import ReseauControleur
         from Moteur.Simulateur import Simulateur
 
         _capteurs = []
@@ -219,7 +248,7 @@ class Singleton(object):
         # Test si le nombre de noeuds détecté et celui donné correspondent
         _nbr_noeuds = int(next(_racine.iter("nbrnoeuds")).text)
         if _reseau.R_nbr_noeuds != _nbr_noeuds:
-            ReseauControleur.RCmessageErreur("Le nombre de noeuds en meta et réél ne correspondent pas")
+            self.__FMnotifier("Le nombre de noeuds en meta et réél ne correspondent pas", True)
             return None
 
         _reseau.R_ensemble_dominant = Simulateur.SdeterminationEnsembleDominant(_reseau)
@@ -234,7 +263,7 @@ class Singleton(object):
         """
         _log.Linfo("Début ## FileManager.FMobtenirCheminHTMLVide")
 
-        _chemin = self.FM_chemin_local + "\\pagevide.html"
+        _chemin = os.path.join(self.FM_chemin_local, "pagevide.html")
         if not os.path.exists(_chemin):
             if not os.path.exists(self.FM_chemin_local):
                 os.makedirs(self.FM_chemin_local)
@@ -252,13 +281,14 @@ class Singleton(object):
                         """)
         return _chemin
 
-    def FMenregistrerEtat(self, _reseau, _show_html):
+    def FMenregistrerEtat(self, _reseau, _show_html, _analyse=None):
         """
 
             Permet de sauvegarder un état du réseau en local
 
         :param _reseau : Reseau, reseau dont l'état est à enregistrer comme une nouvelle étape de la simulation
         :param _show_html : Booléen, détermine si le réseau sera enregistré au format html en plus du format xml
+        :param _analyse : AnalyseEtat, les mesures de l'état du réseau si elles ont déjà été calculées, None sinon
 
         :return:    int, le numéro de l'état attribué
                     int, le nombre total d'états
@@ -266,13 +296,13 @@ class Singleton(object):
         _log.Linfo("Début ## FileManager.FMenregistrerEtat")
 
         # Récopération du chemin, le nom se base sur le numéro de l'état
-        _chemin = self.FM_chemin_local + "\\resultats simulation"
+        _chemin = os.path.join(self.FM_chemin_local, "resultats simulation")
         _liste_etats = self.FMlisterEtats()
         if len(_liste_etats) == 0:
             _numero_etat = 0
         else:
             _numero_etat = _liste_etats[-1] + 1
-        _fichier_etat = _chemin + "\\etat" + str(_numero_etat)
+        _fichier_etat = os.path.join(_chemin, "etat" + str(_numero_etat))
         if not os.path.exists(_chemin):
             os.makedirs(_chemin)
 
@@ -282,7 +312,7 @@ class Singleton(object):
         if _show_html:
             # Enregistrement au format HTML
             with open(_fichier_etat + ".html", 'w') as f:
-                f.write(Generateur.GgenerationHTML(_reseau))
+                f.write(Generateur.GgenerationHTML(_reseau, _analyse))
 
         return _numero_etat, len(_liste_etats) + 1
 
@@ -297,8 +327,8 @@ class Singleton(object):
         """
         _log.Linfo("Début ## FileManager.FMchargerEtat")
 
-        _chemin = self.FM_chemin_local + "\\resultats simulation"
-        _fichier_etat = _chemin + "\\etat" + str(_numero_etat) + ".xml"
+        _chemin = os.path.join(self.FM_chemin_local, "resultats simulation")
+        _fichier_etat = os.path.join(_chemin, "etat" + str(_numero_etat) + ".xml")
         if os.path.exists(_fichier_etat):
             _reseau = self.FMchargerReseauDepuisXML(_fichier_etat)
 
@@ -316,7 +346,7 @@ class Singleton(object):
         """
         _log.Linfo("Début ## FileManager.FMchargerHTMLEtat")
 
-        _chemin = self.FM_chemin_local + "\\resultats simulation" + "\\etat" + str(_numero_etat) + ".html"
+        _chemin = os.path.join(self.FM_chemin_local, "resultats simulation", "etat" + str(_numero_etat) + ".html")
         if not os.path.exists(_chemin):
             return self.FMobtenirCheminHTMLVide()
         return _chemin
@@ -329,7 +359,7 @@ class Singleton(object):
         """
         _log.Linfo("Début ## FileManager.FMviderEtats")
 
-        _chemin = self.FM_chemin_local + "\\resultats simulation"
+        _chemin = os.path.join(self.FM_chemin_local, "resultats simulation")
 
         if os.path.exists(_chemin):
             from Controleur.Statistiques import Statistiques
@@ -357,16 +387,43 @@ class Singleton(object):
 
         _numeros_etats = []
         _numero_etat = 0
-        _chemin = self.FM_chemin_local + "\\resultats simulation"
-        _fichier_etat = _chemin + "\\etat" + str(_numero_etat) + ".xml"
+        _chemin = os.path.join(self.FM_chemin_local, "resultats simulation")
+        _fichier_etat = os.path.join(_chemin, "etat" + str(_numero_etat) + ".xml")
 
         while os.path.exists(_fichier_etat):
             _numeros_etats.append(_numero_etat)
             _numero_etat += 1
-            _fichier_etat = _chemin + "\\etat" + str(_numero_etat) + ".xml"
+            _fichier_etat = os.path.join(_chemin, "etat" + str(_numero_etat) + ".xml")
 
         return _numeros_etats
 
+    def FMtronquerEtats(self, _nombre_etats):
+        """
+            Permet de supprimer les états enregistrés après un numéro donné, par exemple ceux d'un cycle interrompu
+
+        :param _nombre_etats: int, le nombre d'états à garder
+        """
+        _log.Linfo("Début ## FileManager.FMtronquerEtats")
+
+        _chemin = os.path.join(self.FM_chemin_local, "resultats simulation")
+        _numero_etat = _nombre_etats
+        _fichier_etat = os.path.join(_chemin, "etat" + str(_numero_etat))
+        while os.path.exists(_fichier_etat + ".xml"):
+            os.unlink(_fichier_etat + ".xml")
+            if os.path.exists(_fichier_etat + ".html"):
+                os.unlink(_fichier_etat + ".html")
+            _numero_etat += 1
+            _fichier_etat = os.path.join(_chemin, "etat" + str(_numero_etat))
+
+    def FMobtenirCheminJournal(self):
+        """
+            Permet d'obtenir le chemin du journal de la simulation en cours (cf JournalSimulation), supprimé avec les
+            autres résultats par FMviderEtats
+
+        :return: String, le chemin du fichier du journal
+        """
+        return os.path.join(self.FM_chemin_local, "resultats simulation", "journal.pkl")
+
     def FMcopierDossier(self, _source, _destination):
         """
             Permet de copier un dossier d'un endroit vers un autre
@@ -401,8 +458,8 @@ class Singleton(object):
         _log.Linfo("Début ## FileManager.FMexporterResultat")
 
         if os.path.exists(_destination):
-            _destination += "\\copy resultats"
-        _source = self.FM_chemin_local + "\\resultats simulation"
+            _destination = os.path.join(_destination, "copy resultats")
+        _source = os.path.join(self.FM_chemin_local, "resultats simulation")
 
         if os.path.exists(_source) and len(self.FMlisterEtats()) > 0:
             return self.FMcopierDossier(_source, _destination)
@@ -424,8 +481,8 @@ class Singleton(object):
         if os.path.exists(_source):
             # On copie les résultats déjà présents en local vers un dossier tempon. Cette sauvegarde est utilisé si la
             # tentative de copie échoue
-            _destination = self.FM_chemin_local + "\\resultats simulation"
-            _chemin_tampon = self.FM_chemin_local + "\\resultats simulation(temp)"
+            _destination = os.path.join(self.FM_chemin_local, "resultats simulation")
+            _chemin_tampon = os.path.join(self.FM_chemin_local, "resultats simulation(temp)")
             self.FMcopierDossier(_destination, _chemin_tampon)
 
             self.FMviderEtats(_garder_etat_initial=False)
@@ -480,6 +537,10 @@ class Singleton(object):
                         </moment_insertion>
                         <cycle>
                         </cycle>
+                        <charge_puits>
+                            <puit numero="">charge</puit>
+                            ...
+                        </charge_puits>
                     </etat>
                     <etat>
                         ...
@@ -499,7 +560,7 @@ class Singleton(object):
         from Controleur.Statistiques import Statistiques
         _statistiques = Statistiques()
 
-        _chemin = FileManager.FM_chemin_local + "\\resultats simulation\\statistiques"
+        _chemin = os.path.join(FileManager.FM_chemin_local, "resultats simulation", "statistiques")
         # La racine
         _racine = Element("statistique")
 
@@ -523,6 +584,10 @@ class Singleton(object):
 
             SubElement(_e, "moment_insertion").text = str(_statistiques.S_moment_insertion[_etat])
 
+            _charge_puits = SubElement(_e, "charge_puits")
+            for _puit, _charge in _statistiques.S_charge_puits[_etat].items():
+                SubElement(_charge_puits, "puit", numero=str(_puit)).text = str(_charge)
+
         # Sauvegarde des résultats
         _nbrresultats = SubElement(_racine, "nbrresultats")
         _nbrresultats.text = str(len(_statistiques.S_resultats))
@@ -562,6 +627,10 @@ class Singleton(object):
                         </cycle>
                         <moment_insertion>
                         </moment_insertion>
+                        <charge_puits>
+                            <puit numero="">charge</puit>
+                            ...
+                        </charge_puits>
                     </etat>
                     <etat>
                         ...
@@ -575,12 +644,12 @@ class Singleton(object):
                     </resultat>
                 <resultats>
             </statistique>
+
+            Les fichiers enregistrés avant l'ajout de la charge des puits ne la contiennent pas : elle reste vide
         """
         _log.Linfo("Début ## FileManager.FMchargerStatistiques")
 
-        from Controleur.ReseauControleur import ReseauControleur
-
-        _chemin = self.FM_chemin_local + "\\resultats simulation\\statistiques.xml"
+        _chemin = os.path.join(self.FM_chemin_local, "resultats simulation", "statistiques.xml")
 
         if os.path.exists(_chemin):
             from Controleur.Statistiques import Statistiques
@@ -595,8 +664,10 @@ class Singleton(object):
                 _nbr_actifs = int(next(_etat.iter("nbr_actifs")).text)
                 _cycle = int(next(_etat.iter("cycle")).text)
                 _moment = int(next(_etat.iter("moment_insertion")).text)
+                _charge_puits = {int(_puit.get("numero")): int(_puit.text) for _puit in _etat.iter("puit")}
 
-                _statistiques.SajouterDonneesBrutes(_niveau_batterie_moyen, _nbr_actifs, _cycle, _moment)
+                _statistiques.SajouterDonneesBrutes(_niveau_batterie_moyen, _nbr_actifs, _cycle, _moment,
+                                                    _charge_puits)
 
             # Récupérations des résultats de performance de la simulation
             for _resultat in _racine.iter("resultat"):
@@ -609,15 +680,15 @@ class Singleton(object):
             _nbr_etats = int(next(_racine.iter("nbretats")).text)
             if _statistiques.S_nombre_etats != _nbr_etats:
 
-                ReseauControleur.RCmessageInformation("Le nombre d'état en meta et réél ne correspondent pas. "
-                                                      "Chargement des informations statistiques échoué")
+                self.__FMnotifier("Le nombre d'état en meta et réél ne correspondent pas. "
+                                  "Chargement des informations statistiques échoué", False)
                 _statistiques.SviderEtats(False)
 
             # Test si le nombre de résultats détecté et celui donné correspondent
             _nbr_resultats = int(next(_racine.iter("nbrresultats")).text)
             if len(_statistiques.S_resultats) != _nbr_resultats:
-                ReseauControleur.RCmessageInformation("Le nombre de résultats en meta et réél ne correspondent pas. "
-                                                      "Chargement des informations statistiques échoué")
+                self.__FMnotifier("Le nombre de résultats en meta et réél ne correspondent pas. "
+                                  "Chargement des informations statistiques échoué", False)
                 _statistiques.SviderEtats(False)
 
 
@@ -0,0 +1,159 @@
+"""@package docstring
+    Auteur : Beaufils Thibaud
+    V 1.0
+    PRD 20/03/2019
+
+    Module JournalSimulation
+
+    Module contenant la classe qui écrit, en tâche de fond, les points de contrôle d'une simulation en cours afin de
+    pouvoir la reprendre après une interruption : JournalSimulation
+
+"""
+
+import os
+import pickle
+import queue
+import threading
+
+from Utilitaires.Log import Log
+
+_log = Log()
+
+
+class JournalSimulation:
+    """
+        class JournalSimulation
+
+        Le journal est un fichier de pickles mis bout à bout : un en-tête, écrit à l'ouverture, puis un enregistrement
+        par point de contrôle. Chaque enregistrement ne contient que ce qui a changé depuis le précédent (cf
+        Simulateur.SlancerSimulation), il est ajouté en fin de fichier sans réécrire le reste.
+
+        La sérialisation et l'écriture des enregistrements sont faites par un thread dédié : la simulation ne fait que
+        les déposer dans une file et continue. Un enregistrement ne doit donc plus être modifié une fois déposé.
+        Si le programme s'arrête pendant une écriture, le dernier enregistrement est incomplet : il est ignoré à la
+        lecture (JSlire) et écrasé à la réouverture.
+
+        :var self.JS_chemin : String, le chemin du fichier du journal
+        :var self.JS_file : queue.Queue, les enregistrements en attente d'écriture, None pour arrêter l'écriture
+        :var self.JS_ecrivain : threading.Thread, le thread qui écrit les enregistrements, None une fois le journal
+            fermé
+        :var self.JS_erreur : OSError, la dernière erreur d'écriture, None si aucune
+    """
+
+    def __init__(self, _chemin, _entete=None, _taille=None):
+        """
+            Constructeur de la classe, ouvre le journal et démarre le thread d'écriture
+
+            :param _chemin: String, le chemin du fichier du journal
+            :param _entete: dict{String : Objet}, l'en-tête d'un nouveau journal, écrit immédiatement. None pour
+                poursuivre un journal existant
+            :param _taille: int, pour un journal poursuivi, la taille de sa partie valide (cf JSlire) : ce qui suit
+                est écrasé
+        """
+        _log.Linfo("Init -- JournalSimulation")
+
+        if _entete is None and (type(_taille) is not int or _taille < 0):
+            _log.Lerror("Valeur Argument errone _taille")
+            raise Exception("Valeur Argument errone _taille")
+
+        _dossier = os.path.dirname(_chemin)
+        if not os.path.exists(_dossier):
+            os.makedirs(_dossier)
+
+        self.JS_chemin = _chemin
+        if _entete is not None:
+            self.__JS_fichier = open(_chemin, 'wb')
+            pickle.dump(_entete, self.__JS_fichier, pickle.HIGHEST_PROTOCOL)
+            self.__JSsynchroniser()
+        else:
+            self.__JS_fichier = open(_chemin, 'r+b')
+            self.__JS_fichier.truncate(_taille)
+            self.__JS_fichier.seek(_taille)
+
+        self.JS_file = queue.Queue()
+        self.JS_erreur = None
+        self.JS_ecrivain = threading.Thread(target=self.__JSecrire, name="JournalSimulation", daemon=True)
+        self.JS_ecrivain.start()
+
+    def JSajouter(self, _enregistrement):
+        """
+            Dépose un enregistrement, il sera écrit en fin de journal par le thread d'écriture
+
+            :param _enregistrement: dict{String : Objet}, l'enregistrement, qui ne doit plus être modifié
+        """
+        if self.JS_ecrivain is not None:
+            self.JS_file.put(_enregistrement)
+
+    def JSfermer(self, _supprimer=False):
+        """
+            Attend l'écriture des enregistrements déposés puis ferme le journal. Sans effet si il est déjà fermé.
+
+            :param _supprimer: bool, vrai pour supprimer le fichier du journal une fois fermé
+        """
+        _log.Linfo("Début ## JournalSimulation.JSfermer")
+
+        if self.JS_ecrivain is not None:
+            self.JS_file.put(None)
+            self.JS_ecrivain.join()
+            self.JS_ecrivain = None
+            self.__JS_fichier.close()
+        if _supprimer and os.path.exists(self.JS_chemin):
+            os.unlink(self.JS_chemin)
+
+    @staticmethod
+    def JSlire(_chemin):
+        """
+            Lit un journal, en ignorant un éventuel dernier enregistrement incomplet
+
+            :param _chemin: String, le chemin du fichier du journal
+            :return: dict{String : Objet}, l'en-tête, None si il n'y a pas de journal lisible
+                     [dict{String : Objet}], les enregistrements, dans l'ordre d'écriture
+                     int, la taille de la partie valide du fichier
+        """
+        _log.Linfo("Début ## JournalSimulation.JSlire")
+
+        if not os.path.exists(_chemin):
+            return None, [], 0
+
+        _enregistrements = []
+        with open(_chemin, 'rb') as f:
+            try:
+                _entete = pickle.load(f)
+            except Exception as _erreur:
+                _log.Lerror("Journal illisible : " + str(_erreur))
+                return None, [], 0
+            _taille = f.tell()
+            while True:
+                try:
+                    _enregistrements.append(pickle.load(f))
+                except Exception:
+                    # Fin du fichier ou enregistrement tronqué par une interruption pendant son écriture
+                    break
+                _taille = f.tell()
+
+        return _entete, _enregistrements, _taille
+
+    def __JSecrire(self):
+        """
+            Boucle du thread d'écriture : écrit les enregistrements déposés jusqu'à la fermeture du journal
+        """
+        while True:
+            _enregistrement = self.JS_file.get()
+            if _enregistrement is None:
+                return
+            try:
+                # Sérialisé avant d'être écrit : un enregistrement qui ne peut pas l'être ne laisse rien dans le journal
+                _donnees = pickle.dumps(_enregistrement, pickle.HIGHEST_PROTOCOL)
+                self.__JS_fichier.write(_donnees)
+                self.__JSsynchroniser()
+            except (OSError, pickle.PicklingError) as _erreur:
+                # La simulation continue, seule la reprise est compromise
+                _log.Lerror("Erreur d'écriture du journal : " + str(_erreur))
+                self.JS_erreur = _erreur
+
+    def __JSsynchroniser(self):
+        """
+            Force l'écriture sur disque de ce qui a été écrit dans le journal
+        """
+        self.__JS_fichier.flush()
+        os.fsync(self.__JS_fichier.fileno())
@@ -17,6 +17,7 @@ from Modele.Parametres import ParametresCreation
 from Utilitaires.Log import Log
 from Vue import fenetrecreationdesign_ui
 from Modele.Signaux import Signaux
+from Moteur.Generateur import Generateur
 
 
 _log = Log()
@@ -68,7 +69,7 @@ class FenetreCreation(QtWidgets.QMainWindow, fenetrecreationdesign_ui.Ui_MainWin
     __FCD_NBR_CAPTEURS_MAX = None  # Définit dans l'init, dépend de la largeur
 
     __FCD_CAPACITE_BATTERIE_MIN = 1
-    __FCD_CAPACITE_BATTERIE_MAX = 1000
+    __FCD_CAPACITE_BATTERIE_MAX = Generateur.G_CAPACITE_BATTERIE_MAX
 
     __FCD_LARGEUR_MIN = 10
     __FCD_LARGEUR_MAX = 500